@@ -9,7 +9,7 @@ V2 adds background processing agents that consume from queues.
 
 from crabgrass.agents.idea_assistant import IdeaAssistantAgent, get_idea_assistant
 from crabgrass.agents.state import IdeaContext
-from crabgrass.agents.tools import save_idea, find_similar, propose_suggestion
+from crabgrass.agents.tools import save_idea, find_similar, find_similar_many, propose_suggestion
 from crabgrass.agents.objective_assistant import (
     ObjectiveAssistantAgent,
     get_objective_assistant,
@@ -41,6 +41,7 @@ __all__ = [
     "IdeaContext",
     "save_idea",
     "find_similar",
+    "find_similar_many",
     "propose_suggestion",
     # Human-facing agents - Objectives (V2)
     "ObjectiveAssistantAgent",
@@ -0,0 +1,291 @@
+"""State and helpers shared by the human-facing assistants.
+
+Both assistants store conversations in one ADK session service. Sessions
+are partitioned by each Runner's app_name.
+
+BaseAssistantAgent holds the session handling and ADK-to-AG-UI event
+translation; subclasses supply the LlmAgent and their tool result events.
+"""
+
+import asyncio
+import logging
+import os
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from typing import AsyncIterator, Callable, Generic, Iterator, TypeVar
+
+from google.adk.agents import LlmAgent
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+
+from crabgrass.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+SHARED_SESSION_SERVICE = InMemorySessionService()
+
+# Maximum ADK events read ahead of a slow SSE consumer
+EVENT_BUFFER_SIZE = 32
+
+T = TypeVar("T")
+
+_api_key_set = False
+
+_DONE = object()
+
+
+def _ensure_api_key() -> None:
+    """Set GOOGLE_API_KEY from settings if not already set (ADK reads from env).
+
+    Runs once per process, however many assistants are built.
+    """
+    global _api_key_set
+    if _api_key_set:
+        return
+
+    if not os.environ.get("GOOGLE_API_KEY"):
+        os.environ["GOOGLE_API_KEY"] = get_settings().google_api_key
+    _api_key_set = True
+
+
+class _Failure:
+    """Wraps an exception raised by the producer for re-raising in the consumer."""
+
+    def __init__(self, error: Exception):
+        self.error = error
+
+
+async def buffered(events: AsyncIterator[T], maxsize: int = EVENT_BUFFER_SIZE) -> AsyncIterator[T]:
+    """Iterate events from a background task through a bounded queue.
+
+    The model keeps streaming while the consumer is busy sending earlier
+    events, until maxsize events are waiting. Exceptions from the source
+    are re-raised in the consumer, and closing the consumer cancels the source.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+
+    async def produce() -> None:
+        try:
+            async for event in events:
+                await queue.put(event)
+        except Exception as e:
+            await queue.put(_Failure(e))
+        else:
+            await queue.put(_DONE)
+
+    task = asyncio.create_task(produce())
+    try:
+        while (item := await queue.get()) is not _DONE:
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+    finally:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+
+ContextT = TypeVar("ContextT")
+
+
+class BaseAssistantAgent(ABC, Generic[ContextT]):
+    """Base class for conversational assistants using Google ADK.
+
+    Uses Google ADK with Gemini for conversation and tool use.
+    Converts ADK events to AG-UI protocol events for frontend streaming.
+
+    Subclasses set app_name, context_state_key and context_class, and
+    implement _build_agent(). The context's to_context_string() is stored
+    in session state under context_state_key for the agent's instruction.
+
+    A subclass method named _handle_<tool name>(response, context) is called
+    for each dict result of that tool and yields any extra events.
+    """
+
+    app_name: str
+    context_state_key: str
+    context_class: type[ContextT]
+
+    def __init__(self):
+        _ensure_api_key()
+
+        # Create the ADK agent with tools
+        self.agent = self._build_agent()
+
+        # Session service for conversation state, shared across assistants
+        self.session_service = SHARED_SESSION_SERVICE
+        # Session IDs known to exist, so later turns skip the service lookup
+        self._known_sessions: set[str] = set()
+        self._session_lock = asyncio.Lock()
+        # Per-session tool call counters for event correlation IDs
+        self._tool_call_seq: defaultdict[str, int] = defaultdict(int)
+        # Tool name -> bound _handle_<tool name> method, built once
+        self._tool_result_handlers: dict[str, Callable[[dict, ContextT], Iterator[dict]]] = {
+            name.removeprefix("_handle_"): getattr(self, name)
+            for name in dir(self)
+            if name.startswith("_handle_")
+        }
+
+        # Create runner for execution
+        self.runner = Runner(
+            agent=self.agent,
+            app_name=self.app_name,
+            session_service=self.session_service,
+        )
+
+    @abstractmethod
+    def _build_agent(self) -> LlmAgent:
+        """Create the ADK agent."""
+        pass
+
+    async def run(
+        self,
+        user_message: str,
+        session_id: str,
+        context: ContextT | None = None,
+    ) -> AsyncIterator[dict]:
+        """Run the agent with streaming output.
+
+        Args:
+            user_message: The user's input message.
+            session_id: Session ID for conversation tracking.
+            context: Current context (optional).
+
+        Yields:
+            AG-UI protocol events as dictionaries.
+        """
+        if not context:
+            context = self.context_class()
+
+        # Ensure session exists in ADK session service
+        await self._ensure_session(session_id)
+
+        # Create the user message content
+        user_content = types.Content(
+            parts=[types.Part(text=user_message)],
+            role="user",
+        )
+
+        # Track current tool call for event correlation
+        current_tool_call_id: str | None = None
+
+        try:
+            # Read ADK events in a background task so a slow client
+            # does not stall generation
+            async for event in buffered(self.runner.run_async(
+                user_id=session_id,
+                session_id=session_id,
+                new_message=user_content,
+                # Per-session context read by the agent's instruction, so
+                # concurrent runs never share a mutated instruction
+                state_delta={self.context_state_key: context.to_context_string()},
+            )):
+                # Skip user events (we only care about agent responses)
+                if event.author == "user":
+                    continue
+
+                # Report Gemini prompt cache hits on the static system prompt
+                usage = event.usage_metadata
+                if usage and usage.cached_content_token_count:
+                    logger.debug(
+                        "%s: %d of %s prompt tokens served from cache",
+                        type(self).__name__,
+                        usage.cached_content_token_count,
+                        usage.prompt_token_count,
+                    )
+
+                # Walk the parts once, joining adjacent text parts into one delta
+                parts = event.content.parts if event.content and event.content.parts else ()
+                texts: list[str] = []
+                for part in parts:
+                    if text := getattr(part, "text", None):
+                        texts.append(text)
+                        continue
+
+                    fc = part.function_call
+                    fr = part.function_response
+                    # Flush pending text first so events keep part order
+                    if texts and (fc or fr):
+                        yield {
+                            "type": "text_delta",
+                            "text": "".join(texts),
+                        }
+                        texts = []
+
+                    # Handle function calls (tool invocations)
+                    if fc:
+                        current_tool_call_id = self._next_tool_call_id(session_id)
+                        yield {
+                            "type": "tool_call",
+                            "tool_call_id": current_tool_call_id,
+                            "tool_name": fc.name,
+                            "args": fc.args or {},
+                        }
+
+                    # Handle function responses (tool results)
+                    elif fr:
+                        yield {
+                            "type": "tool_result",
+                            "tool_call_id": current_tool_call_id or self._next_tool_call_id(session_id),
+                            "tool_name": fr.name,
+                            "result": fr.response,
+                        }
+                        handler = self._tool_result_handlers.get(fr.name)
+                        if handler and isinstance(fr.response, dict):
+                            for extra in handler(fr.response, context):
+                                yield extra
+
+                if texts:
+                    yield {
+                        "type": "text_delta",
+                        "text": "".join(texts),
+                    }
+
+        except Exception as e:
+            logger.error("%s execution error: %s", type(self).__name__, e, exc_info=True)
+            yield {
+                "type": "error",
+                "message": str(e),
+            }
+
+    async def warm_up(self) -> None:
+        """Open the model connection so the first user request skips setup.
+
+        Fetches the model's metadata through the agent's own client, which
+        costs no tokens and runs no tools.
+        """
+        try:
+            llm = self.agent.canonical_model
+            await llm.api_client.aio.models.get(model=llm.model)
+        except Exception as e:
+            logger.warning("%s warm-up failed: %s", type(self).__name__, e)
+
+    def _next_tool_call_id(self, session_id: str) -> str:
+        """Return a tool call ID unique within the session."""
+        self._tool_call_seq[session_id] += 1
+        return f"tc-{session_id}-{self._tool_call_seq[session_id]}"
+
+    async def _ensure_session(self, session_id: str) -> None:
+        """Create the ADK session on first use; later turns return immediately."""
+        if session_id in self._known_sessions:
+            return
+
+        async with self._session_lock:
+            if session_id in self._known_sessions:
+                return
+
+            existing_session = await self.session_service.get_session(
+                app_name=self.app_name,
+                user_id=session_id,
+                session_id=session_id,
+            )
+            if not existing_session:
+                await self.session_service.create_session(
+                    app_name=self.app_name,
+                    user_id=session_id,
+                    session_id=session_id,
+                )
+            self._known_sessions.add(session_id)
@@ -7,7 +7,13 @@ that trigger graph relationship creation and user notifications.
 Uses embedding-based nearest neighbor search to find similarities.
 """
 
+import asyncio
+import hashlib
 import logging
+import time
+from collections import OrderedDict
+
+import numpy as np
 
 from crabgrass.agents.runner import BackgroundAgent
 from crabgrass.concepts.queue import QueueName, QueueItem
@@ -15,7 +21,8 @@ from crabgrass.concepts.idea import IdeaActions
 from crabgrass.concepts.summary import SummaryActions
 from crabgrass.concepts.challenge import ChallengeActions
 from crabgrass.concepts.approach import ApproachActions
-from crabgrass.services.similarity import SimilarityService
+from crabgrass.services.similarity import SimilarIdea, SimilarityService
+from crabgrass.services.similarity_cache import CachedSimilarityService
 from crabgrass.syncs.signals import agent_found_similarity
 
 logger = logging.getLogger(__name__)
@@ -24,6 +31,39 @@ logger = logging.getLogger(__name__)
 SIMILARITY_THRESHOLD = 0.7
 # Maximum similar items to find
 MAX_SIMILAR = 5
+# Seconds to hold a search so concurrent items can share one batched query
+BATCH_HOLD_SECONDS = 0.01
+# Seconds during which an unchanged embedding is not searched again
+PROCESSED_TTL_SECONDS = 300.0
+# Maximum number of remembered (kind, id) embedding hashes
+MAX_PROCESSED = 10_000
+
+# Kernel elements searched directly, in payload priority order: (kind, payload key)
+KERNEL_KINDS = (
+    ("challenge", "challenge_id"),
+    ("approach", "approach_id"),
+    ("summary", "summary_id"),
+)
+
+# Single-query SimilarityService method for each searchable kind
+SINGLE_SEARCH_METHODS = {
+    "summary": "find_similar_summaries",
+    "challenge": "find_similar_challenges",
+    "approach": "find_similar_approaches",
+}
+
+# Concept actions that load each searchable kind
+KIND_ACTIONS = {
+    "challenge": ChallengeActions,
+    "approach": ApproachActions,
+    "summary": SummaryActions,
+}
+
+
+def _embedding_digest(embedding) -> bytes:
+    """Content hash of an embedding."""
+    vector = np.asarray(embedding, dtype=np.float32)
+    return hashlib.blake2b(vector.tobytes(), digest_size=16).digest()
 
 
 class ConnectionAgent(BackgroundAgent):
@@ -33,16 +73,23 @@ class ConnectionAgent(BackgroundAgent):
     Emits signals that create graph relationships and queue notifications.
     """
 
-    def __init__(self):
-        super().__init__(QueueName.CONNECTION)
-        self._similarity_service = None
+    def __init__(self, similarity_service: CachedSimilarityService | None = None):
+        """Initialize the agent.
 
-    @property
-    def similarity_service(self) -> SimilarityService:
-        """Lazy-load similarity service."""
-        if self._similarity_service is None:
-            self._similarity_service = SimilarityService()
-        return self._similarity_service
+        Args:
+            similarity_service: Optional shared similarity service. If not
+                provided, the agent creates its own.
+        """
+        super().__init__(QueueName.CONNECTION)
+        if similarity_service is None:
+            similarity_service = CachedSimilarityService(SimilarityService())
+        self.similarity_service = similarity_service
+        # Searches waiting to be flushed, keyed by kind
+        self._pending_searches: dict[str, list[tuple]] = {}
+        # Flushed searches running in worker threads
+        self._search_tasks: set[asyncio.Task] = set()
+        # (kind, id) -> (embedding hash, processed at) for recently searched content
+        self._processed: OrderedDict[tuple[str, str], tuple[bytes, float]] = OrderedDict()
 
     async def process_item(self, item: QueueItem) -> None:
         """Process a connection queue item.
@@ -52,179 +99,208 @@ class ConnectionAgent(BackgroundAgent):
                   challenge_id, or approach_id
         """
         payload = item.payload
-        logger.info(f"ConnectionAgent: Processing item {item.id}")
-        logger.debug(f"ConnectionAgent: Payload = {payload}")
+        logger.info("ConnectionAgent: Processing item %s", item.id)
+        logger.debug("ConnectionAgent: Payload = %s", payload)
 
         try:
-            if payload.get("challenge_id"):
-                await self._find_similar_challenges(
-                    payload["challenge_id"],
-                    payload.get("idea_id"),
-                )
-
-            elif payload.get("approach_id"):
-                await self._find_similar_approaches(
-                    payload["approach_id"],
-                    payload.get("idea_id"),
-                )
-
-            elif payload.get("summary_id"):
-                await self._find_similar_summaries(
-                    payload["summary_id"],
-                    payload.get("idea_id"),
-                )
-
-            elif payload.get("idea_id"):
-                # General idea connection - find related via summary
-                await self._find_related_ideas(payload["idea_id"])
+            for kind, key in KERNEL_KINDS:
+                if payload.get(key):
+                    await self._find_similar(kind, payload[key], payload.get("idea_id"))
+                    break
+            else:
+                if payload.get("idea_id"):
+                    # General idea connection - find related via summary
+                    await self._find_related_ideas(payload["idea_id"])
 
-            logger.info(f"ConnectionAgent: Completed item {item.id}")
+            logger.info("ConnectionAgent: Completed item %s", item.id)
 
         except Exception as e:
-            logger.error(f"ConnectionAgent: Error processing item {item.id}: {e}")
+            logger.error("ConnectionAgent: Error processing item %s: %s", item.id, e)
             raise
 
     # ─────────────────────────────────────────────────────────────────────────
     # Similarity Discovery Methods
     # ─────────────────────────────────────────────────────────────────────────
 
-    async def _find_similar_challenges(self, challenge_id: str, idea_id: str | None) -> None:
-        """Find challenges with similar content.
+    async def _find_similar(self, kind: str, element_id: str, idea_id: str | None) -> None:
+        """Find kernel elements of the same kind with similar content.
+
+        Args:
+            kind: "challenge", "approach" or "summary"
+            element_id: ID of the element that changed
+            idea_id: Owning idea, looked up from the element if not provided
 
         Emits: agent.found_similarity for each match above threshold
         """
-        challenge = ChallengeActions.get_by_id(challenge_id)
-        if not challenge or not challenge.embedding:
-            logger.debug(f"Challenge {challenge_id} has no embedding, skipping")
+        actions = KIND_ACTIONS[kind]
+
+        # Cheap check first so items with nothing to search skip loading the row
+        if not actions.exists_with_embedding(element_id):
+            logger.debug("%s %s has no embedding, skipping", kind.capitalize(), element_id)
+            return
+
+        element = actions.get_by_id(element_id)
+        if not element or element.embedding is None:
+            logger.debug("%s %s has no embedding, skipping", kind.capitalize(), element_id)
             return
 
-        # Get the idea_id if not provided
         if not idea_id:
-            idea_id = challenge.idea_id
+            idea_id = element.idea_id
 
-        similar = self.similarity_service.find_similar_challenges(
-            embedding=challenge.embedding,
-            limit=MAX_SIMILAR,
-            exclude_idea_id=idea_id,
-        )
+        digest = _embedding_digest(element.embedding)
+        if self._recently_processed(kind, element_id, digest):
+            logger.debug(
+                "%s %s is unchanged since last search, skipping", kind.capitalize(), element_id
+            )
+            return
 
-        for match in similar:
-            if match.similarity >= SIMILARITY_THRESHOLD:
-                logger.info(
-                    f"ConnectionAgent: Found similar challenge - "
-                    f"idea {idea_id} <-> {match.idea_id} (score: {match.similarity:.3f})"
-                )
-                agent_found_similarity.send(
-                    None,
-                    source_type="challenge",
-                    source_id=challenge_id,
-                    source_idea_id=idea_id,
-                    target_type="challenge",
-                    target_idea_id=match.idea_id,
-                    similarity_score=match.similarity,
-                )
+        similar = await self._search(kind, element.embedding, idea_id)
+        self._emit_similarities(kind, element_id, idea_id, similar)
+        self._mark_processed(kind, element_id, digest)
 
-    async def _find_similar_approaches(self, approach_id: str, idea_id: str | None) -> None:
-        """Find approaches with similar content.
+    async def _find_related_ideas(self, idea_id: str) -> None:
+        """Find ideas related via any kernel element (summary, challenge, approach).
 
-        Emits: agent.found_similarity for each match above threshold
+        Uses summary as the primary comparison since all ideas have one.
         """
-        approach = ApproachActions.get_by_id(approach_id)
-        if not approach or not approach.embedding:
-            logger.debug(f"Approach {approach_id} has no embedding, skipping")
+        idea = IdeaActions.get_by_id(idea_id)
+        if not idea:
+            logger.warning("Idea %s not found", idea_id)
             return
 
-        if not idea_id:
-            idea_id = approach.idea_id
+        # Get the summary for this idea
+        summary = SummaryActions.get_by_idea_id(idea_id)
+        if summary and summary.embedding is not None:
+            digest = _embedding_digest(summary.embedding)
+            if self._recently_processed("idea", idea_id, digest):
+                logger.debug("Idea %s is unchanged since last search, skipping", idea_id)
+                return
+
+            similar = await self._search("summary", summary.embedding, idea_id)
+            self._emit_similarities("idea", idea_id, idea_id, similar)
+            self._mark_processed("idea", idea_id, digest)
+
+    def _emit_similarities(
+        self,
+        source_type: str,
+        source_id: str,
+        idea_id: str,
+        similar: list[SimilarIdea],
+    ) -> None:
+        """Emit agent.found_similarity for each match.
+
+        Searches already apply SIMILARITY_THRESHOLD in SQL.
+        """
+        # Fields shared by every match; only the target varies
+        common = {
+            "source_type": source_type,
+            "source_id": source_id,
+            "source_idea_id": idea_id,
+            "target_type": source_type,
+        }
+        for match in similar:
+            logger.info(
+                "ConnectionAgent: Found similar %s - idea %s <-> %s (score: %.3f)",
+                source_type,
+                idea_id,
+                match.idea_id,
+                match.similarity,
+            )
+            agent_found_similarity.send(
+                None,
+                **common,
+                target_idea_id=match.idea_id,
+                similarity_score=match.similarity,
+            )
 
-        similar = self.similarity_service.find_similar_approaches(
-            embedding=approach.embedding,
-            limit=MAX_SIMILAR,
-            exclude_idea_id=idea_id,
-        )
+    # ─────────────────────────────────────────────────────────────────────────
+    # Unchanged Content Detection
+    # ─────────────────────────────────────────────────────────────────────────
 
-        for match in similar:
-            if match.similarity >= SIMILARITY_THRESHOLD:
-                logger.info(
-                    f"ConnectionAgent: Found similar approach - "
-                    f"idea {idea_id} <-> {match.idea_id} (score: {match.similarity:.3f})"
-                )
-                agent_found_similarity.send(
-                    None,
-                    source_type="approach",
-                    source_id=approach_id,
-                    source_idea_id=idea_id,
-                    target_type="approach",
-                    target_idea_id=match.idea_id,
-                    similarity_score=match.similarity,
-                )
+    def _recently_processed(self, kind: str, item_id: str, digest: bytes) -> bool:
+        """Check whether this exact embedding was searched within the TTL."""
+        entry = self._processed.get((kind, item_id))
+        if entry is None:
+            return False
 
-    async def _find_similar_summaries(self, summary_id: str, idea_id: str | None) -> None:
-        """Find summaries with similar content.
+        previous_digest, processed_at = entry
+        if time.monotonic() - processed_at >= PROCESSED_TTL_SECONDS:
+            del self._processed[(kind, item_id)]
+            return False
 
-        Emits: agent.found_similarity for each match above threshold
+        return previous_digest == digest
+
+    def _mark_processed(self, kind: str, item_id: str, digest: bytes) -> None:
+        """Remember a successful search for an embedding."""
+        self._processed[(kind, item_id)] = (digest, time.monotonic())
+        self._processed.move_to_end((kind, item_id))
+        while len(self._processed) > MAX_PROCESSED:
+            self._processed.popitem(last=False)
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Batched Search
+    # ─────────────────────────────────────────────────────────────────────────
+
+    async def _search(self, kind: str, embedding, exclude_idea_id: str | None) -> list[SimilarIdea]:
+        """Queue a similarity search and wait for its results.
+
+        Searches of the same kind issued within BATCH_HOLD_SECONDS of each
+        other (e.g. by items processed concurrently in one batch) are sent
+        to the database as a single batched query.
         """
-        summary = SummaryActions.get_by_id(summary_id)
-        if not summary or not summary.embedding:
-            logger.debug(f"Summary {summary_id} has no embedding, skipping")
-            return
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
 
-        if not idea_id:
-            idea_id = summary.idea_id
+        pending = self._pending_searches.setdefault(kind, [])
+        pending.append((embedding, exclude_idea_id, future))
+        if len(pending) == 1:
+            loop.call_later(BATCH_HOLD_SECONDS, self._flush_searches, kind)
 
-        similar = self.similarity_service.find_similar_summaries(
-            embedding=summary.embedding,
-            limit=MAX_SIMILAR,
-            exclude_idea_id=idea_id,
-        )
+        return await future
 
-        for match in similar:
-            if match.similarity >= SIMILARITY_THRESHOLD:
-                logger.info(
-                    f"ConnectionAgent: Found similar summary - "
-                    f"idea {idea_id} <-> {match.idea_id} (score: {match.similarity:.3f})"
-                )
-                agent_found_similarity.send(
-                    None,
-                    source_type="summary",
-                    source_id=summary_id,
-                    source_idea_id=idea_id,
-                    target_type="summary",
-                    target_idea_id=match.idea_id,
-                    similarity_score=match.similarity,
-                )
+    def _flush_searches(self, kind: str) -> None:
+        """Start a task that runs all pending searches of one kind."""
+        pending = self._pending_searches.pop(kind, [])
+        if not pending:
+            return
 
-    async def _find_related_ideas(self, idea_id: str) -> None:
-        """Find ideas related via any kernel element (summary, challenge, approach).
+        task = asyncio.get_running_loop().create_task(self._run_searches(kind, pending))
+        self._search_tasks.add(task)
+        task.add_done_callback(self._search_tasks.discard)
 
-        Uses summary as the primary comparison since all ideas have one.
-        """
-        idea = IdeaActions.get_by_id(idea_id)
-        if not idea:
-            logger.warning(f"Idea {idea_id} not found")
+    async def _run_searches(self, kind: str, pending: list[tuple]) -> None:
+        """Run flushed searches off the event loop and resolve their futures."""
+        try:
+            results = await asyncio.to_thread(self._query_searches, kind, pending)
+        except Exception as e:
+            for _, _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
             return
 
-        # Get the summary for this idea
-        summary = SummaryActions.get_by_idea_id(idea_id)
-        if summary and summary.embedding:
-            similar = self.similarity_service.find_similar_summaries(
-                embedding=summary.embedding,
-                limit=MAX_SIMILAR,
-                exclude_idea_id=idea_id,
-            )
+        for (_, _, future), result in zip(pending, results):
+            if not future.done():
+                future.set_result(result)
+
+    def _query_searches(self, kind: str, pending: list[tuple]) -> list[list[SimilarIdea]]:
+        """Query the database for pending searches, batching when there are several."""
+        if len(pending) == 1:
+            embedding, exclude_idea_id, _ = pending[0]
+            search = getattr(self.similarity_service, SINGLE_SEARCH_METHODS[kind])
+            return [
+                search(
+                    embedding=embedding,
+                    limit=MAX_SIMILAR,
+                    exclude_idea_id=exclude_idea_id,
+                    min_similarity=SIMILARITY_THRESHOLD,
+                )
+            ]
 
-            for match in similar:
-                if match.similarity >= SIMILARITY_THRESHOLD:
-                    logger.info(
-                        f"ConnectionAgent: Found related idea - "
-                        f"{idea_id} <-> {match.idea_id} (score: {match.similarity:.3f})"
-                    )
-                    agent_found_similarity.send(
-                        None,
-                        source_type="idea",
-                        source_id=idea_id,
-                        source_idea_id=idea_id,
-                        target_type="idea",
-                        target_idea_id=match.idea_id,
-                        similarity_score=match.similarity,
-                    )
+        logger.debug("ConnectionAgent: Batching %d %s searches", len(pending), kind)
+        return self.similarity_service.find_similar_batch(
+            kind,
+            [embedding for embedding, _, _ in pending],
+            limit=MAX_SIMILAR,
+            exclude_idea_ids=[exclude_idea_id for _, exclude_idea_id, _ in pending],
+            min_similarity=SIMILARITY_THRESHOLD,
+        )
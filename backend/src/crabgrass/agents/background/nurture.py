@@ -13,11 +13,8 @@ from crabgrass.agents.runner import BackgroundAgent
 from crabgrass.concepts.queue import QueueName, QueueItem, QueueActions
 from crabgrass.concepts.idea import IdeaActions
 from crabgrass.concepts.summary import SummaryActions
-from crabgrass.concepts.challenge import ChallengeActions
-from crabgrass.concepts.approach import ApproachActions
-from crabgrass.concepts.objective import ObjectiveActions
 from crabgrass.services.similarity import SimilarityService
-from crabgrass.services.embedding import get_embedding_service
+from crabgrass.services.similarity_cache import CachedSimilarityService
 
 logger = logging.getLogger(__name__)
 
@@ -36,24 +33,17 @@ class NurtureAgent(BackgroundAgent):
     Queues nudges encouraging users to evolve their Ideas.
     """
 
-    def __init__(self):
+    def __init__(self, similarity_service: CachedSimilarityService | None = None):
+        """Initialize the agent.
+
+        Args:
+            similarity_service: Optional shared similarity service. If not
+                provided, the agent creates its own.
+        """
         super().__init__(QueueName.NURTURE)
-        self._similarity_service = None
-        self._embedding_service = None
-
-    @property
-    def similarity_service(self) -> SimilarityService:
-        """Lazy-load similarity service."""
-        if self._similarity_service is None:
-            self._similarity_service = SimilarityService()
-        return self._similarity_service
-
-    @property
-    def embedding_service(self):
-        """Lazy-load embedding service."""
-        if self._embedding_service is None:
-            self._embedding_service = get_embedding_service()
-        return self._embedding_service
+        if similarity_service is None:
+            similarity_service = CachedSimilarityService(SimilarityService())
+        self.similarity_service = similarity_service
 
     async def process_item(self, item: QueueItem) -> None:
         """Process a nurture queue item.
@@ -62,31 +52,31 @@ class NurtureAgent(BackgroundAgent):
             item: Queue item with payload containing idea_id and/or summary_id
         """
         payload = item.payload
-        logger.info(f"NurtureAgent: Processing item {item.id}")
-        logger.debug(f"NurtureAgent: Payload = {payload}")
+        logger.info("NurtureAgent: Processing item %s", item.id)
+        logger.debug("NurtureAgent: Payload = %s", payload)
 
         idea_id = payload.get("idea_id")
         reason = payload.get("reason", "analysis")
 
         if not idea_id:
-            logger.warning(f"NurtureAgent: No idea_id in payload, skipping")
+            logger.warning("NurtureAgent: No idea_id in payload, skipping")
             return
 
         try:
             # Check if idea still needs nurturing (no challenge or approach yet)
             if not self._needs_nurturing(idea_id):
-                logger.info(f"NurtureAgent: Idea {idea_id} has structure, skipping nurture")
+                logger.info("NurtureAgent: Idea %s has structure, skipping nurture", idea_id)
                 return
 
             # Get the idea and its summary
             idea = IdeaActions.get_by_id(idea_id)
             if not idea:
-                logger.warning(f"NurtureAgent: Idea {idea_id} not found")
+                logger.warning("NurtureAgent: Idea %s not found", idea_id)
                 return
 
             summary = SummaryActions.get_by_idea_id(idea_id)
             if not summary:
-                logger.warning(f"NurtureAgent: Idea {idea_id} has no summary")
+                logger.warning("NurtureAgent: Idea %s has no summary", idea_id)
                 return
 
             # Find similar nascent ideas (for community connection)
@@ -103,10 +93,10 @@ class NurtureAgent(BackgroundAgent):
                     relevant_objectives=relevant_objectives,
                 )
 
-            logger.info(f"NurtureAgent: Completed item {item.id}")
+            logger.info("NurtureAgent: Completed item %s", item.id)
 
         except Exception as e:
-            logger.error(f"NurtureAgent: Error processing item {item.id}: {e}")
+            logger.error("NurtureAgent: Error processing item %s: %s", item.id, e)
             raise
 
     def _needs_nurturing(self, idea_id: str) -> bool:
@@ -114,11 +104,7 @@ class NurtureAgent(BackgroundAgent):
 
         Returns True if idea should be nurtured.
         """
-        challenge = ChallengeActions.get_by_idea_id(idea_id)
-        approach = ApproachActions.get_by_idea_id(idea_id)
-
-        # Idea needs nurturing if it lacks both challenge and approach
-        return challenge is None and approach is None
+        return IdeaActions.nascent_status_bulk([idea_id]).get(idea_id, False)
 
     async def _find_similar_nascent_ideas(
         self,
@@ -129,24 +115,26 @@ class NurtureAgent(BackgroundAgent):
 
         Returns list of similar ideas for potential collaboration.
         """
-        if not summary.embedding:
-            logger.debug(f"Summary for idea {idea_id} has no embedding")
+        if summary.embedding is None:
+            logger.debug("Summary for idea %s has no embedding", idea_id)
             return []
 
         similar = self.similarity_service.find_similar_summaries(
             embedding=summary.embedding,
-            limit=MAX_SIMILAR_IDEAS + 5,  # Get extra to filter
+            limit=MAX_SIMILAR_IDEAS + 5,  # Get extra to filter by nascency
             exclude_idea_id=idea_id,
+            min_similarity=IDEA_SIMILARITY_THRESHOLD,
         )
 
-        # Filter to only nascent ideas above threshold
+        if not similar:
+            return []
+
+        # Check all candidates for nascency in one query
+        nascent = IdeaActions.nascent_status_bulk([m.idea_id for m in similar])
+
         results = []
         for match in similar:
-            if match.similarity < IDEA_SIMILARITY_THRESHOLD:
-                continue
-
-            # Check if the matched idea is also nascent
-            if self._needs_nurturing(match.idea_id):
+            if nascent.get(match.idea_id):
                 results.append({
                     "idea_id": match.idea_id,
                     "title": match.title,
@@ -158,7 +146,7 @@ class NurtureAgent(BackgroundAgent):
 
         if results:
             logger.info(
-                f"NurtureAgent: Found {len(results)} similar nascent ideas for {idea_id}"
+                "NurtureAgent: Found %d similar nascent ideas for %s", len(results), idea_id
             )
 
         return results
@@ -167,63 +155,32 @@ class NurtureAgent(BackgroundAgent):
         """Find objectives that might be relevant to this idea.
 
         Uses embedding similarity between summary and objective descriptions.
+        Ranking and thresholding run inside the database.
         """
-        if not summary.embedding:
+        if summary.embedding is None:
             return []
 
-        # Get active objectives with embeddings
-        objectives = ObjectiveActions.list_active()
-
-        results = []
-        for objective in objectives:
-            if not objective.embedding:
-                continue
-
-            # Calculate similarity
-            try:
-                # Use cosine similarity via the embedding service
-                similarity = self._calculate_similarity(
-                    summary.embedding,
-                    objective.embedding,
-                )
-
-                if similarity >= OBJECTIVE_SIMILARITY_THRESHOLD:
-                    results.append({
-                        "objective_id": objective.id,
-                        "title": objective.title,
-                        "similarity": similarity,
-                    })
-            except Exception as e:
-                logger.debug(f"Error calculating similarity for objective {objective.id}: {e}")
-                continue
+        # Let the vector index rank and threshold active objectives
+        similar = self.similarity_service.find_similar_objectives(
+            embedding=summary.embedding,
+            limit=MAX_SIMILAR_OBJECTIVES,
+            min_similarity=OBJECTIVE_SIMILARITY_THRESHOLD,
+        )
 
-        # Sort by similarity and limit
-        results.sort(key=lambda x: x["similarity"], reverse=True)
-        results = results[:MAX_SIMILAR_OBJECTIVES]
+        results = [
+            {
+                "objective_id": match.objective_id,
+                "title": match.title,
+                "similarity": match.similarity,
+            }
+            for match in similar
+        ]
 
         if results:
-            logger.info(
-                f"NurtureAgent: Found {len(results)} relevant objectives for idea"
-            )
+            logger.info("NurtureAgent: Found %d relevant objectives for idea", len(results))
 
         return results
 
-    def _calculate_similarity(self, embedding1: list[float], embedding2: list[float]) -> float:
-        """Calculate cosine similarity between two embeddings."""
-        import math
-
-        # Dot product
-        dot_product = sum(a * b for a, b in zip(embedding1, embedding2))
-
-        # Magnitudes
-        mag1 = math.sqrt(sum(a * a for a in embedding1))
-        mag2 = math.sqrt(sum(b * b for b in embedding2))
-
-        if mag1 == 0 or mag2 == 0:
-            return 0.0
-
-        return dot_product / (mag1 * mag2)
-
     async def _queue_nurture_notification(
         self,
         idea,
@@ -262,4 +219,4 @@ class NurtureAgent(BackgroundAgent):
             },
         )
 
-        logger.info(f"NurtureAgent: Queued nurture notification for idea {idea.id}")
+        logger.info("NurtureAgent: Queued nurture notification for idea %s", idea.id)
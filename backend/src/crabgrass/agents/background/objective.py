@@ -7,7 +7,11 @@ suggests reconnections to other active objectives using embedding similarity.
 Queues notifications for the SurfacingAgent to deliver.
 """
 
+import asyncio
 import logging
+import time
+
+import numpy as np
 
 from crabgrass.agents.runner import BackgroundAgent
 from crabgrass.concepts.queue import QueueName, QueueItem, QueueActions
@@ -23,6 +27,21 @@ logger = logging.getLogger(__name__)
 RECONNECTION_THRESHOLD = 0.5
 # Maximum objectives to suggest
 MAX_SUGGESTIONS = 3
+# Seconds before the active objective matrix is reloaded even without a
+# version change, bounding staleness from writes made outside ObjectiveActions
+OBJECTIVE_MATRIX_TTL_SECONDS = 60.0
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Return indices of the k highest scores, highest first.
+
+    Uses a linear-time partition and only sorts the selected k.
+    """
+    if len(scores) > k:
+        indices = np.argpartition(-scores, k)[:k]
+    else:
+        indices = np.arange(len(scores))
+    return indices[np.argsort(-scores[indices], kind="stable")]
 
 
 class ObjectiveAgent(BackgroundAgent):
@@ -34,6 +53,12 @@ class ObjectiveAgent(BackgroundAgent):
 
     def __init__(self):
         super().__init__(QueueName.OBJECTIVE_REVIEW)
+        # (objective version, loaded at, ids, titles, embedding matrix) of active objectives
+        self._objective_matrix: tuple[int, float, list[str], list[str], np.ndarray | None] | None = None
+
+    def coalesce_key(self, item: QueueItem) -> str | None:
+        """Review each idea once per batch, however many of its objectives retired."""
+        return item.payload.get("idea_id")
 
     async def process_item(self, item: QueueItem) -> None:
         """Process an objective review queue item.
@@ -42,37 +67,27 @@ class ObjectiveAgent(BackgroundAgent):
             item: Queue item with payload containing idea_id and retired_objective_id
         """
         payload = item.payload
-        logger.info(f"ObjectiveAgent: Processing item {item.id}")
-        logger.debug(f"ObjectiveAgent: Payload = {payload}")
+        logger.info("ObjectiveAgent: Processing item %s", item.id)
+        logger.debug("ObjectiveAgent: Payload = %s", payload)
 
         idea_id = payload.get("idea_id")
         retired_objective_id = payload.get("retired_objective_id")
 
         if not idea_id:
-            logger.warning(f"ObjectiveAgent: No idea_id in payload, skipping")
+            logger.warning("ObjectiveAgent: No idea_id in payload, skipping")
             return
 
         try:
             # Get the idea
             idea = IdeaActions.get_by_id(idea_id)
             if not idea:
-                logger.warning(f"ObjectiveAgent: Idea {idea_id} not found")
+                logger.warning("ObjectiveAgent: Idea %s not found", idea_id)
                 return
 
-            # Check if idea still has other objective links
-            remaining_links = IdeaObjectiveActions.get_objective_ids_for_idea(idea_id)
-            # Filter to only active objectives
-            active_links = []
-            for obj_id in remaining_links:
-                obj = ObjectiveActions.get_by_id(obj_id)
-                if obj and obj.status == "Active":
-                    active_links.append(obj_id)
-
-            if active_links:
+            # Check if idea still has other active objective links
+            if IdeaObjectiveActions.has_active_link(idea_id):
                 # Idea still has active objective links, no action needed
-                logger.info(
-                    f"ObjectiveAgent: Idea {idea_id} still has {len(active_links)} active objective links"
-                )
+                logger.info("ObjectiveAgent: Idea %s still has active objective links", idea_id)
                 return
 
             # Idea is orphaned - find potential reconnections
@@ -92,10 +107,10 @@ class ObjectiveAgent(BackgroundAgent):
                     retired_objective_id=retired_objective_id,
                 )
 
-            logger.info(f"ObjectiveAgent: Completed item {item.id}")
+            logger.info("ObjectiveAgent: Completed item %s", item.id)
 
         except Exception as e:
-            logger.error(f"ObjectiveAgent: Error processing item {item.id}: {e}")
+            logger.error("ObjectiveAgent: Error processing item %s: %s", item.id, e)
             raise
 
     async def _find_reconnection_suggestions(self, idea_id: str) -> list[dict]:
@@ -105,57 +120,75 @@ class ObjectiveAgent(BackgroundAgent):
         """
         # Get the idea's summary embedding
         summary = SummaryActions.get_by_idea_id(idea_id)
-        if not summary or not summary.embedding:
-            logger.debug(f"ObjectiveAgent: Idea {idea_id} has no summary embedding")
+        if not summary or summary.embedding is None:
+            logger.debug("ObjectiveAgent: Idea %s has no summary embedding", idea_id)
             return []
 
         # Get active objectives with embeddings
-        objectives = ObjectiveActions.list_active()
-
-        results = []
-        for objective in objectives:
-            if not objective.embedding:
-                continue
-
-            # Calculate similarity
-            similarity = self._calculate_similarity(
-                summary.embedding,
-                objective.embedding,
-            )
-
-            if similarity >= RECONNECTION_THRESHOLD:
-                results.append({
-                    "objective_id": objective.id,
-                    "title": objective.title,
-                    "similarity": similarity,
-                })
+        ids, titles, matrix = self._active_objective_matrix()
+        if matrix is None:
+            return []
 
-        # Sort by similarity and limit
-        results.sort(key=lambda x: x["similarity"], reverse=True)
-        results = results[:MAX_SUGGESTIONS]
+        # Score every objective in one matrix-vector product
+        similarities = self._calculate_similarities(matrix, summary.embedding)
+
+        # Select the best matches without sorting every candidate
+        candidates = np.flatnonzero(similarities >= RECONNECTION_THRESHOLD)
+        top = candidates[_top_k(similarities[candidates], MAX_SUGGESTIONS)]
+        results = [
+            {
+                "objective_id": ids[i],
+                "title": titles[i],
+                "similarity": float(similarities[i]),
+            }
+            for i in top
+        ]
 
         if results:
             logger.info(
-                f"ObjectiveAgent: Found {len(results)} reconnection suggestions for idea {idea_id}"
+                "ObjectiveAgent: Found %d reconnection suggestions for idea %s",
+                len(results),
+                idea_id,
             )
 
         return results
 
-    def _calculate_similarity(self, embedding1: list[float], embedding2: list[float]) -> float:
-        """Calculate cosine similarity between two embeddings."""
-        import math
+    def _active_objective_matrix(self) -> tuple[list[str], list[str], np.ndarray | None]:
+        """Return ids, titles and stacked embeddings of active objectives.
 
-        # Dot product
-        dot_product = sum(a * b for a, b in zip(embedding1, embedding2))
+        Rebuilt when ObjectiveActions.version() shows an objective was written,
+        or once OBJECTIVE_MATRIX_TTL_SECONDS have passed since the last load.
+        The matrix is None when no active objective has an embedding.
+        """
+        version = ObjectiveActions.version()
+        now = time.monotonic()
+        if (
+            self._objective_matrix is None
+            or self._objective_matrix[0] != version
+            or now - self._objective_matrix[1] >= OBJECTIVE_MATRIX_TTL_SECONDS
+        ):
+            objectives = ObjectiveActions.list_active_with_embedding()
+            matrix = None
+            if objectives:
+                matrix = np.stack([embedding for _, _, embedding in objectives]).astype(np.float32, copy=False)
+            self._objective_matrix = (
+                version,
+                now,
+                [objective_id for objective_id, _, _ in objectives],
+                [title for _, title, _ in objectives],
+                matrix,
+            )
+            logger.debug("ObjectiveAgent: Loaded %d active objective embeddings", len(objectives))
 
-        # Magnitudes
-        mag1 = math.sqrt(sum(a * a for a in embedding1))
-        mag2 = math.sqrt(sum(b * b for b in embedding2))
+        _, _, ids, titles, matrix = self._objective_matrix
+        return ids, titles, matrix
 
-        if mag1 == 0 or mag2 == 0:
-            return 0.0
+    def _calculate_similarities(self, matrix: np.ndarray, embedding: np.ndarray) -> np.ndarray:
+        """Calculate cosine similarity between each matrix row and an embedding.
 
-        return dot_product / (mag1 * mag2)
+        Stored embeddings are unit length, so the dot product is the cosine.
+        """
+        return matrix @ np.asarray(embedding, dtype=np.float32)
 
     async def _queue_reconnection_suggestions(
         self,
@@ -164,9 +197,11 @@ class ObjectiveAgent(BackgroundAgent):
         suggestions: list[dict],
     ) -> None:
         """Queue reconnection suggestions for the SurfacingAgent."""
-        # Emit signal for the top suggestion (triggers sync handlers)
+        # Emit signal for the top suggestion (triggers sync handlers).
+        # Receivers write to the database, so run them off the event loop.
         top = suggestions[0]
-        agent_suggest_reconnection.send(
+        await asyncio.to_thread(
+            agent_suggest_reconnection.send,
             None,
             idea_id=idea.id,
             suggested_objective_id=top["objective_id"],
@@ -175,8 +210,10 @@ class ObjectiveAgent(BackgroundAgent):
         )
 
         logger.info(
-            f"ObjectiveAgent: Suggested reconnecting idea {idea.id} "
-            f"to objective {top['objective_id']} (score: {top['similarity']:.3f})"
+            "ObjectiveAgent: Suggested reconnecting idea %s to objective %s (score: %.3f)",
+            idea.id,
+            top["objective_id"],
+            top["similarity"],
         )
 
     async def _queue_orphan_alert(
@@ -186,10 +223,11 @@ class ObjectiveAgent(BackgroundAgent):
     ) -> None:
         """Queue orphan alert when no reconnection suggestions found."""
         # Emit signal (triggers sync handlers to queue surfacing notification)
-        agent_flag_orphan.send(
+        await asyncio.to_thread(
+            agent_flag_orphan.send,
             None,
             idea_id=idea.id,
             retired_objective_id=retired_objective_id,
         )
 
-        logger.info(f"ObjectiveAgent: Flagged idea {idea.id} as orphan")
+        logger.info("ObjectiveAgent: Flagged idea %s as orphan", idea.id)
@@ -4,14 +4,15 @@ This agent processes the SURFACING queue and creates notifications
 for relevant users based on various events (similar found, idea linked,
 nurture nudges, etc.).
 
-Uses template-based messages for notifications.
+Uses template-based messages for notifications. Fan-out notifications
+store a NotificationTemplate key and its parameters, shared by every row.
 """
 
 import logging
 
 from crabgrass.agents.runner import BackgroundAgent
 from crabgrass.concepts.queue import QueueName, QueueItem
-from crabgrass.concepts.notification import NotificationActions, NotificationType
+from crabgrass.concepts.notification import NotificationActions, NotificationTemplate, NotificationType
 from crabgrass.concepts.idea import IdeaActions
 from crabgrass.concepts.objective import ObjectiveActions
 from crabgrass.concepts.watch import WatchActions
@@ -28,6 +29,12 @@ class SurfacingAgent(BackgroundAgent):
 
     def __init__(self):
         super().__init__(QueueName.SURFACING)
+        # Event type -> bound _handle_<type> method, built once
+        self._handlers = {
+            name.removeprefix("_handle_"): getattr(self, name)
+            for name in dir(self)
+            if name.startswith("_handle_")
+        }
 
     async def process_item(self, item: QueueItem) -> None:
         """Process a surfacing queue item.
@@ -36,28 +43,27 @@ class SurfacingAgent(BackgroundAgent):
             item: Queue item with payload containing type and event details
         """
         payload = item.payload
-        logger.info(f"SurfacingAgent: Processing item {item.id}")
-        logger.debug(f"SurfacingAgent: Payload = {payload}")
+        logger.info("SurfacingAgent: Processing item %s", item.id)
+        logger.debug("SurfacingAgent: Payload = %s", payload)
 
         event_type = payload.get("type")
         if not event_type:
-            logger.warning(f"SurfacingAgent: No type in payload, skipping")
+            logger.warning("SurfacingAgent: No type in payload, skipping")
             return
 
         try:
             # Dispatch to type-specific handler
-            handler_name = f"_handle_{event_type}"
-            handler = getattr(self, handler_name, None)
+            handler = self._handlers.get(event_type)
 
             if handler:
                 await handler(payload)
             else:
-                logger.warning(f"SurfacingAgent: Unknown event type '{event_type}'")
+                logger.warning("SurfacingAgent: Unknown event type '%s'", event_type)
 
-            logger.info(f"SurfacingAgent: Completed item {item.id}")
+            logger.info("SurfacingAgent: Completed item %s", item.id)
 
         except Exception as e:
-            logger.error(f"SurfacingAgent: Error processing item {item.id}: {e}")
+            logger.error("SurfacingAgent: Error processing item %s: %s", item.id, e)
             raise
 
     # ─────────────────────────────────────────────────────────────────────────
@@ -88,18 +94,22 @@ class SurfacingAgent(BackgroundAgent):
         author_id = idea.author_id
         watchers = [w for w in watchers if w != author_id]
 
-        for user_id in watchers:
-            NotificationActions.create(
-                user_id=user_id,
-                type=NotificationType.IDEA_LINKED,
-                message=f"A new idea '{idea.title}' has been linked to '{objective.title}'",
-                source_type="objective",
-                source_id=objective_id,
-                related_id=idea_id,
-            )
+        params = {"idea_title": idea.title, "objective_title": objective.title}
+        NotificationActions.bulk_create([
+            {
+                "user_id": user_id,
+                "type": NotificationType.IDEA_LINKED,
+                "template_key": NotificationTemplate.IDEA_LINKED,
+                "template_params": params,
+                "source_type": "objective",
+                "source_id": objective_id,
+                "related_id": idea_id,
+            }
+            for user_id in watchers
+        ])
 
         if watchers:
-            logger.info(f"SurfacingAgent: Notified {len(watchers)} watchers of idea link")
+            logger.info("SurfacingAgent: Notified %d watchers of idea link", len(watchers))
 
     async def _handle_similar_found(self, payload: dict) -> None:
         """Notify users when similar content found.
@@ -131,7 +141,7 @@ class SurfacingAgent(BackgroundAgent):
             related_id=target_idea_id,
         )
 
-        logger.info(f"SurfacingAgent: Notified {source_idea.author_id} of similar idea")
+        logger.info("SurfacingAgent: Notified %s of similar idea", source_idea.author_id)
 
     async def _handle_nurture_nudge(self, payload: dict) -> None:
         """Create nurture notification for idea author.
@@ -153,7 +163,7 @@ class SurfacingAgent(BackgroundAgent):
             source_id=idea_id,
         )
 
-        logger.info(f"SurfacingAgent: Created nurture nudge for idea {idea_id}")
+        logger.info("SurfacingAgent: Created nurture nudge for idea %s", idea_id)
 
     async def _handle_objective_created(self, payload: dict) -> None:
         """Notify parent objective watchers of new sub-objective.
@@ -178,18 +188,22 @@ class SurfacingAgent(BackgroundAgent):
         # Don't notify the creator
         watchers = [w for w in watchers if w != objective.author_id]
 
-        for user_id in watchers:
-            NotificationActions.create(
-                user_id=user_id,
-                type=NotificationType.CONTRIBUTION,
-                message=f"New sub-objective '{objective.title}' created under '{parent.title}'",
-                source_type="objective",
-                source_id=parent_id,
-                related_id=objective_id,
-            )
+        params = {"objective_title": objective.title, "parent_title": parent.title}
+        NotificationActions.bulk_create([
+            {
+                "user_id": user_id,
+                "type": NotificationType.CONTRIBUTION,
+                "template_key": NotificationTemplate.SUB_OBJECTIVE_CREATED,
+                "template_params": params,
+                "source_type": "objective",
+                "source_id": parent_id,
+                "related_id": objective_id,
+            }
+            for user_id in watchers
+        ])
 
         if watchers:
-            logger.info(f"SurfacingAgent: Notified {len(watchers)} watchers of new sub-objective")
+            logger.info("SurfacingAgent: Notified %d watchers of new sub-objective", len(watchers))
 
     async def _handle_objective_updated(self, payload: dict) -> None:
         """Notify watchers when objective is updated.
@@ -211,17 +225,21 @@ class SurfacingAgent(BackgroundAgent):
         # Don't notify the updater (assume it's the author for now)
         watchers = [w for w in watchers if w != objective.author_id]
 
-        for user_id in watchers:
-            NotificationActions.create(
-                user_id=user_id,
-                type=NotificationType.CONTRIBUTION,
-                message=f"Objective '{objective.title}' has been updated",
-                source_type="objective",
-                source_id=objective_id,
-            )
+        params = {"objective_title": objective.title}
+        NotificationActions.bulk_create([
+            {
+                "user_id": user_id,
+                "type": NotificationType.CONTRIBUTION,
+                "template_key": NotificationTemplate.OBJECTIVE_UPDATED,
+                "template_params": params,
+                "source_type": "objective",
+                "source_id": objective_id,
+            }
+            for user_id in watchers
+        ])
 
         if watchers:
-            logger.info(f"SurfacingAgent: Notified {len(watchers)} watchers of objective update")
+            logger.info("SurfacingAgent: Notified %d watchers of objective update", len(watchers))
 
     async def _handle_objective_retired(self, payload: dict) -> None:
         """Notify watchers when objective retired.
@@ -240,17 +258,21 @@ class SurfacingAgent(BackgroundAgent):
         # Get watchers
         watchers = WatchActions.get_objective_watchers(objective_id)
 
-        for user_id in watchers:
-            NotificationActions.create(
-                user_id=user_id,
-                type=NotificationType.OBJECTIVE_RETIRED,
-                message=f"Objective '{objective.title}' has been retired",
-                source_type="objective",
-                source_id=objective_id,
-            )
+        params = {"objective_title": objective.title}
+        NotificationActions.bulk_create([
+            {
+                "user_id": user_id,
+                "type": NotificationType.OBJECTIVE_RETIRED,
+                "template_key": NotificationTemplate.OBJECTIVE_RETIRED,
+                "template_params": params,
+                "source_type": "objective",
+                "source_id": objective_id,
+            }
+            for user_id in watchers
+        ])
 
         if watchers:
-            logger.info(f"SurfacingAgent: Notified {len(watchers)} watchers of objective retirement")
+            logger.info("SurfacingAgent: Notified %d watchers of objective retirement", len(watchers))
 
     async def _handle_orphan_alert(self, payload: dict) -> None:
         """Alert contributors when idea loses objective link.
@@ -276,7 +298,7 @@ class SurfacingAgent(BackgroundAgent):
             related_id=retired_objective_id,
         )
 
-        logger.info(f"SurfacingAgent: Created orphan alert for idea {idea_id}")
+        logger.info("SurfacingAgent: Created orphan alert for idea %s", idea_id)
 
     async def _handle_reconnection_suggestion(self, payload: dict) -> None:
         """Suggest reconnecting orphaned idea to new objective.
@@ -306,7 +328,7 @@ class SurfacingAgent(BackgroundAgent):
             related_id=suggested_objective_id,
         )
 
-        logger.info(f"SurfacingAgent: Created reconnection suggestion for idea {idea_id}")
+        logger.info("SurfacingAgent: Created reconnection suggestion for idea %s", idea_id)
 
     async def _handle_user_interest(self, payload: dict) -> None:
         """Notify user when they may be interested in an idea.
@@ -335,7 +357,7 @@ class SurfacingAgent(BackgroundAgent):
             source_id=idea_id,
         )
 
-        logger.info(f"SurfacingAgent: Notified {user_id} of interesting idea")
+        logger.info("SurfacingAgent: Notified %s of interesting idea", user_id)
 
     async def _handle_shared_content_updated(self, payload: dict) -> None:
         """Notify ideas sharing content that was updated.
@@ -352,20 +374,23 @@ class SurfacingAgent(BackgroundAgent):
         if not source_idea:
             return
 
-        for related_id in related_idea_ids:
-            related_idea = IdeaActions.get_by_id(related_id)
-            if related_idea and related_idea.author_id != source_idea.author_id:
-                NotificationActions.create(
-                    user_id=related_idea.author_id,
-                    type=NotificationType.CONTRIBUTION,
-                    message=f"Content related to your idea '{related_idea.title}' has been updated",
-                    source_type="idea",
-                    source_id=related_id,
-                    related_id=source_idea_id,
-                )
+        related_ideas = IdeaActions.get_many_by_ids(related_idea_ids)
+
+        rows = []
+        for related_id, related_idea in related_ideas.items():
+            if related_idea.author_id != source_idea.author_id:
+                rows.append({
+                    "user_id": related_idea.author_id,
+                    "type": NotificationType.CONTRIBUTION,
+                    "message": f"Content related to your idea '{related_idea.title}' has been updated",
+                    "source_type": "idea",
+                    "source_id": related_id,
+                    "related_id": source_idea_id,
+                })
+        NotificationActions.bulk_create(rows)
 
         if related_idea_ids:
-            logger.info(f"SurfacingAgent: Notified users of shared content update")
+            logger.info("SurfacingAgent: Notified users of shared content update")
 
     async def _handle_idea_archived(self, payload: dict) -> None:
         """Notify contributors when idea is archived.
@@ -387,14 +412,18 @@ class SurfacingAgent(BackgroundAgent):
         # Don't notify the author (they did it)
         watchers = [w for w in watchers if w != idea.author_id]
 
-        for user_id in watchers:
-            NotificationActions.create(
-                user_id=user_id,
-                type=NotificationType.CONTRIBUTION,
-                message=f"Idea '{idea.title}' has been archived",
-                source_type="idea",
-                source_id=idea_id,
-            )
+        params = {"idea_title": idea.title}
+        NotificationActions.bulk_create([
+            {
+                "user_id": user_id,
+                "type": NotificationType.CONTRIBUTION,
+                "template_key": NotificationTemplate.IDEA_ARCHIVED,
+                "template_params": params,
+                "source_type": "idea",
+                "source_id": idea_id,
+            }
+            for user_id in watchers
+        ])
 
         if watchers:
-            logger.info(f"SurfacingAgent: Notified {len(watchers)} watchers of idea archive")
+            logger.info("SurfacingAgent: Notified %d watchers of idea archive", len(watchers))
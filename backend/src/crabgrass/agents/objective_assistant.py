@@ -5,17 +5,14 @@ It uses the Concepts layer to persist objectives, which ensures signals fire and
 sync handlers execute (e.g., embedding generation).
 """
 
-import logging
-import os
 from dataclasses import dataclass, field
-from typing import AsyncIterator
-from uuid import uuid4
+from functools import cache, lru_cache
+from typing import Iterator
 
 from google.adk.agents import LlmAgent
-from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
-from google.genai import types
+from google.adk.agents.readonly_context import ReadonlyContext
 
+from crabgrass.agents._shared import BaseAssistantAgent
 from crabgrass.agents.objective_tools import (
     save_objective,
     list_objectives,
@@ -23,9 +20,6 @@ from crabgrass.agents.objective_tools import (
     get_sub_objectives,
     retire_objective,
 )
-from crabgrass.config import get_settings
-
-logger = logging.getLogger(__name__)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -35,7 +29,10 @@ logger = logging.getLogger(__name__)
 
 @dataclass
 class ObjectiveContext:
-    """State for an objective being created/edited."""
+    """State for an objective being created/edited.
+
+    to_context_string() and to_dict() are cached until a field is assigned.
+    """
 
     objective_id: str | None = None
     title: str | None = None
@@ -43,8 +40,22 @@ class ObjectiveContext:
     parent_id: str | None = None
     status: str = "Active"
 
+    _str_cache: str | None = field(default=None, init=False, repr=False, compare=False)
+    _dict_cache: dict | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            super().__setattr__("_str_cache", None)
+            super().__setattr__("_dict_cache", None)
+
     def to_context_string(self) -> str:
         """Format current state for the agent prompt."""
+        if self._str_cache is None:
+            self._str_cache = self._build_context_string()
+        return self._str_cache
+
+    def _build_context_string(self) -> str:
         if not self.objective_id:
             return "No objective captured yet."
 
@@ -60,13 +71,15 @@ class ObjectiveContext:
 
     def to_dict(self) -> dict:
         """Convert to dictionary for frontend."""
-        return {
-            "objective_id": self.objective_id,
-            "title": self.title,
-            "description": self.description,
-            "parent_id": self.parent_id,
-            "status": self.status,
-        }
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "objective_id": self.objective_id,
+                "title": self.title,
+                "description": self.description,
+                "parent_id": self.parent_id,
+                "status": self.status,
+            }
+        return self._dict_cache
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -95,15 +108,28 @@ You have access to the following tools:
 - find_similar_objectives: Find objectives with similar goals
 - get_sub_objectives: Get child objectives for a parent
 - retire_objective: Retire an objective (use with caution)
+"""
 
-Current objective context:
+# Sent after OBJECTIVE_SYSTEM_PROMPT each turn, so the system prompt stays
+# identical across turns and Gemini can reuse its cached prefix
+OBJECTIVE_CONTEXT_PROMPT = """Current objective context:
 {context}
 """
 
 
+@lru_cache(maxsize=1024)
 def format_objective_prompt(context_string: str) -> str:
-    """Format the system prompt with current objective context."""
-    return OBJECTIVE_SYSTEM_PROMPT.format(context=context_string)
+    """Format the per-turn prompt with current objective context."""
+    return OBJECTIVE_CONTEXT_PROMPT.format(context=context_string)
+
+
+# Session state key holding ObjectiveContext.to_context_string() for the current turn
+CONTEXT_STATE_KEY = "objective_context"
+
+
+def _instruction(context: ReadonlyContext) -> str:
+    """Build the per-turn prompt from the objective context in session state."""
+    return format_objective_prompt(context.state.get(CONTEXT_STATE_KEY, "No objective captured yet."))
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -111,26 +137,25 @@ def format_objective_prompt(context_string: str) -> str:
 # ─────────────────────────────────────────────────────────────────────────────
 
 
-class ObjectiveAssistantAgent:
+class ObjectiveAssistantAgent(BaseAssistantAgent[ObjectiveContext]):
     """Agent that helps users define organizational Objectives.
 
     Uses Google ADK with Gemini for conversation and tool use.
     Converts ADK events to AG-UI protocol events for frontend streaming.
     """
 
-    def __init__(self):
-        """Initialize the ObjectiveAssistant agent."""
-        # Set API key in environment if not already set (ADK reads from env)
-        settings = get_settings()
-        if not os.environ.get("GOOGLE_API_KEY"):
-            os.environ["GOOGLE_API_KEY"] = settings.google_api_key
+    app_name = "crabgrass_objectives"
+    context_state_key = CONTEXT_STATE_KEY
+    context_class = ObjectiveContext
 
-        # Create the ADK agent with tools
-        self.agent = LlmAgent(
+    def _build_agent(self) -> LlmAgent:
+        """Create the ADK agent with tools."""
+        return LlmAgent(
             name="objective_assistant",
             model="gemini-2.0-flash",
             description="Helps users define organizational objectives",
-            instruction=format_objective_prompt("No objective captured yet."),
+            static_instruction=OBJECTIVE_SYSTEM_PROMPT,
+            instruction=_instruction,
             tools=[
                 save_objective,
                 list_objectives,
@@ -140,138 +165,17 @@ class ObjectiveAssistantAgent:
             ],
         )
 
-        # Session service for conversation state
-        self.session_service = InMemorySessionService()
-
-        # Create runner for execution
-        self.runner = Runner(
-            agent=self.agent,
-            app_name="crabgrass_objectives",
-            session_service=self.session_service,
-        )
-
-    async def run(
-        self,
-        user_message: str,
-        session_id: str,
-        context: ObjectiveContext | None = None,
-    ) -> AsyncIterator[dict]:
-        """Run the agent with streaming output.
-
-        Args:
-            user_message: The user's input message.
-            session_id: Session ID for conversation tracking.
-            context: Current objective context (optional).
-
-        Yields:
-            AG-UI protocol events as dictionaries.
-        """
-        # Update instruction with current context
-        if context:
-            self.agent.instruction = format_objective_prompt(context.to_context_string())
-        else:
-            context = ObjectiveContext()
-            self.agent.instruction = format_objective_prompt("No objective captured yet.")
-
-        # Ensure session exists in ADK session service
-        existing_session = await self.session_service.get_session(
-            app_name="crabgrass_objectives",
-            user_id=session_id,
-            session_id=session_id,
-        )
-        if not existing_session:
-            await self.session_service.create_session(
-                app_name="crabgrass_objectives",
-                user_id=session_id,
-                session_id=session_id,
-            )
-
-        # Create the user message content
-        user_content = types.Content(
-            parts=[types.Part(text=user_message)],
-            role="user",
-        )
-
-        # Track current tool call for event correlation
-        current_tool_call_id: str | None = None
-        accumulated_text = ""
-
-        try:
-            async for event in self.runner.run_async(
-                user_id=session_id,
-                session_id=session_id,
-                new_message=user_content,
-            ):
-                # Skip user events (we only care about agent responses)
-                if event.author == "user":
-                    continue
-
-                # Handle text content
-                if event.content and event.content.parts:
-                    for part in event.content.parts:
-                        if hasattr(part, "text") and part.text:
-                            # Emit text delta
-                            yield {
-                                "type": "text_delta",
-                                "text": part.text,
-                            }
-                            accumulated_text += part.text
-
-                # Handle function calls (tool invocations)
-                function_calls = event.get_function_calls()
-                if function_calls:
-                    for fc in function_calls:
-                        current_tool_call_id = str(uuid4())
-                        yield {
-                            "type": "tool_call_start",
-                            "tool_call_id": current_tool_call_id,
-                            "tool_name": fc.name,
-                        }
-                        yield {
-                            "type": "tool_call_args",
-                            "tool_call_id": current_tool_call_id,
-                            "args": dict(fc.args) if fc.args else {},
-                        }
-                        yield {
-                            "type": "tool_call_end",
-                            "tool_call_id": current_tool_call_id,
-                        }
-
-                # Handle function responses (tool results)
-                function_responses = event.get_function_responses()
-                if function_responses:
-                    for fr in function_responses:
-                        yield {
-                            "type": "tool_result",
-                            "tool_call_id": current_tool_call_id or str(uuid4()),
-                            "tool_name": fr.name,
-                            "result": fr.response,
-                        }
-
-                        # Update context if save_objective was called
-                        if fr.name == "save_objective" and isinstance(fr.response, dict):
-                            if fr.response.get("success") and fr.response.get("objective_id"):
-                                context.objective_id = fr.response["objective_id"]
-                                yield {
-                                    "type": "state_update",
-                                    "context": context.to_dict(),
-                                }
-
-        except Exception as e:
-            logger.error(f"ObjectiveAssistant execution error: {e}", exc_info=True)
+    def _handle_save_objective(self, response: dict, context: ObjectiveContext) -> Iterator[dict]:
+        """Update context with the saved objective's ID."""
+        if response.get("success") and response.get("objective_id"):
+            context.objective_id = response["objective_id"]
             yield {
-                "type": "error",
-                "message": str(e),
+                "type": "state_update",
+                "context": context.to_dict(),
             }
 
 
-# Singleton instance
-_agent: ObjectiveAssistantAgent | None = None
-
-
+@cache
 def get_objective_assistant() -> ObjectiveAssistantAgent:
     """Get singleton ObjectiveAssistantAgent instance."""
-    global _agent
-    if _agent is None:
-        _agent = ObjectiveAssistantAgent()
-    return _agent
+    return ObjectiveAssistantAgent()
@@ -4,16 +4,23 @@ These tools call concept actions directly, which ensures signals fire
 and sync handlers execute (e.g., embedding generation).
 """
 
+import asyncio
 import logging
 from dataclasses import dataclass, field
 
 from crabgrass.concepts.objective import ObjectiveActions
 from crabgrass.concepts.user import UserActions
-from crabgrass.services.similarity import SimilarityService
-from crabgrass.services.embedding import get_embedding_service
+from crabgrass.services.similarity_cache import get_cached_similarity_service
+from crabgrass.services.embedding import get_batching_embedder
 
 logger = logging.getLogger(__name__)
 
+# Statuses list_objectives accepts; anything else falls back to "Active"
+VALID_STATUSES = frozenset({"Active", "Retired"})
+# Upper bounds for the limit argument of the listing and search tools
+MAX_LIST_LIMIT = 50
+MAX_SIMILAR_LIMIT = 20
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Tool Functions
@@ -61,12 +68,21 @@ def save_objective(
                 update_kwargs["title"] = title
             if description and description != objective.description:
                 update_kwargs["description"] = description
-            if parent_id is not None:  # Allow clearing parent_id
-                update_kwargs["parent_id"] = parent_id if parent_id.strip() else None
+            new_parent_id = parent_id.strip() or None  # Allow clearing parent_id
+            if new_parent_id != objective.parent_id:
+                update_kwargs["parent_id"] = new_parent_id or ""
+
+            # Agents often re-send unchanged fields; skip the write and its signal
+            if not update_kwargs:
+                return {
+                    "success": True,
+                    "objective_id": objective_id,
+                    "message": "Objective already up to date",
+                    "created_new": False,
+                }
 
-            if update_kwargs:
-                ObjectiveActions.update(objective_id, **update_kwargs)
-                logger.info(f"Updated objective: {objective_id}")
+            ObjectiveActions.update(objective_id, **update_kwargs)
+            logger.info(f"Updated objective: {objective_id}")
 
         else:
             # Create new objective
@@ -116,47 +132,54 @@ def save_objective(
 def list_objectives(
     status: str = "Active",
     limit: int = 20,
+    cursor: str = "",
 ) -> dict:
     """List all objectives with optional status filter.
 
     Args:
         status: Filter by status ("Active" or "Retired"). Default is "Active".
         limit: Maximum number of results (default 20, max 50).
+        cursor: Optional next_cursor from a previous call, to get the next page.
 
     Returns:
-        Dictionary with success status and list of objectives.
+        Dictionary with success status, list of objectives, and next_cursor
+        when more objectives may follow.
     """
     try:
         # Validate status
-        if status not in ("Active", "Retired"):
+        if status not in VALID_STATUSES:
             status = "Active"
 
         # Clamp limit
-        limit = min(max(1, limit), 50)
+        limit = min(max(1, limit), MAX_LIST_LIMIT)
 
-        # Get objectives
-        objectives = ObjectiveActions.list_all(status=status)
-
-        # Limit results
-        objectives = objectives[:limit]
+        # Get objectives, with descriptions truncated by the database
+        objectives = ObjectiveActions.list_all_summary(
+            status=status,
+            limit=limit,
+            cursor_id=cursor or None,
+        )
 
         objective_list = [
             {
-                "objective_id": o.id,
-                "title": o.title,
-                "description": o.description[:200] + "..." if len(o.description) > 200 else o.description,
-                "parent_id": o.parent_id,
-                "status": o.status,
+                "objective_id": objective_id,
+                "title": title,
+                "description": description,
+                "parent_id": parent_id,
+                "status": objective_status,
             }
-            for o in objectives
+            for objective_id, title, description, objective_status, parent_id in objectives
         ]
 
-        return {
+        result = {
             "success": True,
             "objectives": objective_list,
             "count": len(objective_list),
             "message": f"Found {len(objective_list)} {status.lower()} objectives",
         }
+        if len(objective_list) == limit:
+            result["next_cursor"] = objective_list[-1]["objective_id"]
+        return result
 
     except Exception as e:
         logger.error(f"Error listing objectives: {e}", exc_info=True)
@@ -168,7 +191,7 @@ def list_objectives(
         }
 
 
-def find_similar_objectives(
+async def find_similar_objectives(
     description: str,
     limit: int = 5,
     exclude_objective_id: str = "",
@@ -194,15 +217,15 @@ def find_similar_objectives(
             }
 
         # Clamp limit
-        limit = min(max(1, limit), 20)
+        limit = min(max(1, limit), MAX_SIMILAR_LIMIT)
 
         # Generate embedding for the description
-        embedding_service = get_embedding_service()
-        embedding = embedding_service.embed(description)
+        embedding = await get_batching_embedder().embed_async(description)
 
-        # Find similar objectives using similarity service
-        similarity_service = SimilarityService()
-        similar = similarity_service.find_similar_objectives(
+        # Find similar objectives in a worker thread so the event loop stays responsive
+        similarity_service = get_cached_similarity_service()
+        similar = await asyncio.to_thread(
+            similarity_service.find_similar_objectives,
             embedding=embedding,
             limit=limit,
             exclude_id=exclude_objective_id if exclude_objective_id else None,
@@ -260,17 +283,17 @@ def get_sub_objectives(
                 "message": f"Objective {objective_id} not found",
             }
 
-        # Get sub-objectives
-        sub_objectives = ObjectiveActions.get_sub_objectives(objective_id)
+        # Get sub-objectives, with descriptions truncated by the database
+        sub_objectives = ObjectiveActions.list_all_summary(parent_id=objective_id)
 
         sub_list = [
             {
-                "objective_id": o.id,
-                "title": o.title,
-                "description": o.description[:200] + "..." if len(o.description) > 200 else o.description,
-                "status": o.status,
+                "objective_id": sub_id,
+                "title": title,
+                "description": description,
+                "status": sub_status,
             }
-            for o in sub_objectives
+            for sub_id, title, description, sub_status, _ in sub_objectives
         ]
 
         return {
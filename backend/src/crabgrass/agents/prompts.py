@@ -1,5 +1,7 @@
 """System prompt and templates for the IdeaAssistant agent."""
 
+from functools import lru_cache
+
 SYSTEM_PROMPT = """You are the IdeaAssistant, helping users capture and structure their ideas in Crabgrass.
 
 Your role is to:
@@ -21,19 +23,26 @@ You have access to the following tools:
 - save_idea: Save or update the current idea. CALL THIS when user provides an idea or asks to save.
 - add_action: Add a coherent action item to an existing idea (requires idea_id from save_idea)
 - find_similar: Find ideas similar to the current content
+"""
 
-Current idea context:
+# Sent after SYSTEM_PROMPT each turn. Keeping the per-turn context out of the
+# system prompt leaves its bytes identical across turns and users, so Gemini
+# can reuse its cached prefix.
+CONTEXT_PROMPT = """Current idea context:
 {context}
 """
 
 
-def format_system_prompt(context_string: str) -> str:
-    """Format the system prompt with current idea context.
+@lru_cache(maxsize=1024)
+def format_context_prompt(context_string: str) -> str:
+    """Format the per-turn prompt with current idea context.
+
+    Cached, since each chat turn re-formats the prompt for the same context.
 
     Args:
         context_string: The current idea state formatted as a string.
 
     Returns:
-        The complete system prompt with context inserted.
+        The context prompt sent after SYSTEM_PROMPT.
     """
-    return SYSTEM_PROMPT.format(context=context_string)
+    return CONTEXT_PROMPT.format(context=context_string)
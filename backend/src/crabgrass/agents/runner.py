@@ -16,6 +16,9 @@ from crabgrass.concepts.queue import QueueActions, QueueName, QueueItem, QueueIt
 
 logger = logging.getLogger(__name__)
 
+# Default maximum queue items an agent processes concurrently within a batch
+MAX_CONCURRENT_ITEMS = 8
+
 
 class BackgroundAgent(ABC):
     """Base class for background processing agents.
@@ -24,6 +27,9 @@ class BackgroundAgent(ABC):
     The runner manages polling, error handling, and lifecycle.
     """
 
+    # Items of one batch processed at once; override for slower or rate-limited agents
+    concurrency: int = MAX_CONCURRENT_ITEMS
+
     def __init__(self, queue_name: QueueName):
         """Initialize the agent.
 
@@ -33,6 +39,8 @@ class BackgroundAgent(ABC):
         self.queue_name = queue_name
         self._running = False
         self._task: asyncio.Task | None = None
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._wakeup = asyncio.Event()
 
     @property
     def name(self) -> str:
@@ -50,6 +58,15 @@ class BackgroundAgent(ABC):
         """
         pass
 
+    def coalesce_key(self, item: QueueItem) -> str | None:
+        """Key under which items in one batch are redundant with each other.
+
+        Of the items sharing a non-None key, only the newest is processed and
+        its outcome is recorded for all of them. By default every item is
+        processed on its own.
+        """
+        return None
+
     async def run_once(self, batch_size: int = 10) -> int:
         """Process one batch of items.
 
@@ -60,52 +77,110 @@ class BackgroundAgent(ABC):
             Number of items processed
         """
         items = QueueActions.dequeue(self.queue_name, limit=batch_size)
-        processed = 0
-
+        if not items:
+            return 0
+
+        # Items are independent, so overlap their processing
+        outcomes = await asyncio.gather(
+            *(self._safe_process(group) for group in self._coalesce(items))
+        )
+
+        # Record every outcome of the batch in two statements
+        completed = [item.id for group, ok in outcomes if ok for item in group]
+        failed = [item.id for group, ok in outcomes if not ok for item in group]
+        QueueActions.complete_many(completed)
+        QueueActions.fail_many(failed)
+        return len(completed)
+
+    def _coalesce(self, items: list[QueueItem]) -> list[list[QueueItem]]:
+        """Group a batch by coalesce_key, newest item last in each group."""
+        groups: dict[str, list[QueueItem]] = {}
+        singles: list[list[QueueItem]] = []
         for item in items:
+            key = self.coalesce_key(item)
+            if key is None:
+                singles.append([item])
+            else:
+                groups.setdefault(key, []).append(item)
+        return singles + list(groups.values())
+
+    async def _safe_process(self, items: list[QueueItem]) -> tuple[list[QueueItem], bool]:
+        """Process the newest of a group of items on behalf of the whole group.
+
+        Returns:
+            The group and whether processing succeeded
+        """
+        item = items[-1]
+        async with self._semaphore:
             try:
                 logger.debug(f"{self.name}: Processing item {item.id}")
                 await self.process_item(item)
-                QueueActions.complete(item.id)
-                processed += 1
+                if len(items) > 1:
+                    logger.debug(f"{self.name}: Coalesced {len(items) - 1} items into {item.id}")
                 logger.debug(f"{self.name}: Completed item {item.id}")
+                return items, True
             except Exception as e:
                 logger.error(f"{self.name}: Error processing item {item.id}: {e}")
-                QueueActions.fail(item.id)
-
-        return processed
+                return items, False
 
     async def run_loop(self, interval_seconds: float = 5.0, batch_size: int = 10):
-        """Continuously process queue with polling interval.
+        """Continuously process queue, waking as soon as an item is enqueued.
 
         Args:
-            interval_seconds: Time to sleep when queue is empty
+            interval_seconds: Longest wait between polls when queue is empty
             batch_size: Maximum items per batch
         """
         self._running = True
         logger.info(f"{self.name}: Starting background loop (interval={interval_seconds}s)")
 
-        while self._running:
-            try:
-                processed = await self.run_once(batch_size)
+        # Enqueues may happen on worker threads, so hop onto this loop to wake
+        loop = asyncio.get_running_loop()
 
-                if processed == 0:
-                    # No items found, wait before polling again
+        def wake() -> None:
+            try:
+                loop.call_soon_threadsafe(self._wakeup.set)
+            except RuntimeError:
+                pass  # Loop already closed
+
+        QueueActions.add_listener(self.queue_name, wake)
+
+        try:
+            while self._running:
+                # Cleared before dequeueing so an enqueue during the batch is not missed
+                self._wakeup.clear()
+                try:
+                    processed = await self.run_once(batch_size)
+
+                    if processed == 0:
+                        # No items found, wait for an enqueue or the polling interval
+                        await self._wait_for_items(interval_seconds)
+                    else:
+                        logger.info(f"{self.name}: Processed {processed} items")
+                        # Small yield to prevent CPU hogging
+                        await asyncio.sleep(0.1)
+
+                except asyncio.CancelledError:
+                    logger.info(f"{self.name}: Received cancellation, stopping")
+                    break
+                except Exception as e:
+                    logger.error(f"{self.name}: Unexpected error in loop: {e}")
                     await asyncio.sleep(interval_seconds)
-                else:
-                    logger.info(f"{self.name}: Processed {processed} items")
-                    # Small yield to prevent CPU hogging
-                    await asyncio.sleep(0.1)
-
-            except asyncio.CancelledError:
-                logger.info(f"{self.name}: Received cancellation, stopping")
-                break
-            except Exception as e:
-                logger.error(f"{self.name}: Unexpected error in loop: {e}")
-                await asyncio.sleep(interval_seconds)
+        finally:
+            QueueActions.remove_listener(self.queue_name, wake)
 
         logger.info(f"{self.name}: Background loop stopped")
 
+    async def _wait_for_items(self, timeout: float) -> None:
+        """Sleep until an item is enqueued or timeout seconds pass.
+
+        The timeout still bounds the wait so failed items re-queued by
+        retry_failed, which fires no listener, are picked up.
+        """
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
     def stop(self):
         """Signal the agent to stop."""
         self._running = False
@@ -122,7 +197,7 @@ class AgentOrchestrator:
 
     def __init__(self):
         self.agents: list[BackgroundAgent] = []
-        self._tasks: list[asyncio.Task] = []
+        self._supervisor: asyncio.Task | None = None
         self._running = False
 
     def register(self, agent: BackgroundAgent) -> None:
@@ -147,16 +222,25 @@ class AgentOrchestrator:
         self._running = True
         logger.info(f"AgentOrchestrator: Starting {len(self.agents)} agents")
 
-        for agent in self.agents:
-            task = asyncio.create_task(
-                agent.run_loop(interval_seconds=interval_seconds),
-                name=f"agent_{agent.name}",
-            )
-            agent._task = task
-            self._tasks.append(task)
+        started = asyncio.Event()
+        self._supervisor = asyncio.create_task(
+            self._supervise(interval_seconds, started),
+            name="agent_orchestrator",
+        )
+        await started.wait()
 
         logger.info("AgentOrchestrator: All agents started")
 
+    async def _supervise(self, interval_seconds: float, started: asyncio.Event) -> None:
+        """Run every agent loop in one TaskGroup until they have all exited."""
+        async with asyncio.TaskGroup() as group:
+            for agent in self.agents:
+                agent._task = group.create_task(
+                    agent.run_loop(interval_seconds=interval_seconds),
+                    name=f"agent_{agent.name}",
+                )
+            started.set()
+
     async def stop(self):
         """Stop all running agents."""
         if not self._running:
@@ -165,23 +249,18 @@ class AgentOrchestrator:
         logger.info("AgentOrchestrator: Stopping all agents")
         self._running = False
 
-        # Signal all agents to stop
+        # Signal all agents to stop; each also cancels its own task
         for agent in self.agents:
             agent.stop()
 
-        # Wait for tasks to complete (with timeout)
-        if self._tasks:
+        # The TaskGroup exits once every agent task has finished
+        if self._supervisor:
             try:
-                await asyncio.wait(self._tasks, timeout=10.0)
+                await asyncio.wait_for(self._supervisor, timeout=10.0)
             except Exception as e:
-                logger.error(f"AgentOrchestrator: Error waiting for tasks: {e}")
-
-            # Cancel any remaining tasks
-            for task in self._tasks:
-                if not task.done():
-                    task.cancel()
+                logger.error(f"AgentOrchestrator: Error waiting for agents: {e}")
+            self._supervisor = None
 
-        self._tasks.clear()
         logger.info("AgentOrchestrator: All agents stopped")
 
     def get_status(self) -> dict:
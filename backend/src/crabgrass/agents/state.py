@@ -17,6 +17,9 @@ class IdeaContext:
 
     This context is passed to the agent with each message and updated
     as the agent helps the user structure their idea.
+
+    to_context_string() and to_dict() are cached until a field is assigned.
+    Replace coherent_actions rather than mutating it in place.
     """
 
     idea_id: str | None = None
@@ -29,8 +32,22 @@ class IdeaContext:
     # Tracking stage in the idea development flow
     stage: IdeaStage = "initial"
 
+    _str_cache: str | None = field(default=None, init=False, repr=False, compare=False)
+    _dict_cache: dict | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            super().__setattr__("_str_cache", None)
+            super().__setattr__("_dict_cache", None)
+
     def to_context_string(self) -> str:
         """Format the current state for the agent's system prompt."""
+        if self._str_cache is None:
+            self._str_cache = self._build_context_string()
+        return self._str_cache
+
+    def _build_context_string(self) -> str:
         parts = []
         if self.title:
             parts.append(f"Title: {self.title}")
@@ -50,12 +67,14 @@ class IdeaContext:
 
     def to_dict(self) -> dict:
         """Convert to dictionary for AG-UI state snapshot events."""
-        return {
-            "idea_id": self.idea_id,
-            "title": self.title,
-            "summary": self.summary,
-            "challenge": self.challenge,
-            "approach": self.approach,
-            "coherent_actions": self.coherent_actions,
-            "stage": self.stage,
-        }
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "idea_id": self.idea_id,
+                "title": self.title,
+                "summary": self.summary,
+                "challenge": self.challenge,
+                "approach": self.approach,
+                "coherent_actions": self.coherent_actions,
+                "stage": self.stage,
+            }
+        return self._dict_cache
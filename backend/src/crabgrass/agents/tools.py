@@ -4,20 +4,27 @@ These tools call concept actions directly, which ensures signals fire
 and sync handlers execute (e.g., embedding generation).
 """
 
+import asyncio
 import logging
+import secrets
 from dataclasses import dataclass, field
 
-from crabgrass.concepts.idea import IdeaActions
+from crabgrass.concepts.idea import IdeaActions, IdeaBundle
 from crabgrass.concepts.summary import SummaryActions
 from crabgrass.concepts.challenge import ChallengeActions
 from crabgrass.concepts.approach import ApproachActions
 from crabgrass.concepts.coherent_action import CoherentActionActions
 from crabgrass.concepts.user import UserActions
-from crabgrass.services.similarity import SimilarityService
-from crabgrass.services.embedding import get_embedding_service
+from crabgrass.services.similarity_cache import get_cached_similarity_service
+from crabgrass.services.embedding import get_batching_embedder, get_embedding_service
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of contents accepted by find_similar_many
+MAX_BATCH_CONTENTS = 100
+# Idea fields propose_suggestion accepts, in the order error messages list them
+VALID_FIELDS = ("summary", "challenge", "approach")
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Result Types
@@ -52,6 +59,28 @@ class FindSimilarResult:
     message: str = ""
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Helper Functions
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+def _prefetch_embeddings(contents: list[str]) -> None:
+    """Embed several kernel element contents in one API call.
+
+    The embedding handlers fired by each create/update then find their
+    vectors in the shared embedding cache. Failures are left for those
+    handlers to report.
+    """
+    texts = [content for content in contents if content and content.strip()]
+    if len(texts) < 2:
+        return
+
+    try:
+        get_embedding_service().embed_batch(texts)
+    except Exception as e:
+        logger.warning(f"Could not prefetch embeddings: {e}")
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Tool Functions
 # ─────────────────────────────────────────────────────────────────────────────
@@ -84,9 +113,9 @@ def save_idea(
         created_new = False
 
         if idea_id and idea_id.strip():
-            # Update existing idea
-            idea = IdeaActions.get_by_id(idea_id)
-            if not idea:
+            # Update existing idea, reading its kernel elements in the same query
+            bundle = IdeaActions.get_bundle(idea_id)
+            if not bundle:
                 return {
                     "success": False,
                     "idea_id": "",
@@ -95,7 +124,7 @@ def save_idea(
                 }
 
             # Update title if changed
-            if title and title != idea.title:
+            if title and title != bundle.idea.title:
                 IdeaActions.update(idea_id, title=title)
         else:
             # Create new idea
@@ -108,14 +137,17 @@ def save_idea(
                 }
             idea = IdeaActions.create(title=title, author_id=current_user.id)
             idea_id = idea.id
+            bundle = IdeaBundle(idea=idea)
             created_new = True
             logger.info(f"Created new idea: {idea_id}")
 
+        # Embed all new contents together before their signals fire
+        _prefetch_embeddings([summary, challenge, approach])
+
         # Handle Summary (one per idea)
         if summary and summary.strip():
-            existing_summary = SummaryActions.get_by_idea_id(idea_id)
-            if existing_summary:
-                SummaryActions.update(existing_summary.id, content=summary)
+            if bundle.summary_id:
+                SummaryActions.update(bundle.summary_id, content=summary)
                 logger.info(f"Updated summary for idea {idea_id}")
             else:
                 SummaryActions.create(idea_id=idea_id, content=summary)
@@ -123,9 +155,8 @@ def save_idea(
 
         # Handle Challenge (one per idea)
         if challenge and challenge.strip():
-            existing_challenge = ChallengeActions.get_by_idea_id(idea_id)
-            if existing_challenge:
-                ChallengeActions.update(existing_challenge.id, content=challenge)
+            if bundle.challenge_id:
+                ChallengeActions.update(bundle.challenge_id, content=challenge)
                 logger.info(f"Updated challenge for idea {idea_id}")
             else:
                 ChallengeActions.create(idea_id=idea_id, content=challenge)
@@ -133,9 +164,8 @@ def save_idea(
 
         # Handle Approach (one per idea)
         if approach and approach.strip():
-            existing_approach = ApproachActions.get_by_idea_id(idea_id)
-            if existing_approach:
-                ApproachActions.update(existing_approach.id, content=approach)
+            if bundle.approach_id:
+                ApproachActions.update(bundle.approach_id, content=approach)
                 logger.info(f"Updated approach for idea {idea_id}")
             else:
                 ApproachActions.create(idea_id=idea_id, content=approach)
@@ -159,7 +189,7 @@ def save_idea(
         }
 
 
-def find_similar(
+async def find_similar(
     content: str,
     limit: int = 5,
     exclude_idea_id: str = "",
@@ -188,12 +218,12 @@ def find_similar(
         limit = min(max(1, limit), 20)
 
         # Generate embedding for the content
-        embedding_service = get_embedding_service()
-        embedding = embedding_service.embed(content)
+        embedding = await get_batching_embedder().embed_async(content)
 
-        # Find similar summaries
-        similarity_service = SimilarityService()
-        similar = similarity_service.find_similar_summaries(
+        # Find similar summaries in a worker thread so the event loop stays responsive
+        similarity_service = get_cached_similarity_service()
+        similar = await asyncio.to_thread(
+            similarity_service.find_similar_summaries,
             embedding=embedding,
             limit=limit,
             exclude_idea_id=exclude_idea_id if exclude_idea_id else None,
@@ -223,6 +253,75 @@ def find_similar(
         }
 
 
+async def find_similar_many(
+    contents: list[str],
+    limit: int = 5,
+    exclude_idea_id: str = "",
+) -> dict:
+    """Find ideas similar to each of several contents.
+
+    Duplicate contents are embedded and searched once, with one embedding
+    call and one similarity query for the whole batch.
+
+    Args:
+        contents: Text contents to find similar ideas for (max 100).
+        limit: Maximum number of results per content (default 5, max 20).
+        exclude_idea_id: Optional idea ID to exclude from results.
+
+    Returns:
+        Dictionary with success status and one list of similar ideas per
+        content, in input order.
+    """
+    try:
+        if len(contents) > MAX_BATCH_CONTENTS:
+            return {
+                "success": False,
+                "results": [],
+                "message": f"At most {MAX_BATCH_CONTENTS} contents can be searched at once",
+            }
+
+        # Clamp limit
+        limit = min(max(1, limit), 20)
+
+        if not any(content and content.strip() for content in contents):
+            return {
+                "success": False,
+                "results": [],
+                "message": "Content is required to find similar ideas",
+            }
+
+        found = await asyncio.to_thread(
+            get_cached_similarity_service().find_similar_for_contents,
+            contents,
+            limit=limit,
+            exclude_idea_id=exclude_idea_id or None,
+        )
+
+        return {
+            "success": True,
+            "results": [
+                [
+                    {
+                        "idea_id": s.idea_id,
+                        "title": s.title,
+                        "similarity": round(s.similarity, 3),
+                    }
+                    for s in similar
+                ]
+                for similar in found
+            ],
+            "message": f"Searched {len(contents)} contents",
+        }
+
+    except Exception as e:
+        logger.error(f"Error finding similar ideas: {e}", exc_info=True)
+        return {
+            "success": False,
+            "results": [],
+            "message": f"Error finding similar ideas: {str(e)}",
+        }
+
+
 def propose_suggestion(
     idea_id: str,
     field: str,
@@ -243,8 +342,6 @@ def propose_suggestion(
     Returns:
         Dictionary with success status, suggestion_id, and the suggestion details.
     """
-    import uuid
-
     try:
         if not idea_id or not idea_id.strip():
             return {
@@ -252,11 +349,10 @@ def propose_suggestion(
                 "message": "idea_id is required",
             }
 
-        valid_fields = ["summary", "challenge", "approach"]
-        if field not in valid_fields:
+        if field not in VALID_FIELDS:
             return {
                 "success": False,
-                "message": f"field must be one of: {', '.join(valid_fields)}",
+                "message": f"field must be one of: {', '.join(VALID_FIELDS)}",
             }
 
         if not content or not content.strip():
@@ -274,7 +370,7 @@ def propose_suggestion(
             }
 
         # Generate a unique suggestion ID
-        suggestion_id = f"sug-{uuid.uuid4().hex[:8]}"
+        suggestion_id = f"sug-{secrets.token_hex(4)}"
 
         logger.info(f"Proposed suggestion {suggestion_id} for {field} on idea {idea_id}")
 
@@ -4,6 +4,7 @@ This router provides endpoints for chatting with the IdeaAssistant agent
 using Server-Sent Events (SSE) with AG-UI protocol events.
 """
 
+import asyncio
 import json
 import logging
 from typing import AsyncIterator
@@ -42,6 +43,11 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Pending text_delta characters that trigger a flush
+TEXT_FLUSH_CHARS = 64
+# Seconds text_delta events may wait to be merged with later ones
+TEXT_FLUSH_SECONDS = 0.016
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Request/Response Schemas
@@ -127,6 +133,77 @@ def load_idea_context(idea_id: str) -> IdeaContext:
     return context
 
 
+async def coalesce_text(
+    events: AsyncIterator[dict],
+    min_chars: int = TEXT_FLUSH_CHARS,
+    window: float = TEXT_FLUSH_SECONDS,
+) -> AsyncIterator[dict]:
+    """Merge runs of text_delta events into fewer, larger deltas.
+
+    Text is flushed once min_chars are pending, once the oldest pending
+    text has waited window seconds, and before any other event or a source
+    error so event order is preserved. The source is closed on exit.
+    """
+    loop = asyncio.get_running_loop()
+    source = aiter(events)
+    texts: list[str] = []
+    size = 0
+    deadline = 0.0
+    next_event: asyncio.Future | None = None
+
+    def flush() -> dict:
+        nonlocal texts, size
+        event = {"type": "text_delta", "text": "".join(texts)}
+        texts, size = [], 0
+        return event
+
+    try:
+        while True:
+            if next_event is None:
+                next_event = asyncio.ensure_future(anext(source))
+            timeout = max(0.0, deadline - loop.time()) if texts else None
+            done, _ = await asyncio.wait({next_event}, timeout=timeout)
+            if not done:
+                yield flush()
+                continue
+
+            try:
+                event = next_event.result()
+            except StopAsyncIteration:
+                break
+            except Exception:
+                # Deliver the text received before the source failed
+                if texts:
+                    yield flush()
+                raise
+            finally:
+                next_event = None
+
+            if event.get("type") == "text_delta":
+                if not texts:
+                    deadline = loop.time() + window
+                texts.append(event.get("text", ""))
+                size += len(texts[-1])
+                if size >= min_chars:
+                    yield flush()
+                continue
+
+            if texts:
+                yield flush()
+            yield event
+    finally:
+        if next_event is not None:
+            next_event.cancel()
+            # The source cannot be closed while a read is still running
+            await asyncio.wait({next_event})
+        aclose = getattr(source, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+    if texts:
+        yield flush()
+
+
 async def stream_agent_response(
     message: str,
     session_id: str,
@@ -141,149 +218,157 @@ async def stream_agent_response(
     run_id = str(uuid4())
     message_id = str(uuid4())
 
-    # Record user message in session
-    SessionActions.add_message(session_id, "user", message)
+    # Messages for this turn, written to the session together at the end
+    pending: list[tuple[str, str]] = [("user", message)]
 
-    # Emit RunStartedEvent
-    yield encoder.encode(
-        RunStartedEvent(
-            thread_id=session_id,
-            run_id=run_id,
+    try:
+        # Emit RunStartedEvent
+        yield encoder.encode(
+            RunStartedEvent(
+                thread_id=session_id,
+                run_id=run_id,
+            )
         )
-    )
 
-    # Emit initial StateSnapshotEvent
-    yield encoder.encode(
-        StateSnapshotEvent(
-            snapshot=context.to_dict(),
+        # Emit initial StateSnapshotEvent
+        yield encoder.encode(
+            StateSnapshotEvent(
+                snapshot=context.to_dict(),
+            )
         )
-    )
 
-    # Emit TextMessageStartEvent
-    yield encoder.encode(
-        TextMessageStartEvent(
-            message_id=message_id,
-            role="assistant",
+        # Emit TextMessageStartEvent
+        yield encoder.encode(
+            TextMessageStartEvent(
+                message_id=message_id,
+                role="assistant",
+            )
         )
-    )
-
-    # Collect full response for session tracking
-    full_response: list[str] = []
 
-    try:
-        async for event in agent.run(message, session_id, context):
-            event_type = event.get("type")
-
-            if event_type == "text_delta":
-                text = event.get("text", "")
-                full_response.append(text)
-                yield encoder.encode(
-                    TextMessageContentEvent(
-                        message_id=message_id,
-                        delta=text,
+        # Collect full response for session tracking
+        full_response: list[str] = []
+
+        try:
+            # Merge tiny model deltas so each SSE frame carries more text
+            async for event in coalesce_text(agent.run(message, session_id, context)):
+                event_type = event.get("type")
+
+                if event_type == "text_delta":
+                    text = event.get("text", "")
+                    full_response.append(text)
+                    yield encoder.encode(
+                        TextMessageContentEvent(
+                            message_id=message_id,
+                            delta=text,
+                        )
                     )
-                )
 
-            elif event_type == "tool_call_start":
-                yield encoder.encode(
-                    ToolCallStartEvent(
-                        toolCallId=event.get("tool_call_id", str(uuid4())),
-                        toolCallName=event.get("tool_name", "unknown"),
+                elif event_type == "tool_call":
+                    # Agents emit one event per call; AG-UI expects start, args and end
+                    tool_call_id = event.get("tool_call_id", str(uuid4()))
+                    args = event.get("args", {})
+                    yield encoder.encode(
+                        ToolCallStartEvent(
+                            toolCallId=tool_call_id,
+                            toolCallName=event.get("tool_name", "unknown"),
+                        )
                     )
-                )
-
-            elif event_type == "tool_call_args":
-                args = event.get("args", {})
-                yield encoder.encode(
-                    ToolCallArgsEvent(
-                        toolCallId=event.get("tool_call_id", ""),
-                        delta=json.dumps(args) if args else "{}",
+                    yield encoder.encode(
+                        ToolCallArgsEvent(
+                            toolCallId=tool_call_id,
+                            delta=json.dumps(args) if args else "{}",
+                        )
                     )
-                )
-
-            elif event_type == "tool_call_end":
-                yield encoder.encode(
-                    ToolCallEndEvent(
-                        toolCallId=event.get("tool_call_id", ""),
+                    yield encoder.encode(
+                        ToolCallEndEvent(
+                            toolCallId=tool_call_id,
+                        )
                     )
-                )
 
-            elif event_type == "tool_result":
-                result = event.get("result", {})
-                yield encoder.encode(
-                    ToolCallResultEvent(
-                        messageId=message_id,
-                        toolCallId=event.get("tool_call_id", ""),
-                        content=json.dumps(result) if isinstance(result, dict) else str(result),
+                elif event_type == "tool_result":
+                    result = event.get("result", {})
+                    yield encoder.encode(
+                        ToolCallResultEvent(
+                            messageId=message_id,
+                            toolCallId=event.get("tool_call_id", ""),
+                            content=json.dumps(result) if isinstance(result, dict) else str(result),
+                        )
                     )
-                )
 
-                # Update context if save_idea was called successfully
-                if isinstance(result, dict) and result.get("success"):
-                    if result.get("idea_id"):
-                        context.idea_id = result["idea_id"]
+                    # Update context if save_idea was called successfully
+                    if isinstance(result, dict) and result.get("success"):
+                        if result.get("idea_id"):
+                            context.idea_id = result["idea_id"]
 
-                # Emit updated StateSnapshotEvent after tool execution
-                yield encoder.encode(
-                    StateSnapshotEvent(
-                        snapshot=context.to_dict(),
+                    # Emit updated StateSnapshotEvent after tool execution
+                    yield encoder.encode(
+                        StateSnapshotEvent(
+                            snapshot=context.to_dict(),
+                        )
                     )
-                )
 
-            elif event_type == "state_update":
-                # Direct state update from agent
-                yield encoder.encode(
-                    StateSnapshotEvent(
-                        snapshot=event.get("context", context.to_dict()),
+                elif event_type == "state_update":
+                    # Direct state update from agent
+                    yield encoder.encode(
+                        StateSnapshotEvent(
+                            snapshot=event.get("context", context.to_dict()),
+                        )
                     )
-                )
 
-            elif event_type == "suggestion":
-                # Emit CustomEvent for suggestion proposals
-                yield encoder.encode(
-                    CustomEvent(
-                        name="SUGGESTION",
-                        value={
-                            "suggestion_id": event.get("suggestion_id"),
-                            "field": event.get("field"),
-                            "content": event.get("content"),
-                            "reason": event.get("reason", ""),
-                        },
+                elif event_type == "suggestion":
+                    # Emit CustomEvent for suggestion proposals
+                    yield encoder.encode(
+                        CustomEvent(
+                            name="SUGGESTION",
+                            value={
+                                "suggestion_id": event.get("suggestion_id"),
+                                "field": event.get("field"),
+                                "content": event.get("content"),
+                                "reason": event.get("reason", ""),
+                            },
+                        )
                     )
-                )
 
-            elif event_type == "error":
-                error_msg = event.get("message", "Unknown error")
-                full_response.append(f"\n\n[Error: {error_msg}]")
-                yield encoder.encode(
-                    TextMessageContentEvent(
-                        message_id=message_id,
-                        delta=f"\n\n[Error: {error_msg}]",
+                elif event_type == "error":
+                    error_msg = event.get("message", "Unknown error")
+                    full_response.append(f"\n\n[Error: {error_msg}]")
+                    yield encoder.encode(
+                        TextMessageContentEvent(
+                            message_id=message_id,
+                            delta=f"\n\n[Error: {error_msg}]",
+                        )
                     )
+
+        except Exception as e:
+            logger.error(f"Agent error: {e}", exc_info=True)
+            error_text = f"\n\n[Error: {str(e)}]"
+            full_response.append(error_text)
+            yield encoder.encode(
+                TextMessageContentEvent(
+                    message_id=message_id,
+                    delta=error_text,
                 )
+            )
 
-    except Exception as e:
-        logger.error(f"Agent error: {e}", exc_info=True)
-        error_text = f"\n\n[Error: {str(e)}]"
-        full_response.append(error_text)
+        # Emit TextMessageEndEvent
         yield encoder.encode(
-            TextMessageContentEvent(
+            TextMessageEndEvent(
                 message_id=message_id,
-                delta=error_text,
             )
         )
 
-    # Emit TextMessageEndEvent
-    yield encoder.encode(
-        TextMessageEndEvent(
-            message_id=message_id,
-        )
-    )
-
-    # Record assistant response in session
-    assistant_response = "".join(full_response)
-    if assistant_response:
-        SessionActions.add_message(session_id, "assistant", assistant_response)
+        # Record the user message and assistant response in one write
+        assistant_response = "".join(full_response)
+        if assistant_response:
+            pending.append(("assistant", assistant_response))
+        # Take the messages before awaiting so a cancellation during the
+        # write cannot make the finally block record them a second time
+        messages, pending = pending, []
+        await asyncio.to_thread(SessionActions.add_messages, session_id, messages)
+    finally:
+        # The client disconnected mid-stream; still record what was said
+        if pending:
+            SessionActions.add_messages(session_id, pending)
 
     # Emit RunFinishedEvent
     yield encoder.encode(
@@ -304,19 +389,22 @@ async def chat_with_agent(request: AgentChatRequest):
     """Chat with the IdeaAssistant agent.
 
     Returns Server-Sent Events (SSE) stream with AG-UI protocol events.
+    Database reads and writes run in worker threads so concurrent chats
+    do not block the event loop.
     """
-    current_user = UserActions.get_current()
+    current_user = await asyncio.to_thread(UserActions.get_current)
 
     # Get or create session
     if request.session_id:
-        session = SessionActions.get_by_id(request.session_id)
+        session = await asyncio.to_thread(SessionActions.get_by_id, request.session_id)
         if not session:
             raise HTTPException(status_code=404, detail="Session not found")
         session_id = session.id
         idea_id = session.idea_id or request.idea_id
     else:
         # Create new session
-        session = SessionActions.start(
+        session = await asyncio.to_thread(
+            SessionActions.start,
             user_id=current_user.id,
             idea_id=request.idea_id,
         )
@@ -325,7 +413,7 @@ async def chat_with_agent(request: AgentChatRequest):
 
     # Load idea context
     if idea_id:
-        context = load_idea_context(idea_id)
+        context = await asyncio.to_thread(load_idea_context, idea_id)
     else:
         context = IdeaContext()
 
@@ -1,5 +1,8 @@
 """Ideas API router - thin HTTP layer delegating to concepts."""
 
+import asyncio
+import logging
+
 from fastapi import APIRouter, HTTPException, Query
 
 from crabgrass.api.schemas import (
@@ -20,6 +23,7 @@ from crabgrass.api.schemas import (
     CoherentActionUpdate,
     CoherentActionResponse,
     SimilarIdeaResponse,
+    SimilarBatchRequest,
 )
 from crabgrass.concepts.idea import IdeaActions, Status
 from crabgrass.concepts.summary import SummaryActions
@@ -27,7 +31,10 @@ from crabgrass.concepts.challenge import ChallengeActions
 from crabgrass.concepts.approach import ApproachActions
 from crabgrass.concepts.coherent_action import CoherentActionActions
 from crabgrass.concepts.user import UserActions
-from crabgrass.services.similarity import SimilarityService
+from crabgrass.services.similarity import get_similarity_service
+from crabgrass.services.similarity_cache import get_cached_similarity_service
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -43,12 +50,17 @@ def get_author_name(author_id: str) -> str:
     return user.name if user else "Unknown"
 
 
+def truncate(text: str, limit: int) -> str:
+    """Shorten text to limit characters, marking the cut with "..."."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
 def get_idea_list_item(idea) -> IdeaListItem:
     """Convert Idea to IdeaListItem with preview."""
     summary = SummaryActions.get_by_idea_id(idea.id)
     summary_preview = None
     if summary and summary.content:
-        summary_preview = summary.content[:100] + "..." if len(summary.content) > 100 else summary.content
+        summary_preview = truncate(summary.content, 100)
 
     return IdeaListItem(
         id=idea.id,
@@ -140,6 +152,33 @@ async def create_idea(data: IdeaCreate):
     return get_idea_detail(idea)
 
 
+@router.post("/similar/batch", response_model=list[list[SimilarIdeaResponse]])
+async def find_similar_ideas_batch(request: SimilarBatchRequest):
+    """Find ideas similar to each of several contents.
+
+    Returns one list of matches per content, in request order.
+    """
+    try:
+        found = await asyncio.to_thread(
+            get_cached_similarity_service().find_similar_for_contents,
+            request.contents,
+            limit=request.limit,
+            exclude_idea_id=request.exclude_idea_id or None,
+        )
+    except Exception as e:
+        # Similarity is optional - degrade to no matches
+        logger.error(f"Error finding similar ideas: {e}", exc_info=True)
+        return [[] for _ in request.contents]
+
+    return [
+        [
+            SimilarIdeaResponse(idea_id=s.idea_id, title=s.title, similarity=s.similarity)
+            for s in similar
+        ]
+        for similar in found
+    ]
+
+
 @router.get("/{idea_id}", response_model=IdeaDetail)
 async def get_idea(idea_id: str):
     """Get full idea details."""
@@ -188,7 +227,7 @@ async def find_similar_ideas(
         raise HTTPException(status_code=404, detail="Idea not found")
 
     try:
-        service = SimilarityService()
+        service = get_similarity_service()
         similar = service.find_similar_for_idea(idea_id=idea_id, limit=limit)
         return [
             SimilarIdeaResponse(
@@ -200,6 +239,7 @@ async def find_similar_ideas(
         ]
     except Exception as e:
         # Log but don't fail - similarity is optional
+        logger.error(f"Error finding similar ideas for {idea_id}: {e}", exc_info=True)
         return []
 
 
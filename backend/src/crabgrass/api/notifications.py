@@ -46,6 +46,8 @@ async def list_notifications(
             related_id=n.related_id,
             read=n.read,
             created_at=n.created_at,
+            template_key=n.template_key.value if n.template_key else None,
+            template_params=n.template_params,
         )
         for n in notifications
     ]
@@ -95,6 +97,8 @@ async def list_all_notifications(
             related_id=n.related_id,
             read=n.read,
             created_at=n.created_at,
+            template_key=n.template_key.value if n.template_key else None,
+            template_params=n.template_params,
         )
         for n in notifications
     ]
@@ -134,6 +138,8 @@ async def notification_event_generator():
                     "related_id": notification.related_id,
                     "read": notification.read,
                     "created_at": notification.created_at.isoformat() if notification.created_at else None,
+                    "template_key": notification.template_key.value if notification.template_key else None,
+                    "template_params": notification.template_params,
                 }
                 yield f"data: {json.dumps(data)}\n\n"
 
@@ -196,6 +202,8 @@ async def mark_notification_read(notification_id: str) -> NotificationResponse:
         related_id=notification.related_id,
         read=notification.read,
         created_at=notification.created_at,
+        template_key=notification.template_key.value if notification.template_key else None,
+        template_params=notification.template_params,
     )
 
 
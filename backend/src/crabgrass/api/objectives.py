@@ -7,7 +7,7 @@ from crabgrass.concepts.idea import IdeaActions
 from crabgrass.concepts.idea_objective import IdeaObjectiveActions
 from crabgrass.concepts.watch import WatchActions
 from crabgrass.concepts.user import UserActions
-from crabgrass.services.similarity import SimilarityService
+from crabgrass.services.similarity import get_similarity_service
 from crabgrass.services.embedding import get_embedding_service
 from crabgrass.api.schemas import (
     ObjectiveCreate,
@@ -34,13 +34,18 @@ def get_author_name(author_id: str) -> str:
     return user.name if user else "Unknown"
 
 
+def truncate(text: str, limit: int) -> str:
+    """Shorten text to limit characters, marking the cut with "..."."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
 def get_objective_list_item(objective) -> ObjectiveListItem:
     """Convert Objective to list item response."""
     idea_count = IdeaObjectiveActions.count_ideas_for_objective(objective.id)
     return ObjectiveListItem(
         id=objective.id,
         title=objective.title,
-        description=objective.description[:200] + "..." if len(objective.description) > 200 else objective.description,
+        description=truncate(objective.description, 200),
         status=objective.status,
         author_id=objective.author_id,
         author_name=get_author_name(objective.author_id),
@@ -203,7 +208,7 @@ async def get_similar_objectives(
     if not objective:
         raise HTTPException(status_code=404, detail="Objective not found")
 
-    similarity_service = SimilarityService()
+    similarity_service = get_similarity_service()
     similar = similarity_service.find_similar_for_objective(
         objective_id=objective_id,
         limit=min(max(1, limit), 20),
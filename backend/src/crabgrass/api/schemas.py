@@ -1,7 +1,7 @@
 """Pydantic schemas for API requests and responses."""
 
 from datetime import datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -184,6 +184,14 @@ class SimilarIdeaResponse(BaseModel):
     similarity: float
 
 
+class SimilarBatchRequest(BaseModel):
+    """Schema for finding ideas similar to several contents at once."""
+
+    contents: list[str] = Field(min_length=1, max_length=100)
+    limit: int = Field(default=5, ge=1, le=20)
+    exclude_idea_id: str | None = None
+
+
 # =============================================================================
 # V2 SCHEMAS
 # =============================================================================
@@ -306,6 +314,8 @@ class NotificationResponse(BaseModel):
     related_id: str | None = None
     read: bool
     created_at: datetime | None = None
+    template_key: str | None = None
+    template_params: dict | None = None
 
 
 class NotificationCountResponse(BaseModel):
@@ -7,7 +7,7 @@ Each concept module defines:
 """
 
 from crabgrass.concepts.user import User, UserActions
-from crabgrass.concepts.idea import Idea, IdeaActions, Status
+from crabgrass.concepts.idea import Idea, IdeaActions, IdeaBundle, Status
 from crabgrass.concepts.summary import Summary, SummaryActions
 from crabgrass.concepts.challenge import Challenge, ChallengeActions
 from crabgrass.concepts.approach import Approach, ApproachActions
@@ -36,6 +36,7 @@ __all__ = [
     # Idea
     "Idea",
     "IdeaActions",
+    "IdeaBundle",
     "Status",
     # Summary
     "Summary",
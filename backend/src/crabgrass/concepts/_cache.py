@@ -0,0 +1,141 @@
+"""Bounded TTL cache for concept point reads.
+
+Background agents re-read the same idea and kernel elements every time an
+item is re-queued. Caching those reads briefly avoids repeat queries. The
+owning concept invalidates entries when it writes, and the TTL bounds
+staleness from writes made outside the concept actions.
+
+Entries are keyed by ID and None results are never cached, so creating a
+row needs no invalidation for point reads; list reads are invalidated by
+the owning concept when it adds a row. Values (and the items of list
+values) are copied in and out so callers can mutate what they get back;
+NumPy array fields such as embeddings are copied too, since a shallow copy
+would share them.
+Concept actions run in worker threads, so every cache guards its entries
+with a lock.
+"""
+
+import copy
+import functools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+import numpy as np
+
+DEFAULT_MAX_SIZE = 4096
+DEFAULT_TTL_SECONDS = 60.0
+
+# Every cache created by ttl_cached, for invalidate_key() and clear_all()
+_caches: list["TTLCache"] = []
+
+
+def _copy_item(item: Any) -> Any:
+    if isinstance(item, np.ndarray):
+        return item.copy()
+
+    item = copy.copy(item)
+    for name, field in getattr(item, "__dict__", {}).items():
+        if isinstance(field, np.ndarray):
+            setattr(item, name, field.copy())
+    return item
+
+
+def _copy(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_copy_item(item) for item in value]
+    return _copy_item(value)
+
+
+class TTLCache:
+    """LRU cache whose entries expire after a fixed number of seconds."""
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any | None:
+        """Return a copy of the cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+
+        # Stored values are never mutated, so copying can happen unlocked
+        return _copy(value)
+
+    def set(self, key: Any, value: Any) -> None:
+        """Store a copy of a value."""
+        entry = (time.monotonic() + self.ttl_seconds, _copy(value))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Any) -> None:
+        """Drop one entry if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+def ttl_cached(
+    max_size: int = DEFAULT_MAX_SIZE,
+    ttl_seconds: float = DEFAULT_TTL_SECONDS,
+) -> Callable:
+    """Cache a single-argument lookup such as get_by_id.
+
+    The wrapped function gains invalidate(key) and cache_clear() helpers.
+    """
+
+    def decorator(func: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        cache = TTLCache(max_size, ttl_seconds)
+        _caches.append(cache)
+
+        @functools.wraps(func)
+        def wrapper(key: Any) -> Any:
+            value = cache.get(key)
+            if value is not None:
+                return value
+
+            value = func(key)
+            if value is not None:
+                cache.set(key, value)
+            return value
+
+        wrapper.invalidate = cache.invalidate
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
+
+
+def invalidate_key(key: Any) -> None:
+    """Drop a key from every concept cache.
+
+    Used by writes that span concepts, such as deleting an idea together
+    with its summary, challenge and approach.
+    """
+    for cache in _caches:
+        cache.invalidate(key)
+
+
+def clear_all() -> None:
+    """Drop every cached entry."""
+    for cache in _caches:
+        cache.clear()
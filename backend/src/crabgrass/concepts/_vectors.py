@@ -0,0 +1,26 @@
+"""Embedding helpers shared by concepts that store vectors.
+
+Embeddings are held as contiguous float32 arrays rather than Python lists,
+which keeps them compact and lets similarity math run in NumPy. Stored
+embeddings are unit length, so cosine similarity is a plain dot product.
+"""
+
+import numpy as np
+
+EMBEDDING_DTYPE = np.float32
+
+
+def to_embedding(value) -> np.ndarray | None:
+    """Convert a stored embedding (DuckDB returns a tuple) to a float32 array."""
+    if value is None:
+        return None
+    return np.asarray(value, dtype=EMBEDDING_DTYPE)
+
+
+def normalize(embedding) -> np.ndarray:
+    """Scale an embedding to unit length. Zero vectors are returned unchanged."""
+    vector = np.asarray(embedding, dtype=EMBEDDING_DTYPE)
+    norm = np.linalg.norm(vector)
+    if norm == 0:
+        return vector
+    return vector / norm
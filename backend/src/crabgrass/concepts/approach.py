@@ -7,6 +7,10 @@ from dataclasses import dataclass
 from datetime import datetime
 from uuid import uuid4
 
+import numpy as np
+
+from crabgrass.concepts._cache import ttl_cached
+from crabgrass.concepts._vectors import normalize, to_embedding
 from crabgrass.database import execute, fetchone
 from crabgrass.syncs.signals import approach_created, approach_updated, approach_deleted
 
@@ -23,7 +27,7 @@ class Approach:
     id: str
     idea_id: str
     content: str
-    embedding: list[float] | None = None  # Populated by sync handler
+    embedding: np.ndarray | None = None  # Populated by sync handler
     created_at: datetime | None = None
     updated_at: datetime | None = None
 
@@ -73,6 +77,7 @@ class ApproachActions:
         return approach
 
     @staticmethod
+    @ttl_cached()
     def get_by_idea_id(idea_id: str) -> Approach | None:
         """Get the approach for an idea."""
         row = fetchone(
@@ -87,7 +92,7 @@ class ApproachActions:
                 id=row[0],
                 idea_id=row[1],
                 content=row[2],
-                embedding=row[3],
+                embedding=to_embedding(row[3]),
                 created_at=row[4],
                 updated_at=row[5],
             )
@@ -108,12 +113,21 @@ class ApproachActions:
                 id=row[0],
                 idea_id=row[1],
                 content=row[2],
-                embedding=row[3],
+                embedding=to_embedding(row[3]),
                 created_at=row[4],
                 updated_at=row[5],
             )
         return None
 
+    @staticmethod
+    def exists_with_embedding(approach_id: str) -> bool:
+        """Check whether an approach exists and has an embedding, without loading it."""
+        row = fetchone(
+            "SELECT 1 FROM approaches WHERE id = ? AND embedding IS NOT NULL",
+            [approach_id],
+        )
+        return row is not None
+
     @staticmethod
     def update(approach_id: str, content: str) -> Approach | None:
         """Update an Approach's content.
@@ -135,6 +149,7 @@ class ApproachActions:
             """,
             [content, now, approach_id],
         )
+        ApproachActions.get_by_idea_id.invalidate(approach.idea_id)
 
         approach.content = content
         approach.updated_at = now
@@ -157,6 +172,7 @@ class ApproachActions:
             return False
 
         execute("DELETE FROM approaches WHERE id = ?", [approach_id])
+        ApproachActions.get_by_idea_id.invalidate(approach.idea_id)
 
         # Emit signal
         approach_deleted.send(
@@ -168,12 +184,14 @@ class ApproachActions:
         return True
 
     @staticmethod
-    def update_embedding(approach_id: str, embedding: list[float]) -> None:
+    def update_embedding(approach_id: str, embedding: np.ndarray) -> None:
         """Update the embedding for an approach.
 
         Called by the embedding sync handler, not directly by users.
         """
-        execute(
-            "UPDATE approaches SET embedding = ? WHERE id = ?",
-            [embedding, approach_id],
+        row = fetchone(
+            "UPDATE approaches SET embedding = ? WHERE id = ? RETURNING idea_id",
+            [normalize(embedding), approach_id],
         )
+        if row:
+            ApproachActions.get_by_idea_id.invalidate(row[0])
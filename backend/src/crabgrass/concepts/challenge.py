@@ -7,6 +7,10 @@ from dataclasses import dataclass
 from datetime import datetime
 from uuid import uuid4
 
+import numpy as np
+
+from crabgrass.concepts._cache import ttl_cached
+from crabgrass.concepts._vectors import normalize, to_embedding
 from crabgrass.database import execute, fetchone
 from crabgrass.syncs.signals import challenge_created, challenge_updated, challenge_deleted
 
@@ -23,7 +27,7 @@ class Challenge:
     id: str
     idea_id: str
     content: str
-    embedding: list[float] | None = None  # Populated by sync handler
+    embedding: np.ndarray | None = None  # Populated by sync handler
     created_at: datetime | None = None
     updated_at: datetime | None = None
 
@@ -73,6 +77,7 @@ class ChallengeActions:
         return challenge
 
     @staticmethod
+    @ttl_cached()
     def get_by_idea_id(idea_id: str) -> Challenge | None:
         """Get the challenge for an idea."""
         row = fetchone(
@@ -87,7 +92,7 @@ class ChallengeActions:
                 id=row[0],
                 idea_id=row[1],
                 content=row[2],
-                embedding=row[3],
+                embedding=to_embedding(row[3]),
                 created_at=row[4],
                 updated_at=row[5],
             )
@@ -108,12 +113,21 @@ class ChallengeActions:
                 id=row[0],
                 idea_id=row[1],
                 content=row[2],
-                embedding=row[3],
+                embedding=to_embedding(row[3]),
                 created_at=row[4],
                 updated_at=row[5],
             )
         return None
 
+    @staticmethod
+    def exists_with_embedding(challenge_id: str) -> bool:
+        """Check whether a challenge exists and has an embedding, without loading it."""
+        row = fetchone(
+            "SELECT 1 FROM challenges WHERE id = ? AND embedding IS NOT NULL",
+            [challenge_id],
+        )
+        return row is not None
+
     @staticmethod
     def update(challenge_id: str, content: str) -> Challenge | None:
         """Update a Challenge's content.
@@ -135,6 +149,7 @@ class ChallengeActions:
             """,
             [content, now, challenge_id],
         )
+        ChallengeActions.get_by_idea_id.invalidate(challenge.idea_id)
 
         challenge.content = content
         challenge.updated_at = now
@@ -157,6 +172,7 @@ class ChallengeActions:
             return False
 
         execute("DELETE FROM challenges WHERE id = ?", [challenge_id])
+        ChallengeActions.get_by_idea_id.invalidate(challenge.idea_id)
 
         # Emit signal
         challenge_deleted.send(
@@ -168,12 +184,14 @@ class ChallengeActions:
         return True
 
     @staticmethod
-    def update_embedding(challenge_id: str, embedding: list[float]) -> None:
+    def update_embedding(challenge_id: str, embedding: np.ndarray) -> None:
         """Update the embedding for a challenge.
 
         Called by the embedding sync handler, not directly by users.
         """
-        execute(
-            "UPDATE challenges SET embedding = ? WHERE id = ?",
-            [embedding, challenge_id],
+        row = fetchone(
+            "UPDATE challenges SET embedding = ? WHERE id = ? RETURNING idea_id",
+            [normalize(embedding), challenge_id],
         )
+        if row:
+            ChallengeActions.get_by_idea_id.invalidate(row[0])
@@ -9,6 +9,7 @@ from datetime import datetime
 from typing import Literal
 from uuid import uuid4
 
+from crabgrass.concepts._cache import ttl_cached
 from crabgrass.database import execute, fetchone, fetchall
 from crabgrass.syncs.signals import action_created, action_updated, action_completed, action_deleted
 
@@ -56,6 +57,7 @@ class CoherentActionActions:
             """,
             [action_id, idea_id, content, "Pending", now, now],
         )
+        CoherentActionActions.list_by_idea_id.invalidate(idea_id)
 
         action = CoherentAction(
             id=action_id,
@@ -76,6 +78,51 @@ class CoherentActionActions:
 
         return action
 
+    @staticmethod
+    def create_many(idea_id: str, contents: list[str]) -> list[CoherentAction]:
+        """Create several CoherentActions for an Idea in one INSERT.
+
+        Emits: action.created (once per action)
+        """
+        if not contents:
+            return []
+
+        now = datetime.utcnow()
+        actions = [
+            CoherentAction(
+                id=str(uuid4()),
+                idea_id=idea_id,
+                content=content,
+                status="Pending",
+                created_at=now,
+                updated_at=now,
+            )
+            for content in contents
+        ]
+
+        placeholders = ", ".join(["(?, ?, ?, ?, ?, ?)" for _ in actions])
+        params = []
+        for action in actions:
+            params.extend([action.id, idea_id, action.content, "Pending", now, now])
+        execute(
+            f"""
+            INSERT INTO coherent_actions (id, idea_id, content, status, created_at, updated_at)
+            VALUES {placeholders}
+            """,
+            params,
+        )
+        CoherentActionActions.list_by_idea_id.invalidate(idea_id)
+
+        for action in actions:
+            action_created.send(
+                None,
+                action_id=action.id,
+                idea_id=idea_id,
+                content=action.content,
+            )
+
+        return actions
+
     @staticmethod
     def get_by_id(action_id: str) -> CoherentAction | None:
         """Get an action by ID."""
@@ -98,6 +145,7 @@ class CoherentActionActions:
         return None
 
     @staticmethod
+    @ttl_cached()
     def list_by_idea_id(idea_id: str) -> list[CoherentAction]:
         """Get all actions for an idea."""
         rows = fetchall(
@@ -154,6 +202,7 @@ class CoherentActionActions:
             f"UPDATE coherent_actions SET {', '.join(updates)} WHERE id = ?",
             params,
         )
+        CoherentActionActions.list_by_idea_id.invalidate(action.idea_id)
 
         action.updated_at = now
 
@@ -191,6 +240,7 @@ class CoherentActionActions:
             return False
 
         execute("DELETE FROM coherent_actions WHERE id = ?", [action_id])
+        CoherentActionActions.list_by_idea_id.invalidate(action.idea_id)
 
         # Emit signal
         action_deleted.send(
@@ -9,6 +9,7 @@ from datetime import datetime
 from typing import Literal
 from uuid import uuid4
 
+from crabgrass.concepts._cache import invalidate_key, ttl_cached
 from crabgrass.database import execute, fetchone, fetchall
 from crabgrass.syncs.signals import idea_created, idea_updated, idea_archived
 
@@ -32,6 +33,16 @@ class Idea:
     updated_at: datetime | None = None
 
 
+@dataclass
+class IdeaBundle:
+    """An idea with the IDs of its kernel elements, None where missing."""
+
+    idea: Idea
+    summary_id: str | None = None
+    challenge_id: str | None = None
+    approach_id: str | None = None
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Actions
 # ─────────────────────────────────────────────────────────────────────────────
@@ -77,6 +88,7 @@ class IdeaActions:
         return idea
 
     @staticmethod
+    @ttl_cached()
     def get_by_id(idea_id: str) -> Idea | None:
         """Get an idea by ID."""
         row = fetchone(
@@ -97,6 +109,94 @@ class IdeaActions:
             )
         return None
 
+    @staticmethod
+    def get_bundle(idea_id: str) -> IdeaBundle | None:
+        """Get an idea and its kernel element IDs in one query."""
+        row = fetchone(
+            """
+            SELECT i.id, i.title, i.status, i.author_id, i.created_at, i.updated_at,
+                   s.id, c.id, a.id
+            FROM ideas i
+            LEFT JOIN summaries s ON s.idea_id = i.id
+            LEFT JOIN challenges c ON c.idea_id = i.id
+            LEFT JOIN approaches a ON a.idea_id = i.id
+            WHERE i.id = ?
+            """,
+            [idea_id],
+        )
+        if row:
+            return IdeaBundle(
+                idea=Idea(
+                    id=row[0],
+                    title=row[1],
+                    status=row[2],
+                    author_id=row[3],
+                    created_at=row[4],
+                    updated_at=row[5],
+                ),
+                summary_id=row[6],
+                challenge_id=row[7],
+                approach_id=row[8],
+            )
+        return None
+
+    @staticmethod
+    def get_many_by_ids(idea_ids: list[str]) -> dict[str, Idea]:
+        """Get several ideas by ID in one query.
+
+        Returns:
+            Mapping of idea ID to Idea. Unknown IDs are omitted.
+        """
+        if not idea_ids:
+            return {}
+
+        placeholders = ", ".join(["?" for _ in idea_ids])
+        rows = fetchall(
+            f"""
+            SELECT id, title, status, author_id, created_at, updated_at
+            FROM ideas WHERE id IN ({placeholders})
+            """,
+            list(idea_ids),
+        )
+        return {
+            row[0]: Idea(
+                id=row[0],
+                title=row[1],
+                status=row[2],
+                author_id=row[3],
+                created_at=row[4],
+                updated_at=row[5],
+            )
+            for row in rows
+        }
+
+    @staticmethod
+    def nascent_status_bulk(idea_ids: list[str]) -> dict[str, bool]:
+        """Report which ideas are nascent (no challenge and no approach yet).
+
+        Args:
+            idea_ids: Ideas to check
+
+        Returns:
+            Mapping of idea ID to True if nascent. Unknown IDs are omitted.
+        """
+        if not idea_ids:
+            return {}
+
+        placeholders = ", ".join(["?" for _ in idea_ids])
+        rows = fetchall(
+            f"""
+            SELECT
+                i.id,
+                NOT EXISTS (SELECT 1 FROM challenges c WHERE c.idea_id = i.id)
+                AND NOT EXISTS (SELECT 1 FROM approaches a WHERE a.idea_id = i.id)
+            FROM ideas i
+            WHERE i.id IN ({placeholders})
+            """,
+            list(idea_ids),
+        )
+        return {row[0]: row[1] for row in rows}
+
     @staticmethod
     def list_all(
         author_id: str | None = None,
@@ -166,6 +266,7 @@ class IdeaActions:
             f"UPDATE ideas SET {', '.join(updates)} WHERE id = ?",
             params,
         )
+        IdeaActions.get_by_id.invalidate(idea_id)
 
         idea.updated_at = now
 
@@ -210,4 +311,7 @@ class IdeaActions:
         # Delete the idea
         execute("DELETE FROM ideas WHERE id = ?", [idea_id])
 
+        # Drop cached reads of the idea and its kernel elements
+        invalidate_key(idea_id)
+
         return True
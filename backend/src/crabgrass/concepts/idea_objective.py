@@ -120,6 +120,21 @@ class IdeaObjectiveActions:
         """Check if a link exists."""
         return IdeaObjectiveActions.get(idea_id, objective_id) is not None
 
+    @staticmethod
+    def has_active_link(idea_id: str) -> bool:
+        """Check if an idea is linked to at least one active objective."""
+        row = fetchone(
+            """
+            SELECT 1
+            FROM idea_objectives io
+            JOIN objectives o ON o.id = io.objective_id
+            WHERE io.idea_id = ? AND o.status = 'Active'
+            LIMIT 1
+            """,
+            [idea_id],
+        )
+        return row is not None
+
     @staticmethod
     def list_by_idea(idea_id: str) -> list[IdeaObjective]:
         """Get all objectives linked to an idea."""
@@ -4,9 +4,11 @@ Notifications are created by background agents when events occur
 that a user should know about.
 """
 
+import json
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from typing import Any
 from uuid import uuid4
 
 from crabgrass.database import execute, fetchone, fetchall
@@ -29,6 +31,34 @@ class NotificationType(str, Enum):
     RECONNECTION_SUGGESTION = "reconnection_suggestion"
 
 
+class NotificationTemplate(str, Enum):
+    """Message templates for notifications fanned out to many watchers.
+
+    Templated notifications store the key and its parameters instead of a
+    rendered message, which is built when the notification is read.
+    """
+
+    IDEA_LINKED = "idea_linked"
+    SUB_OBJECTIVE_CREATED = "sub_objective_created"
+    OBJECTIVE_UPDATED = "objective_updated"
+    OBJECTIVE_RETIRED = "objective_retired"
+    IDEA_ARCHIVED = "idea_archived"
+
+
+TEMPLATES: dict[NotificationTemplate, str] = {
+    NotificationTemplate.IDEA_LINKED: "A new idea '{idea_title}' has been linked to '{objective_title}'",
+    NotificationTemplate.SUB_OBJECTIVE_CREATED: "New sub-objective '{objective_title}' created under '{parent_title}'",
+    NotificationTemplate.OBJECTIVE_UPDATED: "Objective '{objective_title}' has been updated",
+    NotificationTemplate.OBJECTIVE_RETIRED: "Objective '{objective_title}' has been retired",
+    NotificationTemplate.IDEA_ARCHIVED: "Idea '{idea_title}' has been archived",
+}
+
+
+def render_message(template_key: NotificationTemplate | str, template_params: dict[str, Any]) -> str:
+    """Render a template with its parameters."""
+    return TEMPLATES[NotificationTemplate(template_key)].format(**template_params)
+
+
 @dataclass
 class Notification:
     """An alert for a user."""
@@ -42,6 +72,34 @@ class Notification:
     related_id: str | None = None  # Optional related entity
     read: bool = False
     created_at: datetime | None = None
+    template_key: NotificationTemplate | None = None
+    template_params: dict[str, Any] | None = None
+
+
+_COLUMNS = "id, user_id, type, message, source_type, source_id, related_id, read, created_at, template_key, template_params"
+
+
+def _row_to_notification(row: tuple) -> Notification:
+    """Convert a database row to a Notification, rendering templated messages."""
+    template_key = NotificationTemplate(row[9]) if row[9] else None
+    template_params = json.loads(row[10]) if row[10] else None
+    message = row[3]
+    if template_key is not None:
+        message = render_message(template_key, template_params or {})
+
+    return Notification(
+        id=row[0],
+        user_id=row[1],
+        type=NotificationType(row[2]),
+        message=message,
+        source_type=row[4],
+        source_id=row[5],
+        related_id=row[6],
+        read=row[7],
+        created_at=row[8],
+        template_key=template_key,
+        template_params=template_params,
+    )
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -88,28 +146,93 @@ class NotificationActions:
             created_at=now,
         )
 
+    @staticmethod
+    def bulk_create(rows: list[dict]) -> list[Notification]:
+        """Create several notifications in one INSERT.
+
+        Args:
+            rows: One dict per notification with the keyword arguments of create().
+                A row may give template_key and template_params instead of message;
+                its message is then rendered on read rather than stored.
+
+        Returns:
+            The created notifications, in input order
+        """
+        if not rows:
+            return []
+
+        now = datetime.utcnow()
+        notifications = []
+        params = []
+        # Fan-out rows usually share one params dict, so serialize each once
+        params_json: dict[int, str] = {}
+        for row in rows:
+            type = row["type"]
+            template_key = row.get("template_key")
+            template_params = row.get("template_params")
+            stored_params = None
+            if template_key is not None:
+                template_key = NotificationTemplate(template_key)
+                template_params = template_params or {}
+                stored_params = params_json.get(id(template_params))
+                if stored_params is None:
+                    stored_params = params_json[id(template_params)] = json.dumps(template_params)
+
+            notification = Notification(
+                id=str(uuid4()),
+                user_id=row["user_id"],
+                type=type if isinstance(type, NotificationType) else NotificationType(type),
+                message=(
+                    render_message(template_key, template_params)
+                    if template_key is not None
+                    else row["message"]
+                ),
+                source_type=row["source_type"],
+                source_id=row["source_id"],
+                related_id=row.get("related_id"),
+                read=False,
+                created_at=now,
+                template_key=template_key,
+                template_params=template_params,
+            )
+            notifications.append(notification)
+            params.extend([
+                notification.id,
+                notification.user_id,
+                notification.type.value,
+                None if template_key is not None else notification.message,
+                notification.source_type,
+                notification.source_id,
+                notification.related_id,
+                False,
+                now,
+                template_key.value if template_key is not None else None,
+                stored_params,
+            ])
+
+        placeholders = ", ".join(["(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)" for _ in rows])
+        execute(
+            f"""
+            INSERT INTO notifications ({_COLUMNS})
+            VALUES {placeholders}
+            """,
+            params,
+        )
+
+        return notifications
+
     @staticmethod
     def get_by_id(notification_id: str) -> Notification | None:
         """Get a notification by ID."""
         row = fetchone(
-            """
-            SELECT id, user_id, type, message, source_type, source_id, related_id, read, created_at
+            f"""
+            SELECT {_COLUMNS}
             FROM notifications WHERE id = ?
             """,
             [notification_id],
         )
         if row:
-            return Notification(
-                id=row[0],
-                user_id=row[1],
-                type=NotificationType(row[2]),
-                message=row[3],
-                source_type=row[4],
-                source_id=row[5],
-                related_id=row[6],
-                read=row[7],
-                created_at=row[8],
-            )
+            return _row_to_notification(row)
         return None
 
     @staticmethod
@@ -121,8 +244,8 @@ class NotificationActions:
         """List notifications for a user."""
         if unread_only:
             rows = fetchall(
-                """
-                SELECT id, user_id, type, message, source_type, source_id, related_id, read, created_at
+                f"""
+                SELECT {_COLUMNS}
                 FROM notifications
                 WHERE user_id = ? AND read = FALSE
                 ORDER BY created_at DESC
@@ -132,8 +255,8 @@ class NotificationActions:
             )
         else:
             rows = fetchall(
-                """
-                SELECT id, user_id, type, message, source_type, source_id, related_id, read, created_at
+                f"""
+                SELECT {_COLUMNS}
                 FROM notifications
                 WHERE user_id = ?
                 ORDER BY created_at DESC
@@ -142,20 +265,7 @@ class NotificationActions:
                 [user_id, limit],
             )
 
-        return [
-            Notification(
-                id=row[0],
-                user_id=row[1],
-                type=NotificationType(row[2]),
-                message=row[3],
-                source_type=row[4],
-                source_id=row[5],
-                related_id=row[6],
-                read=row[7],
-                created_at=row[8],
-            )
-            for row in rows
-        ]
+        return [_row_to_notification(row) for row in rows]
 
     @staticmethod
     def count_unread(user_id: str) -> int:
@@ -257,8 +367,8 @@ class NotificationActions:
         Returns notifications for all users, sorted by creation time descending.
         """
         rows = fetchall(
-            """
-            SELECT id, user_id, type, message, source_type, source_id, related_id, read, created_at
+            f"""
+            SELECT {_COLUMNS}
             FROM notifications
             ORDER BY created_at DESC
             LIMIT ?
@@ -266,20 +376,7 @@ class NotificationActions:
             [limit],
         )
 
-        return [
-            Notification(
-                id=row[0],
-                user_id=row[1],
-                type=NotificationType(row[2]),
-                message=row[3],
-                source_type=row[4],
-                source_id=row[5],
-                related_id=row[6],
-                read=row[7],
-                created_at=row[8],
-            )
-            for row in rows
-        ]
+        return [_row_to_notification(row) for row in rows]
 
     @staticmethod
     def list_since(since: datetime) -> list["Notification"]:
@@ -288,8 +385,8 @@ class NotificationActions:
         Used for SSE streaming to get new notifications.
         """
         rows = fetchall(
-            """
-            SELECT id, user_id, type, message, source_type, source_id, related_id, read, created_at
+            f"""
+            SELECT {_COLUMNS}
             FROM notifications
             WHERE created_at > ?
             ORDER BY created_at ASC
@@ -297,20 +394,7 @@ class NotificationActions:
             [since],
         )
 
-        return [
-            Notification(
-                id=row[0],
-                user_id=row[1],
-                type=NotificationType(row[2]),
-                message=row[3],
-                source_type=row[4],
-                source_id=row[5],
-                related_id=row[6],
-                read=row[7],
-                created_at=row[8],
-            )
-            for row in rows
-        ]
+        return [_row_to_notification(row) for row in rows]
 
     @staticmethod
     def clear_all() -> int:
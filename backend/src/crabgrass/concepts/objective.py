@@ -9,6 +9,10 @@ from datetime import datetime
 from typing import Literal
 from uuid import uuid4
 
+import numpy as np
+
+from crabgrass.concepts._cache import ttl_cached
+from crabgrass.concepts._vectors import normalize, to_embedding
 from crabgrass.database import execute, fetchone, fetchall
 from crabgrass.syncs.signals import (
     objective_created,
@@ -23,6 +27,45 @@ from crabgrass.syncs.signals import (
 
 ObjectiveStatus = Literal["Active", "Retired"]
 
+# Bumped on every write so in-process caches of objective data can detect staleness
+_version = 0
+
+
+def _bump_version() -> None:
+    global _version
+    _version += 1
+
+
+def _filter_parent(query: str, params: list, parent_id: str | None) -> str:
+    """Filter an objectives query by parent; an empty string means top-level."""
+    if parent_id is None:
+        return query
+    if parent_id == "":
+        return query + " AND parent_id IS NULL"
+    params.append(parent_id)
+    return query + " AND parent_id = ?"
+
+
+def _page(query: str, params: list, limit: int | None, cursor_id: str | None) -> tuple[str, list]:
+    """Order an objectives query newest-updated first and apply keyset paging.
+
+    Raises ValueError if cursor_id is not an existing objective, rather than
+    letting the seek return an empty page.
+    """
+    if cursor_id:
+        if fetchone("SELECT 1 FROM objectives WHERE id = ?", [cursor_id]) is None:
+            raise ValueError(f"Unknown objective cursor: {cursor_id}")
+        query += " AND (updated_at, id) < (SELECT (updated_at, id) FROM objectives WHERE id = ?)"
+        params.append(cursor_id)
+
+    query += " ORDER BY updated_at DESC, id DESC"
+
+    if limit is not None:
+        query += " LIMIT ?"
+        params.append(limit)
+
+    return query, params
+
 
 @dataclass
 class Objective:
@@ -34,7 +77,7 @@ class Objective:
     status: ObjectiveStatus
     author_id: str
     parent_id: str | None = None
-    embedding: list[float] | None = None
+    embedding: np.ndarray | None = None
     created_at: datetime | None = None
     updated_at: datetime | None = None
 
@@ -47,6 +90,11 @@ class Objective:
 class ObjectiveActions:
     """Actions for the Objective concept."""
 
+    @staticmethod
+    def version() -> int:
+        """Return a counter that changes whenever any objective is written."""
+        return _version
+
     @staticmethod
     def create(
         title: str,
@@ -68,6 +116,7 @@ class ObjectiveActions:
             """,
             [objective_id, title, description, "Active", author_id, parent_id, now, now],
         )
+        _bump_version()
 
         objective = Objective(
             id=objective_id,
@@ -93,6 +142,7 @@ class ObjectiveActions:
         return objective
 
     @staticmethod
+    @ttl_cached()
     def get_by_id(objective_id: str) -> Objective | None:
         """Get an objective by ID."""
         row = fetchone(
@@ -110,7 +160,7 @@ class ObjectiveActions:
                 status=row[3],
                 author_id=row[4],
                 parent_id=row[5],
-                embedding=row[6],
+                embedding=to_embedding(row[6]),
                 created_at=row[7],
                 updated_at=row[8],
             )
@@ -121,8 +171,15 @@ class ObjectiveActions:
         status: ObjectiveStatus | None = None,
         author_id: str | None = None,
         parent_id: str | None = None,
+        limit: int | None = None,
+        cursor_id: str | None = None,
     ) -> list[Objective]:
-        """List objectives with optional filters."""
+        """List objectives with optional filters, most recently updated first.
+
+        Pass an empty parent_id for top-level objectives. Pass the last ID of
+        a page as cursor_id to fetch the next page; the seek runs in SQL so
+        earlier pages are never read. Raises ValueError for an unknown cursor.
+        """
         query = """
             SELECT id, title, description, status, author_id, parent_id, embedding, created_at, updated_at
             FROM objectives WHERE 1=1
@@ -137,15 +194,8 @@ class ObjectiveActions:
             query += " AND author_id = ?"
             params.append(author_id)
 
-        if parent_id is not None:
-            if parent_id == "":
-                # Empty string means top-level objectives (no parent)
-                query += " AND parent_id IS NULL"
-            else:
-                query += " AND parent_id = ?"
-                params.append(parent_id)
-
-        query += " ORDER BY updated_at DESC"
+        query = _filter_parent(query, params, parent_id)
+        query, params = _page(query, params, limit, cursor_id)
 
         rows = fetchall(query, params) if params else fetchall(query)
         return [
@@ -156,18 +206,70 @@ class ObjectiveActions:
                 status=row[3],
                 author_id=row[4],
                 parent_id=row[5],
-                embedding=row[6],
+                embedding=to_embedding(row[6]),
                 created_at=row[7],
                 updated_at=row[8],
             )
             for row in rows
         ]
 
+    @staticmethod
+    def list_all_summary(
+        status: ObjectiveStatus | None = None,
+        parent_id: str | None = None,
+        limit: int | None = None,
+        cursor_id: str | None = None,
+        desc_maxlen: int = 200,
+    ) -> list[tuple[str, str, str, ObjectiveStatus, str | None]]:
+        """List (id, title, description, status, parent_id) for display.
+
+        Descriptions longer than desc_maxlen characters are truncated in SQL
+        and end with "...", so long descriptions never leave the database.
+        Filters, ordering and paging match list_all.
+        """
+        query = """
+            SELECT
+                id,
+                title,
+                CASE WHEN length(description) > ? THEN left(description, ?) || '...'
+                     ELSE description END,
+                status,
+                parent_id
+            FROM objectives WHERE 1=1
+        """
+        params: list = [desc_maxlen, desc_maxlen]
+
+        if status:
+            query += " AND status = ?"
+            params.append(status)
+
+        query = _filter_parent(query, params, parent_id)
+        query, params = _page(query, params, limit, cursor_id)
+
+        return [tuple(row) for row in fetchall(query, params)]
+
     @staticmethod
     def list_active() -> list[Objective]:
         """List all active objectives."""
         return ObjectiveActions.list_all(status="Active")
 
+    @staticmethod
+    def list_active_with_embedding() -> list[tuple[str, str, np.ndarray]]:
+        """List (id, title, embedding) for active objectives that have an embedding.
+
+        Skips description and timestamps, and filters missing embeddings in SQL,
+        for callers that only score objectives against a vector.
+        """
+        rows = fetchall(
+            """
+            SELECT id, title, embedding
+            FROM objectives
+            WHERE status = 'Active' AND embedding IS NOT NULL
+            ORDER BY updated_at DESC
+            """
+        )
+        return [(row[0], row[1], to_embedding(row[2])) for row in rows]
+
     @staticmethod
     def get_sub_objectives(objective_id: str) -> list[Objective]:
         """Get child objectives that contribute to this one."""
@@ -217,6 +319,8 @@ class ObjectiveActions:
             f"UPDATE objectives SET {', '.join(updates)} WHERE id = ?",
             params,
         )
+        _bump_version()
+        ObjectiveActions.get_by_id.invalidate(objective_id)
 
         objective.updated_at = now
 
@@ -244,6 +348,8 @@ class ObjectiveActions:
             "UPDATE objectives SET status = ?, updated_at = ? WHERE id = ?",
             ["Retired", now, objective_id],
         )
+        _bump_version()
+        ObjectiveActions.get_by_id.invalidate(objective_id)
 
         objective.status = "Retired"
         objective.updated_at = now
@@ -257,15 +363,17 @@ class ObjectiveActions:
         return objective
 
     @staticmethod
-    def update_embedding(objective_id: str, embedding: list[float]) -> bool:
+    def update_embedding(objective_id: str, embedding: np.ndarray) -> bool:
         """Update the embedding for an objective.
 
         Called by sync handlers after embedding generation.
         """
         result = execute(
             "UPDATE objectives SET embedding = ? WHERE id = ?",
-            [embedding, objective_id],
+            [normalize(embedding), objective_id],
         )
+        _bump_version()
+        ObjectiveActions.get_by_id.invalidate(objective_id)
         return result is not None
 
     @staticmethod
@@ -288,5 +396,8 @@ class ObjectiveActions:
 
         # Delete the objective
         execute("DELETE FROM objectives WHERE id = ?", [objective_id])
+        _bump_version()
+        # Children changed too, so drop every cached objective
+        ObjectiveActions.get_by_id.cache_clear()
 
         return True
@@ -5,14 +5,17 @@ Agents subscribe to relevant queues and process items asynchronously.
 """
 
 import json
+import logging
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import Any, Callable
 from uuid import uuid4
 
 from crabgrass.database import execute, fetchone, fetchall
 
+logger = logging.getLogger(__name__)
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Enums
@@ -55,6 +58,10 @@ class QueueItem:
     processed_at: datetime | None = None
 
 
+# Callbacks run after an item is enqueued, so consumers can wake without polling
+_listeners: dict[QueueName, list[Callable[[], None]]] = {queue: [] for queue in QueueName}
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Helpers
 # ─────────────────────────────────────────────────────────────────────────────
@@ -119,6 +126,12 @@ class QueueActions:
             [item_id, queue.value, _payload_to_json(payload), QueueItemStatus.PENDING.value, 0, now],
         )
 
+        for listener in _listeners[queue]:
+            try:
+                listener()
+            except Exception as e:
+                logger.warning(f"Queue listener for {queue.value} failed: {e}")
+
         return QueueItem(
             id=item_id,
             queue=queue,
@@ -129,6 +142,20 @@ class QueueActions:
             processed_at=None,
         )
 
+    @staticmethod
+    def add_listener(queue: QueueName, callback: Callable[[], None]) -> None:
+        """Call callback after each item is enqueued on a queue.
+
+        Callbacks run on the enqueuing thread and must not block.
+        """
+        _listeners[queue].append(callback)
+
+    @staticmethod
+    def remove_listener(queue: QueueName, callback: Callable[[], None]) -> None:
+        """Stop calling a callback registered with add_listener."""
+        if callback in _listeners[queue]:
+            _listeners[queue].remove(callback)
+
     @staticmethod
     def dequeue(queue: QueueName, limit: int = 10) -> list[QueueItem]:
         """Get pending items from a queue and mark as processing.
@@ -223,6 +250,46 @@ class QueueActions:
         item.attempts += 1
         return item
 
+    @staticmethod
+    def complete_many(item_ids: list[str]) -> None:
+        """Mark several items as completed in one statement.
+
+        Args:
+            item_ids: IDs of the items to complete
+        """
+        if not item_ids:
+            return
+
+        placeholders = ", ".join(["?" for _ in item_ids])
+        execute(
+            f"""
+            UPDATE queue_items
+            SET status = ?, processed_at = ?
+            WHERE id IN ({placeholders})
+            """,
+            [QueueItemStatus.COMPLETED.value, datetime.utcnow()] + item_ids,
+        )
+
+    @staticmethod
+    def fail_many(item_ids: list[str]) -> None:
+        """Mark several items as failed in one statement, incrementing attempts.
+
+        Args:
+            item_ids: IDs of the items that failed
+        """
+        if not item_ids:
+            return
+
+        placeholders = ", ".join(["?" for _ in item_ids])
+        execute(
+            f"""
+            UPDATE queue_items
+            SET status = ?, attempts = attempts + 1
+            WHERE id IN ({placeholders})
+            """,
+            [QueueItemStatus.FAILED.value] + item_ids,
+        )
+
     @staticmethod
     def retry_failed(queue: QueueName, max_attempts: int = 3) -> int:
         """Re-queue failed items that haven't exceeded max attempts.
@@ -193,6 +193,17 @@ class SessionActions:
 
         Emits: session.message_added
         """
+        return SessionActions.add_messages(session_id, [(role, content)])
+
+    @staticmethod
+    def add_messages(
+        session_id: str,
+        messages: list[tuple[Literal["user", "assistant"], str]],
+    ) -> Session | None:
+        """Add several (role, content) messages to a session in one write.
+
+        Emits: session.message_added (once per message)
+        """
         session = SessionActions.get_by_id(session_id)
         if not session:
             return None
@@ -200,13 +211,18 @@ class SessionActions:
         if session.status != "Active":
             return None  # Can't add messages to archived sessions
 
+        if not messages:
+            return session
+
         now = datetime.utcnow()
-        new_message = Message(
-            role=role,
-            content=content,
-            timestamp=now.isoformat(),
-        )
-        session.messages.append(new_message)
+        for role, content in messages:
+            session.messages.append(
+                Message(
+                    role=role,
+                    content=content,
+                    timestamp=now.isoformat(),
+                )
+            )
 
         execute(
             """
@@ -219,15 +235,16 @@ class SessionActions:
 
         session.updated_at = now
 
-        # Emit signal
-        session_message_added.send(
-            None,
-            session_id=session_id,
-            user_id=session.user_id,
-            idea_id=session.idea_id,
-            role=role,
-            content=content,
-        )
+        # Emit signals
+        for role, content in messages:
+            session_message_added.send(
+                None,
+                session_id=session_id,
+                user_id=session.user_id,
+                idea_id=session.idea_id,
+                role=role,
+                content=content,
+            )
 
         return session
 
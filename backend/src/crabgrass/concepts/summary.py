@@ -8,6 +8,10 @@ from dataclasses import dataclass
 from datetime import datetime
 from uuid import uuid4
 
+import numpy as np
+
+from crabgrass.concepts._cache import ttl_cached
+from crabgrass.concepts._vectors import normalize, to_embedding
 from crabgrass.database import execute, fetchone
 from crabgrass.syncs.signals import summary_created, summary_updated
 
@@ -24,7 +28,7 @@ class Summary:
     id: str
     idea_id: str
     content: str
-    embedding: list[float] | None = None  # Populated by sync handler
+    embedding: np.ndarray | None = None  # Populated by sync handler
     created_at: datetime | None = None
     updated_at: datetime | None = None
 
@@ -74,6 +78,7 @@ class SummaryActions:
         return summary
 
     @staticmethod
+    @ttl_cached()
     def get_by_idea_id(idea_id: str) -> Summary | None:
         """Get the summary for an idea."""
         row = fetchone(
@@ -88,7 +93,7 @@ class SummaryActions:
                 id=row[0],
                 idea_id=row[1],
                 content=row[2],
-                embedding=row[3],
+                embedding=to_embedding(row[3]),
                 created_at=row[4],
                 updated_at=row[5],
             )
@@ -109,12 +114,21 @@ class SummaryActions:
                 id=row[0],
                 idea_id=row[1],
                 content=row[2],
-                embedding=row[3],
+                embedding=to_embedding(row[3]),
                 created_at=row[4],
                 updated_at=row[5],
             )
         return None
 
+    @staticmethod
+    def exists_with_embedding(summary_id: str) -> bool:
+        """Check whether a summary exists and has an embedding, without loading it."""
+        row = fetchone(
+            "SELECT 1 FROM summaries WHERE id = ? AND embedding IS NOT NULL",
+            [summary_id],
+        )
+        return row is not None
+
     @staticmethod
     def update(summary_id: str, content: str) -> Summary | None:
         """Update a Summary's content.
@@ -136,6 +150,7 @@ class SummaryActions:
             """,
             [content, now, summary_id],
         )
+        SummaryActions.get_by_idea_id.invalidate(summary.idea_id)
 
         summary.content = content
         summary.updated_at = now
@@ -151,12 +166,14 @@ class SummaryActions:
         return summary
 
     @staticmethod
-    def update_embedding(summary_id: str, embedding: list[float]) -> None:
+    def update_embedding(summary_id: str, embedding: np.ndarray) -> None:
         """Update the embedding for a summary.
 
         Called by the embedding sync handler, not directly by users.
         """
-        execute(
-            "UPDATE summaries SET embedding = ? WHERE id = ?",
-            [embedding, summary_id],
+        row = fetchone(
+            "UPDATE summaries SET embedding = ? WHERE id = ? RETURNING idea_id",
+            [normalize(embedding), summary_id],
         )
+        if row:
+            SummaryActions.get_by_idea_id.invalidate(row[0])
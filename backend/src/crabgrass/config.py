@@ -18,6 +18,13 @@ class Settings(BaseSettings):
     port: int = 8000
     debug: bool = False
 
+    # Persist HNSW indexes in the database file. DuckDB marks this experimental:
+    # index changes are not WAL-logged, so a crash can corrupt the index
+    hnsw_persistence: bool = False
+
+    # Fetch model metadata for each assistant at startup to open the model connection
+    warm_up_agents: bool = False
+
     # CORS
     frontend_url: str = "http://localhost:3000"
 
@@ -1,5 +1,6 @@
 """DuckDB database connection management."""
 
+import threading
 from pathlib import Path
 from contextlib import contextmanager
 from typing import Generator
@@ -12,6 +13,10 @@ from crabgrass.config import get_settings
 # Module-level connection for reuse
 _connection: duckdb.DuckDBPyConnection | None = None
 
+# The shared connection holds one pending result at a time, so a query and
+# its fetch must not interleave with queries from other threads
+_lock = threading.RLock()
+
 
 def get_db_path() -> Path:
     """Get the database file path, ensuring parent directory exists."""
@@ -45,6 +50,10 @@ def _install_extensions(conn: duckdb.DuckDBPyConnection) -> None:
     # VSS extension for vector similarity search
     conn.execute("INSTALL vss")
     conn.execute("LOAD vss")
+    # HNSW indexes on a file-backed database need explicit opt-in; without
+    # it create_indexes() skips them and searches scan the table
+    if get_settings().hnsw_persistence:
+        conn.execute("SET hnsw_enable_experimental_persistence = true")
 
     # DuckPGQ extension for property graph queries
     # Note: As of DuckDB 0.10+, this may be built-in or available via community extensions
@@ -98,9 +107,10 @@ def execute(query: str, parameters: list | None = None) -> duckdb.DuckDBPyConnec
         The connection (for .fetchall(), .fetchone(), etc.)
     """
     conn = get_connection()
-    if parameters:
-        return conn.execute(query, parameters)
-    return conn.execute(query)
+    with _lock:
+        if parameters:
+            return conn.execute(query, parameters)
+        return conn.execute(query)
 
 
 def fetchall(query: str, parameters: list | None = None) -> list:
@@ -113,7 +123,8 @@ def fetchall(query: str, parameters: list | None = None) -> list:
     Returns:
         List of result tuples
     """
-    return execute(query, parameters).fetchall()
+    with _lock:
+        return execute(query, parameters).fetchall()
 
 
 def fetchone(query: str, parameters: list | None = None):
@@ -126,4 +137,5 @@ def fetchone(query: str, parameters: list | None = None):
     Returns:
         Single result tuple or None
     """
-    return execute(query, parameters).fetchone()
+    with _lock:
+        return execute(query, parameters).fetchone()
@@ -98,12 +98,14 @@ CREATE TABLE IF NOT EXISTS notifications (
     id VARCHAR PRIMARY KEY,
     user_id VARCHAR NOT NULL,
     type VARCHAR NOT NULL,
-    message TEXT NOT NULL,
+    message TEXT,  -- NULL when rendered from template_key on read
     source_type VARCHAR NOT NULL,
     source_id VARCHAR NOT NULL,
     related_id VARCHAR,
     read BOOLEAN NOT NULL DEFAULT FALSE,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    template_key VARCHAR,
+    template_params JSON
 );
 
 -- Queue items table (async processing)
@@ -185,6 +187,11 @@ CREATE TABLE IF NOT EXISTS graph_objective_hierarchy (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     PRIMARY KEY (parent_id, child_id)
 );
+-- One-time data migrations already applied to this database
+CREATE TABLE IF NOT EXISTS schema_migrations (
+    name VARCHAR PRIMARY KEY,
+    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
 """
 
 # SQL for creating vector similarity indexes
@@ -194,15 +201,15 @@ INDEX_SQL = """
 
 CREATE INDEX IF NOT EXISTS summaries_embedding_idx
 ON summaries USING HNSW (embedding)
-WITH (metric = 'cosine');
+WITH (metric = 'ip');
 
 CREATE INDEX IF NOT EXISTS challenges_embedding_idx
 ON challenges USING HNSW (embedding)
-WITH (metric = 'cosine');
+WITH (metric = 'ip');
 
 CREATE INDEX IF NOT EXISTS approaches_embedding_idx
 ON approaches USING HNSW (embedding)
-WITH (metric = 'cosine');
+WITH (metric = 'ip');
 
 -- V2 Indexes
 
@@ -225,7 +232,7 @@ ON relationships (to_type, to_id);
 -- Objectives embedding index (for similarity search)
 CREATE INDEX IF NOT EXISTS objectives_embedding_idx
 ON objectives USING HNSW (embedding)
-WITH (metric = 'cosine');
+WITH (metric = 'ip');
 
 -- Graph edge indexes (for efficient traversal)
 CREATE INDEX IF NOT EXISTS idx_graph_similar_ideas_from
@@ -247,6 +254,17 @@ CREATE INDEX IF NOT EXISTS idx_graph_objective_hierarchy_child
 ON graph_objective_hierarchy (child_id);
 """
 
+# HNSW vector indexes, keyed by name, with the table they cover
+VECTOR_INDEXES = {
+    "summaries_embedding_idx": "summaries",
+    "challenges_embedding_idx": "challenges",
+    "approaches_embedding_idx": "approaches",
+    "objectives_embedding_idx": "objectives",
+}
+
+# Migration that unit-normalizes embeddings and rebuilds vector indexes for 'ip'
+INNER_PRODUCT_MIGRATION = "inner_product_embeddings"
+
 
 def init_schema() -> None:
     """Initialize the database schema.
@@ -264,6 +282,89 @@ def init_schema() -> None:
 
     conn.commit()
 
+    migrate_notification_templates()
+    migrate_to_inner_product()
+
+
+def migrate_notification_templates() -> None:
+    """Add template columns to notifications tables created before templates.
+
+    Templated notifications store no rendered message, so message is nullable.
+    """
+    conn = get_connection()
+
+    conn.execute("ALTER TABLE notifications ADD COLUMN IF NOT EXISTS template_key VARCHAR")
+    conn.execute("ALTER TABLE notifications ADD COLUMN IF NOT EXISTS template_params JSON")
+
+    row = conn.execute(
+        """
+        SELECT is_nullable FROM information_schema.columns
+        WHERE table_name = 'notifications' AND column_name = 'message'
+        """
+    ).fetchone()
+    if row and row[0] == "NO":
+        # DuckDB cannot alter a column while an index depends on the table
+        conn.execute("DROP INDEX IF EXISTS idx_notifications_user")
+        conn.execute("ALTER TABLE notifications ALTER COLUMN message DROP NOT NULL")
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_notifications_user "
+            "ON notifications (user_id, read, created_at DESC)"
+        )
+
+    conn.commit()
+
+
+def migrate_to_inner_product() -> None:
+    """Unit-normalize stored embeddings and rebuild HNSW indexes for 'ip'.
+
+    Migration for databases created when embeddings were stored raw and
+    indexed with the cosine metric. CREATE INDEX IF NOT EXISTS never
+    replaces those indexes, so existing ones are dropped and recreated.
+    Runs once per database, recorded in schema_migrations.
+    """
+    conn = get_connection()
+
+    applied = conn.execute(
+        "SELECT 1 FROM schema_migrations WHERE name = ?", [INNER_PRODUCT_MIGRATION]
+    ).fetchone()
+    if applied:
+        return
+
+    existing = {
+        row[0]
+        for row in conn.execute(
+            "SELECT index_name FROM duckdb_indexes() WHERE index_name IN ("
+            + ", ".join("?" for _ in VECTOR_INDEXES)
+            + ")",
+            list(VECTOR_INDEXES),
+        ).fetchall()
+    }
+    for index in existing:
+        conn.execute(f"DROP INDEX {index}")
+
+    for table in VECTOR_INDEXES.values():
+        conn.execute(
+            f"""
+            UPDATE {table}
+            SET embedding = list_transform(
+                embedding, x -> x / sqrt(array_inner_product(embedding, embedding))
+            )::FLOAT[768]
+            WHERE embedding IS NOT NULL
+              AND array_inner_product(embedding, embedding) > 0
+              AND abs(array_inner_product(embedding, embedding) - 1) > 1e-4
+            """
+        )
+
+    # Indexes can only have existed if the vss extension is loaded
+    for index in existing:
+        conn.execute(
+            f"CREATE INDEX {index} ON {VECTOR_INDEXES[index]} "
+            "USING HNSW (embedding) WITH (metric = 'ip')"
+        )
+
+    conn.execute("INSERT INTO schema_migrations (name) VALUES (?)", [INNER_PRODUCT_MIGRATION])
+    conn.commit()
+
 
 def create_indexes() -> None:
     """Create vector similarity indexes.
@@ -294,6 +395,7 @@ def drop_all_tables() -> None:
         "graph_similar_challenges",
         "graph_similar_approaches",
         "graph_objective_hierarchy",
+        "schema_migrations",
         # V2 tables (drop first due to potential references)
         "idea_objectives",
         "watches",
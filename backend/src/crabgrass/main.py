@@ -1,5 +1,6 @@
 """FastAPI application entry point."""
 
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
@@ -9,6 +10,7 @@ from crabgrass.config import get_settings
 from crabgrass.database import init_schema, close_connection
 from crabgrass.syncs import register_all_syncs
 from crabgrass.concepts.user import UserActions
+from crabgrass.services import get_cached_similarity_service
 from crabgrass.api import (
     ideas_router,
     users_router,
@@ -18,6 +20,8 @@ from crabgrass.api import (
     graph_router,
 )
 from crabgrass.agents import (
+    get_idea_assistant,
+    get_objective_assistant,
     get_orchestrator,
     ConnectionAgent,
     NurtureAgent,
@@ -46,19 +50,36 @@ async def lifespan(app: FastAPI):
     print("Sync handlers registered")
 
     # Start background agents (V2)
+    # Agents share the app's similarity service and its result cache
+    similarity_service = get_cached_similarity_service()
     orchestrator = get_orchestrator()
-    orchestrator.register(ConnectionAgent())
-    orchestrator.register(NurtureAgent())
+    orchestrator.register(ConnectionAgent(similarity_service))
+    orchestrator.register(NurtureAgent(similarity_service))
     orchestrator.register(SurfacingAgent())
     orchestrator.register(ObjectiveAgent())
     await orchestrator.start(interval_seconds=5.0)
     print("Background agents started")
 
+    # Warm up chat assistants in the background so startup is not delayed
+    warm_up_task = None
+    if get_settings().warm_up_agents:
+        warm_up_task = asyncio.gather(
+            get_idea_assistant().warm_up(),
+            get_objective_assistant().warm_up(),
+        )
+
     yield
 
     # Shutdown
     print("Shutting down Crabgrass API...")
 
+    if warm_up_task is not None:
+        warm_up_task.cancel()
+        try:
+            await warm_up_task
+        except asyncio.CancelledError:
+            pass
+
     # Stop background agents
     await orchestrator.stop()
     print("Background agents stopped")
@@ -12,7 +12,7 @@ V2 additions:
 
 import logging
 
-from crabgrass.database import init_schema
+from crabgrass.database import init_schema, create_indexes
 from crabgrass.syncs import register_all_syncs
 from crabgrass.concepts.user import UserActions
 from crabgrass.concepts.idea import IdeaActions
@@ -259,12 +259,9 @@ def seed_ideas() -> None:
         logger.info(f"  Created approach {approach.id}")
 
         # Create actions
-        for action_content in idea_data["actions"]:
-            action = CoherentActionActions.create(
-                idea_id=idea.id,
-                content=action_content,
-            )
-            logger.info(f"  Created action {action.id}: {action_content[:40]}...")
+        actions = CoherentActionActions.create_many(idea.id, idea_data["actions"])
+        for action in actions:
+            logger.info(f"  Created action {action.id}: {action.content[:40]}...")
 
         # Update idea status to Active
         IdeaActions.update(idea.id, status="Active")
@@ -418,6 +415,10 @@ def main() -> None:
     seed_idea_objective_links(objective_ids)
     seed_notifications()
 
+    # Build vector indexes now that embeddings exist
+    logger.info("Creating indexes...")
+    create_indexes()
+
     # Verify
     ideas = IdeaActions.list_all()
     objectives = ObjectiveActions.list_all()
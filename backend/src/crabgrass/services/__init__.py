@@ -6,18 +6,30 @@ complex queries (like similarity search).
 
 from crabgrass.services.embedding import (
     EmbeddingService,
+    BatchingEmbedder,
     get_embedding_service,
+    get_batching_embedder,
     EMBEDDING_DIM,
 )
 from crabgrass.services.similarity import (
     SimilarityService,
     SimilarIdea,
+    get_similarity_service,
+)
+from crabgrass.services.similarity_cache import (
+    CachedSimilarityService,
+    get_cached_similarity_service,
 )
 
 __all__ = [
     "EmbeddingService",
+    "BatchingEmbedder",
     "get_embedding_service",
+    "get_batching_embedder",
     "EMBEDDING_DIM",
     "SimilarityService",
     "SimilarIdea",
+    "get_similarity_service",
+    "CachedSimilarityService",
+    "get_cached_similarity_service",
 ]
@@ -3,9 +3,14 @@
 Uses the google-genai SDK to generate text embeddings for semantic search.
 """
 
+import asyncio
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
 from functools import lru_cache
 
+import numpy as np
 from google import genai
 from google.genai import types
 
@@ -15,29 +20,122 @@ logger = logging.getLogger(__name__)
 
 # Embedding dimension for text-embedding-004
 EMBEDDING_DIM = 768
+# Maximum texts per embed_content request
+MAX_API_BATCH = 100
+# Seconds BatchingEmbedder waits for more texts before flushing
+BATCH_WINDOW_SECONDS = 0.01
+# Pending texts that trigger an immediate BatchingEmbedder flush
+MAX_PENDING_TEXTS = 32
+# embed_batch calls BatchingEmbedder lets run at once
+MAX_CONCURRENT_REQUESTS = 4
+# Number of embeddings kept by EmbeddingCache
+EMBEDDING_CACHE_SIZE = 1000
+
+
+class EmbeddingCache:
+    """Thread-safe LRU cache of embeddings keyed on a hash of the text.
+
+    Keys ignore leading, trailing and repeated whitespace, which agents
+    often vary when re-sending the same query.
+
+    Embeddings are deterministic for a given model, so entries never
+    expire; only the least recently used are evicted. Vectors are copied
+    in and out so callers can modify what they get back.
+    """
+
+    def __init__(self, max_size: int = EMBEDDING_CACHE_SIZE):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[bytes, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, text: str) -> np.ndarray | None:
+        """Return the cached embedding for a text, or None on a miss."""
+        key = self._key(text)
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return vector.copy()
+
+    def put(self, text: str, vector: np.ndarray) -> None:
+        """Store the embedding for a text."""
+        key = self._key(text)
+        with self._lock:
+            self._entries[key] = vector.copy()
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        """Return hit, miss and size counters."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+    def clear(self) -> None:
+        """Drop all cached embeddings and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    @staticmethod
+    def _key(text: str) -> bytes:
+        # Texts differing only in whitespace share an entry
+        normalized = " ".join(text.split())
+        return hashlib.blake2b(normalized.encode(), digest_size=16).digest()
+
+
+_shared_cache = EmbeddingCache()
+
+
+@lru_cache(maxsize=1)
+def _get_client(api_key: str) -> genai.Client:
+    """Get the Gemini client shared by every EmbeddingService."""
+    return genai.Client(api_key=api_key)
 
 
 class EmbeddingService:
     """Service for generating text embeddings."""
 
-    def __init__(self):
-        """Initialize the embedding service with API key from settings."""
-        settings = get_settings()
-        self.client = genai.Client(api_key=settings.google_api_key)
+    def __init__(self, cache: EmbeddingCache | None = None, client: genai.Client | None = None):
+        """Initialize the embedding service with API key from settings.
+
+        Sync handlers construct a service per signal, so the Gemini client
+        and cache are shared by default rather than rebuilt each time.
+
+        Args:
+            cache: Embedding cache to use. Defaults to one shared by every
+                EmbeddingService in the process.
+            client: Gemini client to use. Defaults to one shared by every
+                EmbeddingService in the process.
+        """
+        if client is None:
+            client = _get_client(get_settings().google_api_key)
+        self.client = client
         self.model = "text-embedding-004"
+        self.cache = cache if cache is not None else _shared_cache
 
-    def embed(self, text: str) -> list[float]:
+    def embed(self, text: str) -> np.ndarray:
         """Generate embedding for a single text.
 
         Args:
             text: The text to embed.
 
         Returns:
-            List of floats representing the embedding vector (768 dimensions).
+            Unit-length float32 embedding vector (768 dimensions).
         """
         if not text or not text.strip():
             logger.warning("Empty text provided for embedding, returning zero vector")
-            return [0.0] * EMBEDDING_DIM
+            return np.zeros(EMBEDDING_DIM, dtype=np.float32)
+
+        cached = self.cache.get(text)
+        if cached is not None:
+            return cached
 
         try:
             result = self.client.models.embed_content(
@@ -47,27 +145,146 @@ class EmbeddingService:
                     task_type="SEMANTIC_SIMILARITY",
                 ),
             )
-            return list(result.embeddings[0].values)
+            vector = np.asarray(result.embeddings[0].values, dtype=np.float32)
+            # Unit-normalize so cosine similarity reduces to a dot product
+            norm = np.linalg.norm(vector)
+            if norm > 0:
+                vector /= norm
+            self.cache.put(text, vector)
+            return vector
         except Exception as e:
             logger.error(f"Error generating embedding: {e}")
             raise
 
-    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+    def embed_batch(self, texts: list[str]) -> list[np.ndarray]:
         """Generate embeddings for multiple texts.
 
+        Uncached non-empty texts are sent in as few embed_content requests
+        as the API allows; empty texts get a zero vector like embed().
+
         Args:
             texts: List of texts to embed.
 
         Returns:
             List of embedding vectors, one per input text.
         """
-        results = []
-        for text in texts:
-            results.append(self.embed(text))
+        results = [np.zeros(EMBEDDING_DIM, dtype=np.float32) for _ in texts]
+        indexes = []
+        for i, text in enumerate(texts):
+            if not text or not text.strip():
+                continue
+            cached = self.cache.get(text)
+            if cached is None:
+                indexes.append(i)
+            else:
+                results[i] = cached
+
+        try:
+            for start in range(0, len(indexes), MAX_API_BATCH):
+                chunk = indexes[start : start + MAX_API_BATCH]
+                result = self.client.models.embed_content(
+                    model=self.model,
+                    contents=[texts[i] for i in chunk],
+                    config=types.EmbedContentConfig(
+                        task_type="SEMANTIC_SIMILARITY",
+                    ),
+                )
+                vectors = np.asarray([e.values for e in result.embeddings], dtype=np.float32)
+                norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+                vectors /= np.where(norms > 0, norms, 1)
+                for i, vector in zip(chunk, vectors):
+                    results[i] = vector
+                    self.cache.put(texts[i], vector)
+        except Exception as e:
+            logger.error(f"Error generating batch embeddings: {e}")
+            raise
+
         return results
 
 
+class BatchingEmbedder:
+    """Coalesce concurrent embed requests into one embed_batch call.
+
+    Callers await embed_async(); texts arriving within a short window (or
+    until max_pending texts are queued) share a single API request, which
+    runs in a worker thread so the event loop is not blocked. At most
+    max_concurrent requests are in flight; later flushes wait their turn.
+    """
+
+    def __init__(
+        self,
+        service: EmbeddingService | None = None,
+        window_seconds: float = BATCH_WINDOW_SECONDS,
+        max_pending: int = MAX_PENDING_TEXTS,
+        max_concurrent: int = MAX_CONCURRENT_REQUESTS,
+    ):
+        self._service = service
+        self.window_seconds = window_seconds
+        self.max_pending = max_pending
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._pending: list[tuple[str, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        # Strong references so in-flight flushes are not garbage collected
+        self._flushes: set[asyncio.Task] = set()
+
+    async def embed_async(self, text: str) -> np.ndarray:
+        """Embed a text, batched with other concurrent callers.
+
+        Args:
+            text: The text to embed.
+
+        Returns:
+            Unit-length float32 embedding vector (768 dimensions).
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, future))
+
+        if len(self._pending) >= self.max_pending:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window_seconds, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.create_task(self._embed(batch))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+
+    async def _embed(self, batch: list[tuple[str, asyncio.Future]]) -> None:
+        # Identical texts from different callers are embedded once
+        texts = list(dict.fromkeys(text for text, _ in batch))
+        service = self._service or get_embedding_service()
+
+        try:
+            async with self._semaphore:
+                vectors = await asyncio.to_thread(service.embed_batch, texts)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        by_text = dict(zip(texts, vectors))
+        for text, future in batch:
+            if not future.done():
+                future.set_result(by_text[text])
+
+
 @lru_cache(maxsize=1)
 def get_embedding_service() -> EmbeddingService:
     """Get singleton EmbeddingService instance."""
     return EmbeddingService()
+
+
+@lru_cache(maxsize=1)
+def get_batching_embedder() -> BatchingEmbedder:
+    """Get singleton BatchingEmbedder instance."""
+    return BatchingEmbedder()
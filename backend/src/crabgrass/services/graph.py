@@ -10,10 +10,13 @@ Key capabilities:
 - Hybrid ranking (combine similarity score with graph distance)
 """
 
+import heapq
 import logging
 from dataclasses import dataclass
 from typing import Literal
 
+import numpy as np
+
 from crabgrass.database import fetchall
 
 logger = logging.getLogger(__name__)
@@ -223,7 +226,7 @@ class GraphService:
 
     def find_similar_within_scope(
         self,
-        embedding: list[float],
+        embedding: np.ndarray,
         scope_idea_ids: set[str],
         content_type: Literal["summary", "challenge", "approach"] = "summary",
         limit: int = 10,
@@ -257,12 +260,13 @@ class GraphService:
         }
         table = table_map.get(content_type, "summaries")
 
-        # Query with vector similarity and scope filter
+        # Query with vector similarity and scope filter. Embeddings are unit
+        # length, so the inner product is the cosine similarity.
         query = f"""
             SELECT
                 c.idea_id,
                 i.title,
-                1 - array_cosine_distance(c.embedding, ?::FLOAT[768]) as similarity
+                array_inner_product(c.embedding, ?::FLOAT[768]) as similarity
             FROM {table} c
             JOIN ideas i ON c.idea_id = i.id
             WHERE c.embedding IS NOT NULL
@@ -292,7 +296,7 @@ class GraphService:
 
     def find_similar_for_user(
         self,
-        embedding: list[float],
+        embedding: np.ndarray,
         user_id: str,
         content_type: Literal["summary", "challenge", "approach"] = "summary",
         limit: int = 10,
@@ -470,7 +474,7 @@ class GraphService:
 
     def hybrid_search(
         self,
-        embedding: list[float],
+        embedding: np.ndarray,
         user_id: str | None = None,
         boost_shared_objectives: bool = True,
         content_type: Literal["summary", "challenge", "approach"] = "summary",
@@ -501,13 +505,13 @@ class GraphService:
         }
         table = table_map.get(content_type, "summaries")
 
-        # First get vector similarity results
+        # First get vector similarity results (inner product of unit vectors)
         vector_results = fetchall(
             f"""
             SELECT
                 c.idea_id,
                 i.title,
-                1 - array_cosine_distance(c.embedding, ?::FLOAT[768]) as similarity
+                array_inner_product(c.embedding, ?::FLOAT[768]) as similarity
             FROM {table} c
             JOIN ideas i ON c.idea_id = i.id
             WHERE c.embedding IS NOT NULL
@@ -560,9 +564,8 @@ class GraphService:
                 )
             )
 
-        # Sort by combined score and limit
-        results.sort(key=lambda x: x.combined_score, reverse=True)
-        return results[:limit]
+        # Keep the top results by combined score without sorting them all
+        return heapq.nlargest(limit, results, key=lambda x: x.combined_score)
 
     # ─────────────────────────────────────────────────────────────────────────
     # Objective Hierarchy Queries
@@ -1,16 +1,61 @@
 """Similarity service - find related ideas using vector similarity.
 
 Uses DuckDB's vector similarity search (VSS) to find semantically similar content.
+Stored and query embeddings are unit length, so the inner product is the
+cosine similarity.
 """
 
 import logging
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable
+
+import numpy as np
 
 from crabgrass.database import fetchall, fetchone
 from crabgrass.services.embedding import EmbeddingService, get_embedding_service
 
 logger = logging.getLogger(__name__)
 
+# Tables searched by find_similar_batch, keyed by kernel element kind
+KIND_TABLES = {
+    "summary": "summaries",
+    "challenge": "challenges",
+    "approach": "approaches",
+}
+
+# Nearest rows read beyond the requested limit: one for an excluded idea, plus
+# room for duplicate challenge/approach rows, which only the app keeps unique
+NEAREST_SLACK = 5
+
+
+def search_contents(
+    contents: list[str],
+    embed_batch: Callable[[list[str]], list[np.ndarray]],
+    find_similar_batch: Callable[..., list[list]],
+    limit: int = 5,
+    exclude_idea_id: str | None = None,
+) -> list[list]:
+    """Search summaries for each content, embedding and searching duplicates once.
+
+    Takes the embedding and batched search steps as callables so cached and
+    uncached services share the dedup logic.
+    """
+    texts = [content.strip() if content else "" for content in contents]
+    unique = list(dict.fromkeys(text for text in texts if text))
+    if not unique:
+        return [[] for _ in texts]
+
+    found = find_similar_batch(
+        "summary",
+        embed_batch(unique),
+        limit=limit,
+        exclude_idea_ids=[exclude_idea_id] * len(unique),
+    )
+
+    by_text = dict(zip(unique, found))
+    return [list(by_text.get(text, [])) for text in texts]
+
 
 @dataclass
 class SimilarIdea:
@@ -51,9 +96,10 @@ class SimilarityService:
 
     def find_similar_summaries(
         self,
-        embedding: list[float],
+        embedding: np.ndarray,
         limit: int = 5,
         exclude_idea_id: str | None = None,
+        min_similarity: float | None = None,
     ) -> list[SimilarIdea]:
         """Find ideas with similar summaries.
 
@@ -61,42 +107,19 @@ class SimilarityService:
             embedding: The embedding vector to compare against.
             limit: Maximum number of results to return.
             exclude_idea_id: Optional idea ID to exclude from results.
+            min_similarity: Optional floor; lower-scoring rows are filtered in SQL.
 
         Returns:
             List of SimilarIdea results sorted by similarity (highest first).
         """
-        query = """
-        SELECT
-            i.id,
-            i.title,
-            1 - array_cosine_distance(s.embedding, ?::FLOAT[768]) as similarity
-        FROM summaries s
-        JOIN ideas i ON s.idea_id = i.id
-        WHERE s.embedding IS NOT NULL
-        """
-        params = [embedding]
-
-        if exclude_idea_id:
-            query += " AND i.id != ?"
-            params.append(exclude_idea_id)
-
-        query += """
-        ORDER BY similarity DESC
-        LIMIT ?
-        """
-        params.append(limit)
-
-        rows = fetchall(query, params)
-        return [
-            SimilarIdea(idea_id=row[0], title=row[1], similarity=row[2])
-            for row in rows
-        ]
+        return self._find_similar_ideas("summaries", embedding, limit, exclude_idea_id, min_similarity)
 
     def find_similar_challenges(
         self,
-        embedding: list[float],
+        embedding: np.ndarray,
         limit: int = 5,
         exclude_idea_id: str | None = None,
+        min_similarity: float | None = None,
     ) -> list[SimilarIdea]:
         """Find ideas with similar challenges.
 
@@ -104,42 +127,19 @@ class SimilarityService:
             embedding: The embedding vector to compare against.
             limit: Maximum number of results to return.
             exclude_idea_id: Optional idea ID to exclude from results.
+            min_similarity: Optional floor; lower-scoring rows are filtered in SQL.
 
         Returns:
             List of SimilarIdea results sorted by similarity (highest first).
         """
-        query = """
-        SELECT
-            i.id,
-            i.title,
-            1 - array_cosine_distance(c.embedding, ?::FLOAT[768]) as similarity
-        FROM challenges c
-        JOIN ideas i ON c.idea_id = i.id
-        WHERE c.embedding IS NOT NULL
-        """
-        params = [embedding]
-
-        if exclude_idea_id:
-            query += " AND i.id != ?"
-            params.append(exclude_idea_id)
-
-        query += """
-        ORDER BY similarity DESC
-        LIMIT ?
-        """
-        params.append(limit)
-
-        rows = fetchall(query, params)
-        return [
-            SimilarIdea(idea_id=row[0], title=row[1], similarity=row[2])
-            for row in rows
-        ]
+        return self._find_similar_ideas("challenges", embedding, limit, exclude_idea_id, min_similarity)
 
     def find_similar_approaches(
         self,
-        embedding: list[float],
+        embedding: np.ndarray,
         limit: int = 5,
         exclude_idea_id: str | None = None,
+        min_similarity: float | None = None,
     ) -> list[SimilarIdea]:
         """Find ideas with similar approaches.
 
@@ -147,25 +147,58 @@ class SimilarityService:
             embedding: The embedding vector to compare against.
             limit: Maximum number of results to return.
             exclude_idea_id: Optional idea ID to exclude from results.
+            min_similarity: Optional floor; lower-scoring rows are filtered in SQL.
 
         Returns:
             List of SimilarIdea results sorted by similarity (highest first).
         """
-        query = """
+        return self._find_similar_ideas("approaches", embedding, limit, exclude_idea_id, min_similarity)
+
+    def _find_similar_ideas(
+        self,
+        table: str,
+        embedding: np.ndarray,
+        limit: int,
+        exclude_idea_id: str | None,
+        min_similarity: float | None,
+    ) -> list[SimilarIdea]:
+        """Search one kernel element table for the nearest ideas.
+
+        The nearest CTE is an unfiltered ORDER BY ... LIMIT on the embedding
+        column, the shape DuckDB can answer from the table's HNSW index
+        instead of scanning every row. Only summaries have a UNIQUE idea_id;
+        challenges and approaches rely on app-level checks that can race, so
+        rows are grouped per idea and NEAREST_SLACK extra candidates cover
+        duplicates and the excluded idea. The similarity floor only trims
+        the sorted candidates.
+        """
+        query = f"""
+        WITH nearest AS (
+            SELECT idea_id, embedding
+            FROM {table}
+            ORDER BY array_negative_inner_product(embedding, ?::FLOAT[768])
+            LIMIT ?
+        )
         SELECT
             i.id,
             i.title,
-            1 - array_cosine_distance(a.embedding, ?::FLOAT[768]) as similarity
-        FROM approaches a
-        JOIN ideas i ON a.idea_id = i.id
-        WHERE a.embedding IS NOT NULL
+            max(array_inner_product(n.embedding, ?::FLOAT[768])) as similarity
+        FROM nearest n
+        JOIN ideas i ON n.idea_id = i.id
+        WHERE n.embedding IS NOT NULL
         """
-        params = [embedding]
+        params = [embedding, limit + NEAREST_SLACK, embedding]
 
         if exclude_idea_id:
             query += " AND i.id != ?"
             params.append(exclude_idea_id)
 
+        query += " GROUP BY i.id, i.title"
+
+        if min_similarity is not None:
+            query += " HAVING similarity >= ?"
+            params.append(min_similarity)
+
         query += """
         ORDER BY similarity DESC
         LIMIT ?
@@ -215,6 +248,8 @@ class SimilarityService:
                 logger.warning(f"No content for summary of idea {idea_id}")
                 return []
             embedding = self.embedding_service.embed(content)
+        else:
+            embedding = np.asarray(embedding, dtype=np.float32)
 
         return self.find_similar_summaries(
             embedding=embedding,
@@ -222,16 +257,112 @@ class SimilarityService:
             exclude_idea_id=idea_id,
         )
 
+    # ─────────────────────────────────────────────────────────────────────────
+    # Batched Similarity
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def find_similar_batch(
+        self,
+        kind: str,
+        embeddings: list[np.ndarray],
+        limit: int = 5,
+        exclude_idea_ids: list[str | None] | None = None,
+        min_similarity: float | None = None,
+    ) -> list[list[SimilarIdea]]:
+        """Run several similarity searches against one table in a single query.
+
+        Args:
+            kind: Kernel element to search ("summary", "challenge" or "approach").
+            embeddings: Query embedding vectors.
+            limit: Maximum number of results per query.
+            exclude_idea_ids: Optional idea ID to exclude, one per query.
+            min_similarity: Optional floor; lower-scoring rows are filtered in SQL.
+
+        Returns:
+            One list of SimilarIdea results per query, in input order,
+            each sorted by similarity (highest first).
+        """
+        if not embeddings:
+            return []
+
+        table = KIND_TABLES[kind]
+        if exclude_idea_ids is None:
+            exclude_idea_ids = [None] * len(embeddings)
+
+        params = [len(embeddings), list(embeddings), list(exclude_idea_ids)]
+        where = "(q.exclude_idea_id IS NULL OR i.id != q.exclude_idea_id)"
+        if min_similarity is not None:
+            where += " AND similarity >= ?"
+            params.append(min_similarity)
+        params.append(limit)
+
+        query = f"""
+        WITH queries AS (
+            SELECT
+                UNNEST(range(?)) AS query_index,
+                UNNEST(?::FLOAT[768][]) AS embedding,
+                UNNEST(?::VARCHAR[]) AS exclude_idea_id
+        )
+        SELECT
+            q.query_index,
+            i.id,
+            i.title,
+            array_inner_product(t.embedding, q.embedding) as similarity
+        FROM queries q
+        JOIN {table} t ON t.embedding IS NOT NULL
+        JOIN ideas i ON t.idea_id = i.id
+        WHERE {where}
+        QUALIFY row_number() OVER (PARTITION BY q.query_index ORDER BY similarity DESC) <= ?
+        ORDER BY q.query_index, similarity DESC
+        """
+        rows = fetchall(query, params)
+
+        results: list[list[SimilarIdea]] = [[] for _ in embeddings]
+        for row in rows:
+            results[row[0]].append(
+                SimilarIdea(idea_id=row[1], title=row[2], similarity=row[3])
+            )
+        return results
+
+    def find_similar_for_contents(
+        self,
+        contents: list[str],
+        limit: int = 5,
+        exclude_idea_id: str | None = None,
+    ) -> list[list[SimilarIdea]]:
+        """Find ideas whose summaries are similar to each of several contents.
+
+        Contents are stripped and duplicates are embedded and searched once,
+        with one embedding call and one batched query for the whole list.
+
+        Args:
+            contents: Text contents to search for.
+            limit: Maximum number of results per content.
+            exclude_idea_id: Optional idea ID to exclude from every result.
+
+        Returns:
+            One list of SimilarIdea results per content, in input order.
+            Blank contents get an empty list.
+        """
+        return search_contents(
+            contents,
+            self.embedding_service.embed_batch,
+            self.find_similar_batch,
+            limit=limit,
+            exclude_idea_id=exclude_idea_id,
+        )
+
     # ─────────────────────────────────────────────────────────────────────────
     # Objective Similarity (V2)
     # ─────────────────────────────────────────────────────────────────────────
 
     def find_similar_objectives(
         self,
-        embedding: list[float],
+        embedding: np.ndarray,
         limit: int = 5,
         exclude_id: str | None = None,
         active_only: bool = True,
+        min_similarity: float | None = None,
     ) -> list[SimilarObjective]:
         """Find objectives with similar descriptions.
 
@@ -240,6 +371,7 @@ class SimilarityService:
             limit: Maximum number of results to return.
             exclude_id: Optional objective ID to exclude from results.
             active_only: If True, only return active objectives.
+            min_similarity: Optional floor; lower-scoring rows are filtered in SQL.
 
         Returns:
             List of SimilarObjective results sorted by similarity (highest first).
@@ -248,7 +380,7 @@ class SimilarityService:
         SELECT
             o.id,
             o.title,
-            1 - array_cosine_distance(o.embedding, ?::FLOAT[768]) as similarity
+            array_inner_product(o.embedding, ?::FLOAT[768]) as similarity
         FROM objectives o
         WHERE o.embedding IS NOT NULL
         """
@@ -261,6 +393,10 @@ class SimilarityService:
             query += " AND o.id != ?"
             params.append(exclude_id)
 
+        if min_similarity is not None:
+            query += " AND similarity >= ?"
+            params.append(min_similarity)
+
         query += """
         ORDER BY similarity DESC
         LIMIT ?
@@ -310,9 +446,17 @@ class SimilarityService:
                 logger.warning(f"No description for objective {objective_id}")
                 return []
             embedding = self.embedding_service.embed(description)
+        else:
+            embedding = np.asarray(embedding, dtype=np.float32)
 
         return self.find_similar_objectives(
             embedding=embedding,
             limit=limit,
             exclude_id=objective_id,
         )
+
+
+@lru_cache(maxsize=1)
+def get_similarity_service() -> SimilarityService:
+    """Get singleton SimilarityService instance."""
+    return SimilarityService()
@@ -0,0 +1,295 @@
+"""Similarity cache - reuse recent vector search results.
+
+Background agents often search with the same or nearly the same embedding
+when a user edits an idea repeatedly. CachedSimilarityService wraps a
+SimilarityService and serves those repeat queries from memory.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from functools import lru_cache
+from typing import Any, Callable
+
+import numpy as np
+
+from crabgrass.services.similarity import (
+    KIND_TABLES,
+    SimilarityService,
+    get_similarity_service,
+    search_contents,
+)
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of cached result lists
+DEFAULT_MAX_SIZE = 10_000
+# Seconds before a cached result is considered stale
+DEFAULT_TTL_SECONDS = 30.0
+# Cosine similarity at which a different query may reuse a cached result
+APPROXIMATE_HIT_THRESHOLD = 0.995
+# Number of recent queries checked for approximate hits
+RECENT_KEYS = 64
+
+
+class SimilarityCache:
+    """LRU + TTL cache of similarity results keyed on quantized embeddings.
+
+    Safe to share between the event loop and worker threads.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        approximate_threshold: float = APPROXIMATE_HIT_THRESHOLD,
+    ):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.approximate_threshold = approximate_threshold
+        self._entries: OrderedDict[tuple, tuple[float, list]] = OrderedDict()
+        # (scope, normalized query, key) for approximate lookups
+        self._recent: deque[tuple[tuple, np.ndarray, tuple]] = deque(maxlen=RECENT_KEYS)
+        self._lock = threading.RLock()
+
+    def get(self, scope: tuple, embedding) -> list | None:
+        """Return cached results for a query, or None on a miss.
+
+        Args:
+            scope: Search kind plus the non-embedding query arguments.
+            embedding: The query embedding.
+        """
+        vector = np.asarray(embedding, dtype=np.float32)
+        key = self._key(scope, vector)
+        query = self._normalize(vector)
+
+        with self._lock:
+            results = self._lookup(key)
+            if results is not None:
+                return results
+
+            if query is None:
+                return None
+
+            for recent_scope, recent_query, recent_key in reversed(self._recent):
+                if recent_scope != scope:
+                    continue
+                if float(np.dot(query, recent_query)) >= self.approximate_threshold:
+                    results = self._lookup(recent_key)
+                    if results is not None:
+                        logger.debug(f"SimilarityCache: Approximate hit for {scope[0]}")
+                        return results
+
+        return None
+
+    def put(self, scope: tuple, embedding, results: list) -> None:
+        """Store results for a query."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        key = self._key(scope, vector)
+        query = self._normalize(vector)
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, list(results))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+            if query is not None:
+                self._recent.append((scope, query, key))
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._entries.clear()
+            self._recent.clear()
+
+    def _lookup(self, key: tuple) -> list | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, results = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return list(results)
+
+    @staticmethod
+    def _key(scope: tuple, vector: np.ndarray) -> tuple:
+        digest = hashlib.blake2b(vector.astype(np.float16).tobytes(), digest_size=16).digest()
+        return (*scope, digest)
+
+    @staticmethod
+    def _normalize(vector: np.ndarray) -> np.ndarray | None:
+        norm = np.linalg.norm(vector)
+        if norm == 0:
+            return None
+        return vector / norm
+
+
+class CachedSimilarityService:
+    """SimilarityService decorator that caches find_similar_* results.
+
+    Methods without a cache wrapper are delegated to the wrapped service.
+    """
+
+    def __init__(
+        self,
+        service: SimilarityService | None = None,
+        cache: SimilarityCache | None = None,
+    ):
+        self._service = service if service is not None else SimilarityService()
+        self.cache = cache if cache is not None else SimilarityCache()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._service, name)
+
+    def find_similar_summaries(
+        self,
+        embedding: np.ndarray,
+        limit: int = 5,
+        exclude_idea_id: str | None = None,
+        min_similarity: float | None = None,
+    ) -> list:
+        """Cached SimilarityService.find_similar_summaries."""
+        return self._cached(
+            ("summaries", limit, exclude_idea_id, min_similarity),
+            embedding,
+            lambda: self._service.find_similar_summaries(
+                embedding=embedding,
+                limit=limit,
+                exclude_idea_id=exclude_idea_id,
+                min_similarity=min_similarity,
+            ),
+        )
+
+    def find_similar_challenges(
+        self,
+        embedding: np.ndarray,
+        limit: int = 5,
+        exclude_idea_id: str | None = None,
+        min_similarity: float | None = None,
+    ) -> list:
+        """Cached SimilarityService.find_similar_challenges."""
+        return self._cached(
+            ("challenges", limit, exclude_idea_id, min_similarity),
+            embedding,
+            lambda: self._service.find_similar_challenges(
+                embedding=embedding,
+                limit=limit,
+                exclude_idea_id=exclude_idea_id,
+                min_similarity=min_similarity,
+            ),
+        )
+
+    def find_similar_approaches(
+        self,
+        embedding: np.ndarray,
+        limit: int = 5,
+        exclude_idea_id: str | None = None,
+        min_similarity: float | None = None,
+    ) -> list:
+        """Cached SimilarityService.find_similar_approaches."""
+        return self._cached(
+            ("approaches", limit, exclude_idea_id, min_similarity),
+            embedding,
+            lambda: self._service.find_similar_approaches(
+                embedding=embedding,
+                limit=limit,
+                exclude_idea_id=exclude_idea_id,
+                min_similarity=min_similarity,
+            ),
+        )
+
+    def find_similar_objectives(
+        self,
+        embedding: np.ndarray,
+        limit: int = 5,
+        exclude_id: str | None = None,
+        active_only: bool = True,
+        min_similarity: float | None = None,
+    ) -> list:
+        """Cached SimilarityService.find_similar_objectives."""
+        return self._cached(
+            ("objectives", limit, exclude_id, active_only, min_similarity),
+            embedding,
+            lambda: self._service.find_similar_objectives(
+                embedding=embedding,
+                limit=limit,
+                exclude_id=exclude_id,
+                active_only=active_only,
+                min_similarity=min_similarity,
+            ),
+        )
+
+    def find_similar_batch(
+        self,
+        kind: str,
+        embeddings: list[np.ndarray],
+        limit: int = 5,
+        exclude_idea_ids: list[str | None] | None = None,
+        min_similarity: float | None = None,
+    ) -> list[list]:
+        """Cached SimilarityService.find_similar_batch.
+
+        Only the queries that miss the cache are sent to the wrapped service.
+        """
+        if exclude_idea_ids is None:
+            exclude_idea_ids = [None] * len(embeddings)
+
+        # Scopes match the single-query methods so both share cache entries
+        scopes = [(KIND_TABLES[kind], limit, exclude_id, min_similarity) for exclude_id in exclude_idea_ids]
+        results = [self.cache.get(scope, emb) for scope, emb in zip(scopes, embeddings)]
+
+        misses = [i for i, result in enumerate(results) if result is None]
+        if misses:
+            fetched = self._service.find_similar_batch(
+                kind,
+                [embeddings[i] for i in misses],
+                limit=limit,
+                exclude_idea_ids=[exclude_idea_ids[i] for i in misses],
+                min_similarity=min_similarity,
+            )
+            for i, result in zip(misses, fetched):
+                self.cache.put(scopes[i], embeddings[i], result)
+                results[i] = result
+
+        return results
+
+    def find_similar_for_contents(
+        self,
+        contents: list[str],
+        limit: int = 5,
+        exclude_idea_id: str | None = None,
+    ) -> list[list]:
+        """Cached SimilarityService.find_similar_for_contents.
+
+        Embeds with the wrapped service and searches through the cached
+        find_similar_batch above.
+        """
+        return search_contents(
+            contents,
+            self._service.embedding_service.embed_batch,
+            self.find_similar_batch,
+            limit=limit,
+            exclude_idea_id=exclude_idea_id,
+        )
+
+    def _cached(self, scope: tuple, embedding, search: Callable[[], list]) -> list:
+        results = self.cache.get(scope, embedding)
+        if results is not None:
+            return results
+
+        results = search()
+        self.cache.put(scope, embedding, results)
+        return results
+
+
+@lru_cache(maxsize=1)
+def get_cached_similarity_service() -> CachedSimilarityService:
+    """Get singleton CachedSimilarityService wrapping get_similarity_service()."""
+    return CachedSimilarityService(get_similarity_service())
@@ -9,12 +9,16 @@ Provides fixtures for:
 
 import os
 import pytest
+# Import NumPy up front: tests that patch.dict sys.modules would otherwise
+# drop it on exit and trigger a re-import, which NumPy does not support.
+import numpy  # noqa: F401
 from unittest.mock import MagicMock, patch
 from datetime import datetime
 
 # Set test environment before imports
 os.environ["GOOGLE_API_KEY"] = "test-api-key"
 os.environ["DATABASE_PATH"] = ":memory:"
+os.environ["WARM_UP_AGENTS"] = "false"
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -28,7 +32,9 @@ def test_db():
 
     Initializes schema and cleans up after test.
     """
+    from crabgrass.concepts import _cache
     from crabgrass.database import init_schema, close_connection
+    from crabgrass.services.similarity_cache import get_cached_similarity_service
 
     # Initialize fresh schema
     init_schema()
@@ -37,6 +43,8 @@ def test_db():
 
     # Cleanup
     close_connection()
+    get_cached_similarity_service().cache.clear()
+    _cache.clear_all()
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -48,9 +56,10 @@ def test_db():
 def mock_embedding_service():
     """Mock embedding service to avoid Gemini API calls.
 
-    Returns a consistent 768-dimension embedding vector.
+    Returns a consistent unit-length 768-dimension float32 embedding,
+    matching what EmbeddingService.embed produces.
     """
-    mock_embedding = [0.1] * 768
+    mock_embedding = numpy.full(768, 1 / numpy.sqrt(768), dtype=numpy.float32)
 
     with patch("crabgrass.services.embedding.EmbeddingService") as MockClass:
         mock_instance = MagicMock()
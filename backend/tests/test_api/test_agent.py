@@ -32,6 +32,33 @@ class TestAgentChat:
             assert response.status_code == 200
             assert response.headers["content-type"] == "text/event-stream; charset=utf-8"
 
+    def test_chat_records_turn_in_session(self, authenticated_client):
+        """The user message and assistant reply are saved together."""
+        from crabgrass.concepts.session import SessionActions
+
+        session_id = authenticated_client.post("/api/agent/sessions").json()["session_id"]
+
+        async def mock_run(*args, **kwargs):
+            yield {"type": "text_delta", "text": "Hi there"}
+
+        mock_agent = MagicMock()
+        mock_agent.run = mock_run
+
+        with patch("crabgrass.api.agent.get_idea_assistant", return_value=mock_agent), patch.object(
+            SessionActions, "add_messages", wraps=SessionActions.add_messages
+        ) as add_messages:
+            authenticated_client.post(
+                "/api/agent/chat",
+                json={"message": "Hello", "session_id": session_id},
+            )
+
+        add_messages.assert_called_once()
+        messages = authenticated_client.get(f"/api/agent/sessions/{session_id}").json()["messages"]
+        assert [(m["role"], m["content"]) for m in messages] == [
+            ("user", "Hello"),
+            ("assistant", "Hi there"),
+        ]
+
     def test_chat_includes_session_header(self, authenticated_client):
         """Chat response includes session ID in header."""
         with patch("crabgrass.api.agent.get_idea_assistant") as mock_get_agent:
@@ -238,3 +265,30 @@ class TestSSEEventFormat:
             content = response.text
             # Should contain text content events
             assert "Hello" in content or "TEXT_MESSAGE" in content or "delta" in content.lower()
+
+    def test_tool_call_expands_to_start_args_end(self, authenticated_client):
+        """A single tool_call event is streamed as AG-UI start, args and end events."""
+        with patch("crabgrass.api.agent.get_idea_assistant") as mock_get_agent:
+            mock_agent = MagicMock()
+
+            async def mock_run(*args, **kwargs):
+                yield {
+                    "type": "tool_call",
+                    "tool_call_id": "tc-1",
+                    "tool_name": "save_idea",
+                    "args": {"title": "Idea"},
+                }
+
+            mock_agent.run = mock_run
+            mock_get_agent.return_value = mock_agent
+
+            response = authenticated_client.post(
+                "/api/agent/chat",
+                json={"message": "Save it"},
+            )
+
+            content = response.text
+            assert "TOOL_CALL_START" in content
+            assert "TOOL_CALL_ARGS" in content
+            assert "TOOL_CALL_END" in content
+            assert content.index("TOOL_CALL_START") < content.index("TOOL_CALL_END")
@@ -213,3 +213,35 @@ class TestSimilarIdeas:
             params={"limit": 3},
         )
         assert response.status_code == 200
+
+
+class TestSimilarIdeasBatch:
+    """Tests for POST /api/ideas/similar/batch."""
+
+    def test_batch_returns_one_list_per_content(self, authenticated_client, created_idea):
+        """Duplicate contents each get results, in request order."""
+        response = authenticated_client.post(
+            "/api/ideas/similar/batch",
+            json={"contents": ["test summary", " test summary "]},
+        )
+
+        assert response.status_code == 200
+        results = response.json()
+        assert len(results) == 2
+        assert results[0] == results[1]
+        assert any(match["idea_id"] == created_idea for match in results[0])
+
+    def test_batch_excludes_idea(self, authenticated_client, created_idea):
+        """exclude_idea_id removes that idea from every result list."""
+        response = authenticated_client.post(
+            "/api/ideas/similar/batch",
+            json={"contents": ["test summary"], "exclude_idea_id": created_idea},
+        )
+
+        assert response.status_code == 200
+        assert all(match["idea_id"] != created_idea for match in response.json()[0])
+
+    def test_batch_rejects_empty_contents(self, authenticated_client):
+        """At least one content is required."""
+        response = authenticated_client.post("/api/ideas/similar/batch", json={"contents": []})
+        assert response.status_code == 422
@@ -0,0 +1,128 @@
+"""Tests for assistant event streaming helpers.
+
+These tests verify that:
+1. Buffered events arrive in order and source errors reach the consumer
+2. Closing the consumer cancels the background producer
+3. Text deltas are merged without reordering other events or losing text on errors
+"""
+
+import asyncio
+
+import pytest
+
+from crabgrass.agents._shared import buffered
+from crabgrass.api.agent import coalesce_text
+
+
+class TestBuffered:
+    """Tests for the buffered() event pipe."""
+
+    @pytest.mark.asyncio
+    async def test_yields_in_order_then_raises_source_error(self):
+        async def source():
+            for i in range(5):
+                yield i
+            raise ValueError("boom")
+
+        received = []
+        with pytest.raises(ValueError, match="boom"):
+            async for event in buffered(source(), maxsize=2):
+                received.append(event)
+
+        assert received == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_closing_consumer_cancels_producer(self):
+        closed = asyncio.Event()
+
+        async def source():
+            try:
+                while True:
+                    yield "event"
+                    await asyncio.sleep(0)
+            finally:
+                closed.set()
+
+        stream = buffered(source())
+        async for _ in stream:
+            break
+        await stream.aclose()
+
+        assert closed.is_set()
+
+
+class TestCoalesceText:
+    """Tests for the coalesce_text() SSE delta merger."""
+
+    @pytest.mark.asyncio
+    async def test_merges_deltas_and_flushes_before_other_events(self):
+        async def source():
+            for text in ["a", "b", "c"]:
+                yield {"type": "text_delta", "text": text}
+            yield {"type": "tool_call", "tool_name": "save_idea"}
+            yield {"type": "text_delta", "text": "d"}
+
+        events = [event async for event in coalesce_text(source())]
+
+        assert events == [
+            {"type": "text_delta", "text": "abc"},
+            {"type": "tool_call", "tool_name": "save_idea"},
+            {"type": "text_delta", "text": "d"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_flushes_at_min_chars(self):
+        async def source():
+            for _ in range(3):
+                yield {"type": "text_delta", "text": "xx"}
+
+        events = [event async for event in coalesce_text(source(), min_chars=4)]
+
+        assert [event["text"] for event in events] == ["xxxx", "xx"]
+
+    @pytest.mark.asyncio
+    async def test_flushes_pending_text_after_window(self):
+        release = asyncio.Event()
+
+        async def source():
+            yield {"type": "text_delta", "text": "early"}
+            await release.wait()
+            yield {"type": "text_delta", "text": "late"}
+
+        stream = coalesce_text(source(), window=0.01)
+        first = await anext(stream)
+        release.set()
+
+        assert first == {"type": "text_delta", "text": "early"}
+        assert [event async for event in stream] == [{"type": "text_delta", "text": "late"}]
+
+    @pytest.mark.asyncio
+    async def test_flushes_pending_text_before_source_error(self):
+        async def source():
+            yield {"type": "text_delta", "text": "partial"}
+            raise RuntimeError("model failed")
+
+        events = []
+        with pytest.raises(RuntimeError):
+            async for event in coalesce_text(source()):
+                events.append(event)
+
+        assert events == [{"type": "text_delta", "text": "partial"}]
+
+    @pytest.mark.asyncio
+    async def test_closes_source_when_closed_early(self):
+        closed = asyncio.Event()
+
+        async def source():
+            try:
+                yield {"type": "tool_call", "tool_name": "save_idea"}
+                await asyncio.Event().wait()
+                yield {"type": "text_delta", "text": "never"}
+            finally:
+                closed.set()
+
+        stream = coalesce_text(source())
+        await anext(stream)
+        await stream.aclose()
+
+        assert closed.is_set()
@@ -13,6 +13,7 @@ Agents tested:
 """
 
 import pytest
+from contextlib import contextmanager
 from unittest.mock import MagicMock, patch, AsyncMock
 from dataclasses import dataclass
 
@@ -49,6 +50,14 @@ def mock_similarity_match():
     return _create
 
 
+@contextmanager
+def patch_kind_actions(kind: str, name: str):
+    """Patch the concept actions ConnectionAgent uses for one kernel element kind."""
+    with patch(f"crabgrass.agents.background.connection.{name}") as mock_actions, \
+         patch.dict("crabgrass.agents.background.connection.KIND_ACTIONS", {kind: mock_actions}):
+        yield mock_actions
+
+
 @pytest.fixture
 def signal_catcher():
     """Capture signals emitted during tests."""
@@ -81,7 +90,7 @@ class TestConnectionAgent:
         # Mock similarity service to return matches
         similar_match = mock_similarity_match(idea_id="target-idea", similarity=0.85)
 
-        with patch("crabgrass.agents.background.connection.ChallengeActions") as mock_challenge_actions, \
+        with patch_kind_actions("challenge", "ChallengeActions") as mock_challenge_actions, \
              patch("crabgrass.agents.background.connection.SimilarityService") as MockSimilarityService, \
              patch("crabgrass.agents.background.connection.agent_found_similarity") as mock_signal:
 
@@ -112,23 +121,21 @@ class TestConnectionAgent:
             assert call_kwargs["similarity_score"] == 0.85
 
     @pytest.mark.asyncio
-    async def test_skips_low_similarity_matches(self, mock_queue_item, mock_similarity_match):
-        """ConnectionAgent should not emit signals for matches below threshold."""
+    async def test_filters_low_similarity_in_search(self, mock_queue_item):
+        """ConnectionAgent should push the threshold into the search and emit nothing when it returns no matches."""
         mock_challenge = MagicMock()
         mock_challenge.embedding = [0.1] * 768
         mock_challenge.idea_id = "source-idea"
 
-        # Low similarity match (below 0.7 threshold)
-        low_match = mock_similarity_match(idea_id="low-match", similarity=0.5)
-
-        with patch("crabgrass.agents.background.connection.ChallengeActions") as mock_challenge_actions, \
+        with patch_kind_actions("challenge", "ChallengeActions") as mock_challenge_actions, \
              patch("crabgrass.agents.background.connection.SimilarityService") as MockSimilarityService, \
              patch("crabgrass.agents.background.connection.agent_found_similarity") as mock_signal:
 
             mock_challenge_actions.get_by_id.return_value = mock_challenge
 
+            # Matches below the 0.7 threshold are dropped by the query
             mock_service = MagicMock()
-            mock_service.find_similar_challenges.return_value = [low_match]
+            mock_service.find_similar_challenges.return_value = []
             MockSimilarityService.return_value = mock_service
 
             from crabgrass.agents.background.connection import ConnectionAgent
@@ -137,6 +144,8 @@ class TestConnectionAgent:
             item = mock_queue_item(payload={"challenge_id": "chal-1"})
             await agent.process_item(item)
 
+            assert mock_service.find_similar_challenges.call_args[1]["min_similarity"] == 0.7
+
             # Signal should NOT be emitted for low similarity
             mock_signal.send.assert_not_called()
 
@@ -149,7 +158,7 @@ class TestConnectionAgent:
 
         similar_match = mock_similarity_match(idea_id="target-idea", similarity=0.8)
 
-        with patch("crabgrass.agents.background.connection.ApproachActions") as mock_approach_actions, \
+        with patch_kind_actions("approach", "ApproachActions") as mock_approach_actions, \
              patch("crabgrass.agents.background.connection.SimilarityService") as MockSimilarityService, \
              patch("crabgrass.agents.background.connection.agent_found_similarity") as mock_signal:
 
@@ -178,7 +187,7 @@ class TestConnectionAgent:
 
         similar_match = mock_similarity_match(idea_id="target-idea", similarity=0.75)
 
-        with patch("crabgrass.agents.background.connection.SummaryActions") as mock_summary_actions, \
+        with patch_kind_actions("summary", "SummaryActions") as mock_summary_actions, \
              patch("crabgrass.agents.background.connection.SimilarityService") as MockSimilarityService, \
              patch("crabgrass.agents.background.connection.agent_found_similarity") as mock_signal:
 
@@ -204,7 +213,7 @@ class TestConnectionAgent:
         mock_challenge = MagicMock()
         mock_challenge.embedding = None  # No embedding
 
-        with patch("crabgrass.agents.background.connection.ChallengeActions") as mock_challenge_actions, \
+        with patch_kind_actions("challenge", "ChallengeActions") as mock_challenge_actions, \
              patch("crabgrass.agents.background.connection.SimilarityService") as MockSimilarityService, \
              patch("crabgrass.agents.background.connection.agent_found_similarity") as mock_signal:
 
@@ -220,6 +229,88 @@ class TestConnectionAgent:
             MockSimilarityService.return_value.find_similar_challenges.assert_not_called()
             mock_signal.send.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_skips_loading_content_without_embedding(self, mock_queue_item):
+        """ConnectionAgent should not load rows that have no embedding."""
+        with patch_kind_actions("challenge", "ChallengeActions") as mock_challenge_actions, \
+             patch("crabgrass.agents.background.connection.SimilarityService") as MockSimilarityService:
+
+            mock_challenge_actions.exists_with_embedding.return_value = False
+
+            from crabgrass.agents.background.connection import ConnectionAgent
+
+            agent = ConnectionAgent()
+            await agent.process_item(mock_queue_item(payload={"challenge_id": "chal-1"}))
+
+            mock_challenge_actions.get_by_id.assert_not_called()
+            MockSimilarityService.return_value.find_similar_challenges.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_batches_concurrent_searches(self, mock_queue_item, mock_similarity_match):
+        """Concurrent items of the same kind should share one batched search."""
+        import asyncio
+
+        summaries = {
+            "sum-1": MagicMock(embedding=[0.3] * 768, idea_id="idea-1"),
+            "sum-2": MagicMock(embedding=[0.4] * 768, idea_id="idea-2"),
+        }
+
+        with patch_kind_actions("summary", "SummaryActions") as mock_summary_actions, \
+             patch("crabgrass.agents.background.connection.SimilarityService") as MockSimilarityService, \
+             patch("crabgrass.agents.background.connection.agent_found_similarity") as mock_signal:
+
+            mock_summary_actions.get_by_id.side_effect = summaries.get
+
+            mock_service = MagicMock()
+            mock_service.find_similar_batch.return_value = [
+                [mock_similarity_match(idea_id="idea-2", similarity=0.9)],
+                [mock_similarity_match(idea_id="idea-1", similarity=0.9)],
+            ]
+            MockSimilarityService.return_value = mock_service
+
+            from crabgrass.agents.background.connection import ConnectionAgent
+
+            agent = ConnectionAgent()
+            await asyncio.gather(
+                agent.process_item(mock_queue_item("q-1", {"summary_id": "sum-1"})),
+                agent.process_item(mock_queue_item("q-2", {"summary_id": "sum-2"})),
+            )
+
+            mock_service.find_similar_batch.assert_called_once()
+            assert mock_service.find_similar_batch.call_args[1]["exclude_idea_ids"] == ["idea-1", "idea-2"]
+            mock_service.find_similar_summaries.assert_not_called()
+            assert mock_signal.send.call_count == 2
+
+
+    @pytest.mark.asyncio
+    async def test_skips_unchanged_embedding(self, mock_queue_item, mock_similarity_match):
+        """Re-queued content with an unchanged embedding should not be searched again."""
+        summary = MagicMock(embedding=[0.3] * 768, idea_id="idea-1")
+
+        with patch_kind_actions("summary", "SummaryActions") as mock_summary_actions, \
+             patch("crabgrass.agents.background.connection.SimilarityService") as MockSimilarityService, \
+             patch("crabgrass.agents.background.connection.agent_found_similarity") as mock_signal:
+
+            mock_summary_actions.get_by_id.return_value = summary
+
+            mock_service = MagicMock()
+            mock_service.find_similar_summaries.return_value = [
+                mock_similarity_match(idea_id="idea-2", similarity=0.9)
+            ]
+            MockSimilarityService.return_value = mock_service
+
+            from crabgrass.agents.background.connection import ConnectionAgent
+
+            agent = ConnectionAgent()
+            await agent.process_item(mock_queue_item("q-1", {"summary_id": "sum-1"}))
+            await agent.process_item(mock_queue_item("q-2", {"summary_id": "sum-1"}))
+            assert mock_signal.send.call_count == 1
+
+            # A changed embedding is searched again
+            summary.embedding = [0.4] * 768
+            await agent.process_item(mock_queue_item("q-3", {"summary_id": "sum-1"}))
+            assert mock_signal.send.call_count == 2
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # NurtureAgent Tests
@@ -245,9 +336,6 @@ class TestNurtureAgent:
 
         with patch("crabgrass.agents.background.nurture.IdeaActions") as mock_idea_actions, \
              patch("crabgrass.agents.background.nurture.SummaryActions") as mock_summary_actions, \
-             patch("crabgrass.agents.background.nurture.ChallengeActions") as mock_challenge_actions, \
-             patch("crabgrass.agents.background.nurture.ApproachActions") as mock_approach_actions, \
-             patch("crabgrass.agents.background.nurture.ObjectiveActions") as mock_objective_actions, \
              patch("crabgrass.agents.background.nurture.SimilarityService") as MockSimilarityService, \
              patch("crabgrass.agents.background.nurture.QueueActions") as mock_queue_actions:
 
@@ -255,10 +343,7 @@ class TestNurtureAgent:
             mock_summary_actions.get_by_idea_id.return_value = mock_summary
 
             # Both ideas are nascent (no challenge or approach)
-            mock_challenge_actions.get_by_idea_id.return_value = None
-            mock_approach_actions.get_by_idea_id.return_value = None
-
-            mock_objective_actions.list_active.return_value = []
+            mock_idea_actions.nascent_status_bulk.side_effect = lambda ids: {i: True for i in ids}
 
             mock_service = MagicMock()
             mock_service.find_similar_summaries.return_value = [similar_match]
@@ -270,8 +355,9 @@ class TestNurtureAgent:
             item = mock_queue_item(payload={"idea_id": "nascent-idea"})
             await agent.process_item(item)
 
-            # Should have found similar summaries
+            # Should have found similar summaries above threshold
             mock_service.find_similar_summaries.assert_called_once()
+            assert mock_service.find_similar_summaries.call_args[1]["min_similarity"] == 0.65
 
             # Should queue nurture notification
             mock_queue_actions.enqueue.assert_called_once()
@@ -282,14 +368,11 @@ class TestNurtureAgent:
     @pytest.mark.asyncio
     async def test_skips_structured_ideas(self, mock_queue_item):
         """NurtureAgent should skip ideas that already have structure (challenge)."""
-        mock_challenge = MagicMock()  # Idea has a challenge, not nascent
-
-        with patch("crabgrass.agents.background.nurture.ChallengeActions") as mock_challenge_actions, \
-             patch("crabgrass.agents.background.nurture.ApproachActions") as mock_approach_actions, \
+        with patch("crabgrass.agents.background.nurture.IdeaActions") as mock_idea_actions, \
              patch("crabgrass.agents.background.nurture.QueueActions") as mock_queue_actions:
 
-            mock_challenge_actions.get_by_idea_id.return_value = mock_challenge
-            mock_approach_actions.get_by_idea_id.return_value = None
+            # Idea has a challenge, not nascent
+            mock_idea_actions.nascent_status_bulk.return_value = {"structured-idea": False}
 
             from crabgrass.agents.background.nurture import NurtureAgent
 
@@ -312,30 +395,25 @@ class TestNurtureAgent:
         mock_summary.embedding = [0.1] * 768
         mock_summary.idea_id = "nascent-idea"
 
-        # Mock objective with similar embedding
+        # Mock objective match returned by the vector search
         mock_objective = MagicMock()
-        mock_objective.id = "obj-1"
+        mock_objective.objective_id = "obj-1"
         mock_objective.title = "Relevant Objective"
-        mock_objective.embedding = [0.15] * 768  # Similar embedding
+        mock_objective.similarity = 0.9
 
         with patch("crabgrass.agents.background.nurture.IdeaActions") as mock_idea_actions, \
              patch("crabgrass.agents.background.nurture.SummaryActions") as mock_summary_actions, \
-             patch("crabgrass.agents.background.nurture.ChallengeActions") as mock_challenge_actions, \
-             patch("crabgrass.agents.background.nurture.ApproachActions") as mock_approach_actions, \
-             patch("crabgrass.agents.background.nurture.ObjectiveActions") as mock_objective_actions, \
              patch("crabgrass.agents.background.nurture.SimilarityService") as MockSimilarityService, \
              patch("crabgrass.agents.background.nurture.QueueActions") as mock_queue_actions:
 
             mock_idea_actions.get_by_id.return_value = mock_idea
             mock_summary_actions.get_by_idea_id.return_value = mock_summary
 
-            mock_challenge_actions.get_by_idea_id.return_value = None
-            mock_approach_actions.get_by_idea_id.return_value = None
-
-            mock_objective_actions.list_active.return_value = [mock_objective]
+            mock_idea_actions.nascent_status_bulk.side_effect = lambda ids: {i: True for i in ids}
 
             mock_service = MagicMock()
             mock_service.find_similar_summaries.return_value = []  # No similar ideas
+            mock_service.find_similar_objectives.return_value = [mock_objective]
             MockSimilarityService.return_value = mock_service
 
             from crabgrass.agents.background.nurture import NurtureAgent
@@ -348,6 +426,7 @@ class TestNurtureAgent:
             mock_queue_actions.enqueue.assert_called_once()
             payload = mock_queue_actions.enqueue.call_args[1]["payload"]
             assert len(payload["relevant_objectives"]) > 0
+            assert mock_service.find_similar_objectives.call_args[1]["min_similarity"] == 0.6
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -376,9 +455,9 @@ class TestObjectiveAgent:
              patch("crabgrass.agents.background.objective.agent_flag_orphan") as mock_signal:
 
             mock_idea_actions.get_by_id.return_value = mock_idea
-            mock_link_actions.get_objective_ids_for_idea.return_value = []  # No remaining links
+            mock_link_actions.has_active_link.return_value = False  # No remaining links
             mock_summary_actions.get_by_idea_id.return_value = mock_summary
-            mock_objective_actions.list_active.return_value = []  # No objectives to reconnect to
+            mock_objective_actions.list_active_with_embedding.return_value = []  # No objectives to reconnect to
 
             from crabgrass.agents.background.objective import ObjectiveAgent
 
@@ -407,10 +486,7 @@ class TestObjectiveAgent:
         mock_summary.embedding = [0.1] * 768
 
         # Similar objective to reconnect to
-        mock_objective = MagicMock()
-        mock_objective.id = "new-obj"
-        mock_objective.title = "New Objective"
-        mock_objective.embedding = [0.12] * 768  # Similar embedding
+        mock_objective = ("new-obj", "New Objective", [0.12] * 768)
 
         with patch("crabgrass.agents.background.objective.IdeaActions") as mock_idea_actions, \
              patch("crabgrass.agents.background.objective.IdeaObjectiveActions") as mock_link_actions, \
@@ -419,9 +495,9 @@ class TestObjectiveAgent:
              patch("crabgrass.agents.background.objective.agent_suggest_reconnection") as mock_signal:
 
             mock_idea_actions.get_by_id.return_value = mock_idea
-            mock_link_actions.get_objective_ids_for_idea.return_value = []
+            mock_link_actions.has_active_link.return_value = False
             mock_summary_actions.get_by_idea_id.return_value = mock_summary
-            mock_objective_actions.list_active.return_value = [mock_objective]
+            mock_objective_actions.list_active_with_embedding.return_value = [mock_objective]
 
             from crabgrass.agents.background.objective import ObjectiveAgent
 
@@ -444,9 +520,6 @@ class TestObjectiveAgent:
         mock_idea = MagicMock()
         mock_idea.id = "linked-idea"
 
-        mock_objective = MagicMock()
-        mock_objective.status = "Active"
-
         with patch("crabgrass.agents.background.objective.IdeaActions") as mock_idea_actions, \
              patch("crabgrass.agents.background.objective.IdeaObjectiveActions") as mock_link_actions, \
              patch("crabgrass.agents.background.objective.ObjectiveActions") as mock_objective_actions, \
@@ -454,8 +527,7 @@ class TestObjectiveAgent:
              patch("crabgrass.agents.background.objective.agent_suggest_reconnection") as mock_reconnect_signal:
 
             mock_idea_actions.get_by_id.return_value = mock_idea
-            mock_link_actions.get_objective_ids_for_idea.return_value = ["other-obj"]
-            mock_objective_actions.get_by_id.return_value = mock_objective
+            mock_link_actions.has_active_link.return_value = True
 
             from crabgrass.agents.background.objective import ObjectiveAgent
 
@@ -471,6 +543,45 @@ class TestObjectiveAgent:
             mock_reconnect_signal.send.assert_not_called()
 
 
+    def test_reuses_objective_matrix_until_objectives_change(self):
+        """ObjectiveAgent should only reload active objectives after a write."""
+        mock_objective = ("obj-1", "Objective", [0.1] * 768)
+
+        with patch("crabgrass.agents.background.objective.ObjectiveActions") as mock_objective_actions:
+            mock_objective_actions.version.return_value = 1
+            mock_objective_actions.list_active_with_embedding.return_value = [mock_objective]
+
+            from crabgrass.agents.background.objective import ObjectiveAgent
+
+            agent = ObjectiveAgent()
+            agent._active_objective_matrix()
+            ids, _, matrix = agent._active_objective_matrix()
+            assert ids == ["obj-1"]
+            assert matrix.shape == (1, 768)
+            mock_objective_actions.list_active_with_embedding.assert_called_once()
+
+            mock_objective_actions.version.return_value = 2
+            agent._active_objective_matrix()
+            assert mock_objective_actions.list_active_with_embedding.call_count == 2
+
+    def test_reloads_objective_matrix_after_ttl(self):
+        """ObjectiveAgent should reload active objectives once the matrix expires."""
+        from crabgrass.agents.background import objective as objective_module
+
+        with patch.object(objective_module, "ObjectiveActions") as mock_objective_actions, \
+             patch.object(objective_module.time, "monotonic") as mock_monotonic:
+            mock_objective_actions.version.return_value = 1
+            mock_objective_actions.list_active_with_embedding.return_value = []
+            mock_monotonic.return_value = 100.0
+
+            agent = objective_module.ObjectiveAgent()
+            agent._active_objective_matrix()
+
+            mock_monotonic.return_value = 100.0 + objective_module.OBJECTIVE_MATRIX_TTL_SECONDS
+            agent._active_objective_matrix()
+            assert mock_objective_actions.list_active_with_embedding.call_count == 2
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # SurfacingAgent Tests
 # ─────────────────────────────────────────────────────────────────────────────
@@ -510,8 +621,14 @@ class TestSurfacingAgent:
             })
             await agent.process_item(item)
 
-            # Should create notifications for watchers (excluding author)
-            assert mock_notification_actions.create.call_count == 2
+            from crabgrass.concepts.notification import NotificationTemplate
+
+            # Should create notifications for watchers (excluding author) in one call
+            mock_notification_actions.bulk_create.assert_called_once()
+            rows = mock_notification_actions.bulk_create.call_args[0][0]
+            assert [row["user_id"] for row in rows] == ["user-2", "user-3"]
+            assert rows[0]["template_key"] == NotificationTemplate.IDEA_LINKED
+            assert rows[0]["template_params"] is rows[1]["template_params"]
 
     @pytest.mark.asyncio
     async def test_handles_similar_found_event(self, mock_queue_item):
@@ -671,9 +788,37 @@ class TestSurfacingAgent:
             await agent.process_item(item)
 
             # Should only notify user-2 (not user-1 who is the author)
-            assert mock_notification_actions.create.call_count == 1
-            call_kwargs = mock_notification_actions.create.call_args[1]
-            assert call_kwargs["user_id"] == "user-2"
+            rows = mock_notification_actions.bulk_create.call_args[0][0]
+            assert [row["user_id"] for row in rows] == ["user-2"]
+
+    @pytest.mark.asyncio
+    async def test_handles_shared_content_updated_event(self, mock_queue_item):
+        """SurfacingAgent should load related ideas in one call and notify other authors."""
+        source_idea = MagicMock(id="source-idea", author_id="user-1")
+        related = {
+            "idea-2": MagicMock(id="idea-2", title="Other Idea", author_id="user-2"),
+            "idea-3": MagicMock(id="idea-3", title="Own Idea", author_id="user-1"),
+        }
+
+        with patch("crabgrass.agents.background.surfacing.IdeaActions") as mock_idea_actions, \
+             patch("crabgrass.agents.background.surfacing.NotificationActions") as mock_notification_actions:
+
+            mock_idea_actions.get_by_id.return_value = source_idea
+            mock_idea_actions.get_many_by_ids.return_value = related
+
+            from crabgrass.agents.background.surfacing import SurfacingAgent
+
+            agent = SurfacingAgent()
+            item = mock_queue_item(payload={
+                "type": "shared_content_updated",
+                "source_idea_id": "source-idea",
+                "related_idea_ids": ["idea-2", "idea-3"],
+            })
+            await agent.process_item(item)
+
+            mock_idea_actions.get_many_by_ids.assert_called_once_with(["idea-2", "idea-3"])
+            rows = mock_notification_actions.bulk_create.call_args[0][0]
+            assert [row["user_id"] for row in rows] == ["user-2"]
 
     @pytest.mark.asyncio
     async def test_handles_unknown_event_type(self, mock_queue_item, caplog):
@@ -755,6 +900,93 @@ class TestBackgroundAgentBase:
         counts = QueueActions.count_by_status(QueueName.NURTURE)
         assert counts.get(QueueItemStatus.FAILED.value, 0) == 1
 
+    @pytest.mark.asyncio
+    async def test_run_once_coalesces_items_by_key(self, test_db):
+        """run_once should process one item per coalesce key and complete them all."""
+        from crabgrass.concepts.queue import QueueActions, QueueName, QueueItemStatus
+        from crabgrass.agents.runner import BackgroundAgent
+
+        class CoalescingAgent(BackgroundAgent):
+            def __init__(self):
+                super().__init__(QueueName.OBJECTIVE_REVIEW)
+                self.processed_payloads = []
+
+            def coalesce_key(self, item):
+                return item.payload.get("idea_id")
+
+            async def process_item(self, item):
+                self.processed_payloads.append(item.payload)
+
+        QueueActions.enqueue(QueueName.OBJECTIVE_REVIEW, {"idea_id": "idea-1", "retired_objective_id": "obj-1"})
+        QueueActions.enqueue(QueueName.OBJECTIVE_REVIEW, {"idea_id": "idea-2", "retired_objective_id": "obj-1"})
+        QueueActions.enqueue(QueueName.OBJECTIVE_REVIEW, {"idea_id": "idea-1", "retired_objective_id": "obj-2"})
+
+        agent = CoalescingAgent()
+        processed = await agent.run_once(batch_size=10)
+
+        assert processed == 3
+        assert len(agent.processed_payloads) == 2
+        assert {"idea_id": "idea-1", "retired_objective_id": "obj-2"} in agent.processed_payloads
+
+        counts = QueueActions.count_by_status(QueueName.OBJECTIVE_REVIEW)
+        assert counts.get(QueueItemStatus.COMPLETED.value, 0) == 3
+
+    @pytest.mark.asyncio
+    async def test_run_once_respects_concurrency(self, test_db):
+        """run_once should overlap at most `concurrency` items at a time."""
+        import asyncio
+        from crabgrass.concepts.queue import QueueActions, QueueName
+        from crabgrass.agents.runner import BackgroundAgent
+
+        class LimitedAgent(BackgroundAgent):
+            concurrency = 2
+
+            def __init__(self):
+                super().__init__(QueueName.CONNECTION)
+                self.active = 0
+                self.peak = 0
+
+            async def process_item(self, item):
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+                await asyncio.sleep(0.01)
+                self.active -= 1
+
+        for i in range(5):
+            QueueActions.enqueue(QueueName.CONNECTION, {"n": i})
+
+        agent = LimitedAgent()
+        processed = await agent.run_once(batch_size=10)
+
+        assert processed == 5
+        assert agent.peak == 2
+
+    @pytest.mark.asyncio
+    async def test_run_loop_wakes_on_enqueue(self, test_db):
+        """run_loop should pick up a new item without waiting for the poll interval."""
+        import asyncio
+        from crabgrass.concepts.queue import QueueActions, QueueName
+        from crabgrass.agents.runner import BackgroundAgent
+
+        class WaitingAgent(BackgroundAgent):
+            def __init__(self):
+                super().__init__(QueueName.SURFACING)
+                self.processed = asyncio.Event()
+
+            async def process_item(self, item):
+                self.processed.set()
+
+        agent = WaitingAgent()
+        task = asyncio.create_task(agent.run_loop(interval_seconds=60))
+        try:
+            await asyncio.sleep(0.05)
+            QueueActions.enqueue(QueueName.SURFACING, {"test": "data"})
+            await asyncio.wait_for(agent.processed.wait(), timeout=2)
+        finally:
+            agent.stop()
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
     @pytest.mark.asyncio
     async def test_run_once_returns_zero_when_empty(self, test_db):
         """run_once should return 0 when queue is empty."""
@@ -814,7 +1046,7 @@ class TestAgentQueueIntegration:
     async def test_surfacing_agent_creates_notifications(self, test_db, mock_embedding_service):
         """SurfacingAgent should create real notifications."""
         from crabgrass.concepts.queue import QueueActions, QueueName
-        from crabgrass.concepts.notification import NotificationActions
+        from crabgrass.concepts.notification import NotificationActions, NotificationTemplate
         from crabgrass.concepts.idea import IdeaActions
         from crabgrass.concepts.objective import ObjectiveActions
         from crabgrass.concepts.watch import WatchActions
@@ -849,3 +1081,4 @@ class TestAgentQueueIntegration:
         assert len(notifications) == 1
         assert "Linked Idea" in notifications[0].message
         assert "Team Goal" in notifications[0].message
+        assert notifications[0].template_key == NotificationTemplate.IDEA_LINKED
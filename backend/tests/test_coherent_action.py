@@ -0,0 +1,62 @@
+"""Tests for CoherentActionActions.create_many.
+
+These tests verify that:
+1. Every action is inserted in one call
+2. action.created is sent once per action
+3. The cached action list for the idea is invalidated
+"""
+
+import pytest
+
+
+@pytest.fixture
+def idea(test_db, mock_embedding_service):
+    """Create an idea to attach actions to."""
+    from crabgrass.concepts.idea import IdeaActions
+
+    return IdeaActions.create(title="Action Idea", author_id="user-sarah")
+
+
+class TestCreateMany:
+    """Tests for bulk action inserts."""
+
+    def test_inserts_every_action(self, idea):
+        from crabgrass.concepts.coherent_action import CoherentActionActions
+        from crabgrass.database import fetchall
+
+        actions = CoherentActionActions.create_many(idea.id, ["First step", "Second step"])
+
+        rows = fetchall(
+            "SELECT id, content, status FROM coherent_actions WHERE idea_id = ? ORDER BY content",
+            [idea.id],
+        )
+        assert rows == [(a.id, a.content, "Pending") for a in actions]
+
+    def test_empty_contents_inserts_nothing(self, idea):
+        from crabgrass.concepts.coherent_action import CoherentActionActions
+
+        assert CoherentActionActions.create_many(idea.id, []) == []
+        assert CoherentActionActions.list_by_idea_id(idea.id) == []
+
+    def test_sends_action_created_per_action(self, idea, signal_recorder):
+        from crabgrass.concepts.coherent_action import CoherentActionActions
+        from crabgrass.syncs.signals import action_created
+
+        recorded, connect = signal_recorder
+        handler = connect("action.created")
+        action_created.connect(handler)
+        try:
+            actions = CoherentActionActions.create_many(idea.id, ["First step", "Second step"])
+        finally:
+            action_created.disconnect(handler)
+
+        assert [r["action_id"] for r in recorded] == [a.id for a in actions]
+        assert all(r["idea_id"] == idea.id for r in recorded)
+
+    def test_invalidates_cached_action_list(self, idea):
+        from crabgrass.concepts.coherent_action import CoherentActionActions
+
+        assert CoherentActionActions.list_by_idea_id(idea.id) == []
+        CoherentActionActions.create_many(idea.id, ["First step", "Second step"])
+
+        assert len(CoherentActionActions.list_by_idea_id(idea.id)) == 2
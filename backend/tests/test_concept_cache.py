@@ -0,0 +1,121 @@
+"""Tests for cached concept reads.
+
+These tests verify that:
+1. Cached point reads avoid repeat queries
+2. Concept writes invalidate the affected entries
+3. Callers cannot mutate cached state
+"""
+
+import pytest
+from unittest.mock import patch
+
+from crabgrass.concepts._cache import TTLCache
+
+
+@pytest.fixture
+def idea(test_db, mock_embedding_service):
+    """Create an idea with a summary and challenge."""
+    from crabgrass.concepts.idea import IdeaActions
+    from crabgrass.concepts.summary import SummaryActions
+    from crabgrass.concepts.challenge import ChallengeActions
+
+    idea = IdeaActions.create(title="Cached Idea", author_id="user-sarah")
+    SummaryActions.create(idea_id=idea.id, content="A summary")
+    ChallengeActions.create(idea_id=idea.id, content="A challenge")
+    return idea
+
+
+class TestTTLCache:
+    """Tests for the TTLCache container."""
+
+    def test_expired_entries_are_dropped(self):
+        cache = TTLCache(ttl_seconds=0)
+        cache.set("key", "value")
+        assert cache.get("key") is None
+
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+
+
+class TestConceptCaching:
+    """Tests for ttl_cached concept actions against the database."""
+
+    def test_get_by_id_is_cached(self, idea):
+        from crabgrass.concepts import idea as idea_module
+        from crabgrass.concepts.idea import IdeaActions
+
+        IdeaActions.get_by_id(idea.id)
+        with patch.object(idea_module, "fetchone") as mock_fetchone:
+            assert IdeaActions.get_by_id(idea.id).id == idea.id
+            mock_fetchone.assert_not_called()
+
+    def test_update_invalidates_idea(self, idea):
+        from crabgrass.concepts.idea import IdeaActions
+
+        IdeaActions.get_by_id(idea.id)
+        IdeaActions.update(idea.id, title="Renamed")
+        assert IdeaActions.get_by_id(idea.id).title == "Renamed"
+
+    def test_update_embedding_invalidates_summary(self, idea):
+        from crabgrass.concepts.summary import SummaryActions
+
+        summary = SummaryActions.get_by_idea_id(idea.id)
+        SummaryActions.update_embedding(summary.id, [0.0] * 767 + [1.0])
+        assert SummaryActions.get_by_idea_id(idea.id).embedding[-1] == 1.0
+
+    def test_cached_values_are_copies(self, idea):
+        from crabgrass.concepts.idea import IdeaActions
+
+        IdeaActions.get_by_id(idea.id).title = "Mutated"
+        assert IdeaActions.get_by_id(idea.id).title == idea.title
+
+    def test_cached_embeddings_are_copies(self, idea):
+        from crabgrass.concepts.summary import SummaryActions
+
+        summary = SummaryActions.get_by_idea_id(idea.id)
+        SummaryActions.update_embedding(summary.id, [1.0] + [0.0] * 767)
+        SummaryActions.get_by_idea_id(idea.id).embedding[0] = 5.0
+        assert SummaryActions.get_by_idea_id(idea.id).embedding[0] == 1.0
+
+    def test_delete_invalidates_kernel_elements(self, idea):
+        from crabgrass.concepts.idea import IdeaActions
+        from crabgrass.concepts.challenge import ChallengeActions
+
+        assert ChallengeActions.get_by_idea_id(idea.id) is not None
+        IdeaActions.delete(idea.id)
+        assert IdeaActions.get_by_id(idea.id) is None
+        assert ChallengeActions.get_by_idea_id(idea.id) is None
+
+    def test_objective_update_invalidates(self, test_db, mock_embedding_service):
+        from crabgrass.concepts.objective import ObjectiveActions
+
+        objective = ObjectiveActions.create(title="Goal", description="A goal", author_id="user-sarah")
+        ObjectiveActions.get_by_id(objective.id)
+        ObjectiveActions.update(objective.id, title="Renamed goal")
+        assert ObjectiveActions.get_by_id(objective.id).title == "Renamed goal"
+
+    def test_action_list_is_invalidated_by_writes(self, idea):
+        from crabgrass.concepts.coherent_action import CoherentActionActions
+
+        assert CoherentActionActions.list_by_idea_id(idea.id) == []
+        action = CoherentActionActions.create(idea_id=idea.id, content="First step")
+        assert [a.id for a in CoherentActionActions.list_by_idea_id(idea.id)] == [action.id]
+
+        CoherentActionActions.complete(action.id)
+        assert CoherentActionActions.list_by_idea_id(idea.id)[0].status == "Complete"
+
+        CoherentActionActions.delete(action.id)
+        assert CoherentActionActions.list_by_idea_id(idea.id) == []
+
+    def test_cached_list_items_are_copies(self, idea):
+        from crabgrass.concepts.coherent_action import CoherentActionActions
+
+        CoherentActionActions.create(idea_id=idea.id, content="First step")
+        CoherentActionActions.list_by_idea_id(idea.id)[0].content = "Mutated"
+        assert CoherentActionActions.list_by_idea_id(idea.id)[0].content == "First step"
@@ -0,0 +1,172 @@
+"""Tests for batched and cached embedding requests.
+
+These tests verify that:
+1. Concurrent embed_async calls share one embed_batch call
+2. Batch errors reach every waiting caller
+3. Concurrent embed_batch calls are capped
+4. Repeated texts are served from the embedding cache
+5. save_idea embeds its kernel elements in one batch
+"""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from crabgrass.services import embedding
+from crabgrass.services.embedding import BatchingEmbedder, EmbeddingCache, EmbeddingService
+
+
+def make_service():
+    service = MagicMock()
+    service.embed_batch.side_effect = lambda texts: [np.full(768, len(t), dtype=np.float32) for t in texts]
+    return service
+
+
+class TestBatchingEmbedder:
+    """Tests for BatchingEmbedder."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_batch(self):
+        service = make_service()
+        embedder = BatchingEmbedder(service)
+
+        vectors = await asyncio.gather(
+            embedder.embed_async("a"),
+            embedder.embed_async("bb"),
+            embedder.embed_async("a"),
+        )
+
+        service.embed_batch.assert_called_once_with(["a", "bb"])
+        assert [v[0] for v in vectors] == [1, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_flushes_when_max_pending_reached(self):
+        service = make_service()
+        embedder = BatchingEmbedder(service, window_seconds=60, max_pending=2)
+
+        await asyncio.gather(embedder.embed_async("a"), embedder.embed_async("b"))
+
+        service.embed_batch.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_caller(self):
+        service = MagicMock()
+        service.embed_batch.side_effect = RuntimeError("quota")
+        embedder = BatchingEmbedder(service)
+
+        results = await asyncio.gather(
+            embedder.embed_async("a"),
+            embedder.embed_async("b"),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_caps_concurrent_requests(self):
+        lock = threading.Lock()
+        active = peak = 0
+
+        def embed_batch(texts):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+            return [np.zeros(768, dtype=np.float32) for _ in texts]
+
+        service = MagicMock()
+        service.embed_batch.side_effect = embed_batch
+        embedder = BatchingEmbedder(service, max_pending=1, max_concurrent=2)
+
+        await asyncio.gather(*(embedder.embed_async(str(i)) for i in range(6)))
+
+        assert service.embed_batch.call_count == 6
+        assert peak <= 2
+
+
+@pytest.fixture
+def service():
+    """EmbeddingService with a private cache and a fake Gemini client."""
+    client = MagicMock()
+    client.models.embed_content.side_effect = lambda model, contents, config: SimpleNamespace(
+        embeddings=[
+            SimpleNamespace(values=[3.0, 4.0] + [0.0] * 766)
+            for _ in (contents if isinstance(contents, list) else [contents])
+        ]
+    )
+    return EmbeddingService(cache=EmbeddingCache(), client=client)
+
+
+class TestEmbeddingCache:
+    """Tests for EmbeddingService caching."""
+
+    def test_repeated_text_hits_cache(self, service):
+        first = service.embed("same text")
+        second = service.embed("same text")
+
+        assert service.client.models.embed_content.call_count == 1
+        assert np.array_equal(first, second)
+        assert service.cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+    def test_whitespace_variants_share_entry(self, service):
+        service.embed("same text")
+        service.embed("  same   text\n")
+
+        assert service.client.models.embed_content.call_count == 1
+
+    def test_cached_vectors_are_copies(self, service):
+        service.embed("same text")[:] = 0
+        assert service.embed("same text")[0] == pytest.approx(0.6)
+
+    def test_batch_only_requests_uncached_texts(self, service):
+        service.embed("a")
+        service.embed_batch(["a", "b", ""])
+
+        last_call = service.client.models.embed_content.call_args
+        assert last_call.kwargs["contents"] == ["b"]
+
+    def test_evicts_least_recently_used(self):
+        cache = EmbeddingCache(max_size=2)
+        vector = np.zeros(768, dtype=np.float32)
+        cache.put("a", vector)
+        cache.put("b", vector)
+        cache.get("a")
+        cache.put("c", vector)
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+
+    def test_services_share_one_client(self):
+        with patch("crabgrass.services.embedding.genai.Client") as MockClient:
+            embedding._get_client.cache_clear()
+            try:
+                assert EmbeddingService().client is EmbeddingService().client
+                MockClient.assert_called_once()
+            finally:
+                embedding._get_client.cache_clear()
+
+
+class TestSaveIdeaPrefetch:
+    """Tests for batched embedding of save_idea kernel elements."""
+
+    def test_kernel_elements_are_embedded_in_one_batch(self, test_db, test_user, mock_embedding_service):
+        from crabgrass.agents import tools
+
+        batch_service = MagicMock()
+        with patch.object(tools, "get_embedding_service", return_value=batch_service):
+            result = tools.save_idea(
+                title="Batched idea",
+                summary="A summary",
+                challenge="A challenge",
+                approach="An approach",
+            )
+
+        assert result["success"]
+        batch_service.embed_batch.assert_called_once_with(["A summary", "A challenge", "An approach"])
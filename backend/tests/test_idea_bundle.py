@@ -0,0 +1,96 @@
+"""Tests for IdeaActions.get_bundle and the save_idea update path.
+
+These tests verify that:
+1. get_bundle returns the kernel element IDs an idea has, None for the rest
+2. save_idea updates existing kernel elements and creates missing ones
+"""
+
+import pytest
+
+
+@pytest.fixture
+def idea(test_db, mock_embedding_service):
+    """Create an idea with no kernel elements."""
+    from crabgrass.concepts.idea import IdeaActions
+
+    return IdeaActions.create(title="Bundled Idea", author_id="user-sarah")
+
+
+class TestGetBundle:
+    """Tests for IdeaActions.get_bundle."""
+
+    def test_unknown_idea_returns_none(self, test_db):
+        from crabgrass.concepts.idea import IdeaActions
+
+        assert IdeaActions.get_bundle("no-such-idea") is None
+
+    def test_idea_without_elements(self, idea):
+        from crabgrass.concepts.idea import IdeaActions
+
+        bundle = IdeaActions.get_bundle(idea.id)
+
+        assert bundle.idea.id == idea.id
+        assert bundle.idea.title == "Bundled Idea"
+        assert (bundle.summary_id, bundle.challenge_id, bundle.approach_id) == (None, None, None)
+
+    def test_idea_with_some_elements(self, idea):
+        from crabgrass.concepts.idea import IdeaActions
+        from crabgrass.concepts.challenge import ChallengeActions
+
+        challenge = ChallengeActions.create(idea_id=idea.id, content="A challenge")
+
+        bundle = IdeaActions.get_bundle(idea.id)
+
+        assert (bundle.summary_id, bundle.challenge_id, bundle.approach_id) == (None, challenge.id, None)
+
+    def test_idea_with_all_elements(self, idea):
+        from crabgrass.concepts.idea import IdeaActions
+        from crabgrass.concepts.summary import SummaryActions
+        from crabgrass.concepts.challenge import ChallengeActions
+        from crabgrass.concepts.approach import ApproachActions
+
+        summary = SummaryActions.create(idea_id=idea.id, content="A summary")
+        challenge = ChallengeActions.create(idea_id=idea.id, content="A challenge")
+        approach = ApproachActions.create(idea_id=idea.id, content="An approach")
+
+        bundle = IdeaActions.get_bundle(idea.id)
+
+        assert (bundle.summary_id, bundle.challenge_id, bundle.approach_id) == (
+            summary.id,
+            challenge.id,
+            approach.id,
+        )
+
+
+class TestSaveIdeaUpdate:
+    """Tests for save_idea called with an existing idea_id."""
+
+    def test_updates_existing_and_creates_missing_elements(self, idea, test_user):
+        from crabgrass.agents.tools import save_idea
+        from crabgrass.concepts.idea import IdeaActions
+        from crabgrass.concepts.summary import SummaryActions
+        from crabgrass.concepts.challenge import ChallengeActions
+
+        summary = SummaryActions.create(idea_id=idea.id, content="Old summary")
+
+        result = save_idea(
+            title="Renamed Idea",
+            summary="New summary",
+            challenge="New challenge",
+            idea_id=idea.id,
+        )
+
+        assert result["success"]
+        assert not result["created_new"]
+        assert IdeaActions.get_by_id(idea.id).title == "Renamed Idea"
+        updated = SummaryActions.get_by_idea_id(idea.id)
+        assert (updated.id, updated.content) == (summary.id, "New summary")
+        assert ChallengeActions.get_by_idea_id(idea.id).content == "New challenge"
+
+    def test_unknown_idea_is_not_found(self, test_db, test_user):
+        from crabgrass.agents.tools import save_idea
+
+        result = save_idea(title="Anything", idea_id="no-such-idea")
+
+        assert not result["success"]
+        assert "not found" in result["message"]
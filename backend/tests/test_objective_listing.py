@@ -0,0 +1,101 @@
+"""Tests for ObjectiveActions listing.
+
+These tests verify that:
+1. Keyset paging visits every objective exactly once, including ties on updated_at
+2. An unknown cursor raises instead of returning an empty page
+3. list_all and list_all_summary filter top-level objectives the same way
+4. list_all_summary truncates only descriptions longer than desc_maxlen
+"""
+
+import pytest
+
+
+@pytest.fixture
+def objectives(test_db):
+    """Create five objectives that share one updated_at, plus one child."""
+    from crabgrass.concepts.objective import ObjectiveActions
+    from crabgrass.database import execute
+
+    created = [
+        ObjectiveActions.create(title=f"Objective {i}", description="", author_id="user-sarah")
+        for i in range(5)
+    ]
+    ObjectiveActions.create(
+        title="Child", description="", author_id="user-sarah", parent_id=created[0].id
+    )
+    execute("UPDATE objectives SET updated_at = TIMESTAMP '2026-01-01 00:00:00'")
+    return created
+
+
+def page_through(list_page, limit: int) -> list[str]:
+    """Collect IDs from every page of a paged listing."""
+    ids: list[str] = []
+    cursor_id = None
+    while True:
+        page = list_page(limit=limit, cursor_id=cursor_id)
+        ids.extend(row[0] if isinstance(row, tuple) else row.id for row in page)
+        if len(page) < limit:
+            return ids
+        cursor_id = ids[-1]
+
+
+class TestKeysetPaging:
+    """Tests for limit and cursor_id on list_all and list_all_summary."""
+
+    def test_pages_cover_every_objective_once(self, objectives):
+        from crabgrass.concepts.objective import ObjectiveActions
+
+        everything = [objective.id for objective in ObjectiveActions.list_all()]
+        assert page_through(ObjectiveActions.list_all, limit=2) == everything
+        assert len(everything) == 6
+
+    def test_ties_on_updated_at_are_ordered_by_id(self, objectives):
+        from crabgrass.concepts.objective import ObjectiveActions
+
+        ids = page_through(ObjectiveActions.list_all_summary, limit=4)
+        assert ids == sorted(ids, reverse=True)
+
+    def test_unknown_cursor_raises(self, objectives):
+        from crabgrass.concepts.objective import ObjectiveActions
+
+        with pytest.raises(ValueError):
+            ObjectiveActions.list_all(limit=2, cursor_id="no-such-objective")
+        with pytest.raises(ValueError):
+            ObjectiveActions.list_all_summary(limit=2, cursor_id="no-such-objective")
+
+
+class TestParentFilter:
+    """Tests for parent_id filtering."""
+
+    def test_empty_parent_lists_top_level_objectives(self, objectives):
+        from crabgrass.concepts.objective import ObjectiveActions
+
+        top_level = {objective.id for objective in objectives}
+        assert {o.id for o in ObjectiveActions.list_all(parent_id="")} == top_level
+        assert {row[0] for row in ObjectiveActions.list_all_summary(parent_id="")} == top_level
+
+    def test_parent_lists_children(self, objectives):
+        from crabgrass.concepts.objective import ObjectiveActions
+
+        children = ObjectiveActions.list_all_summary(parent_id=objectives[0].id)
+        assert [row[1] for row in children] == ["Child"]
+
+
+class TestDescriptionTruncation:
+    """Tests for desc_maxlen on list_all_summary."""
+
+    def listed_description(self, description: str) -> str:
+        from crabgrass.concepts.objective import ObjectiveActions
+
+        ObjectiveActions.create(title="Objective", description=description, author_id="user-sarah")
+        [(_, _, listed, _, _)] = ObjectiveActions.list_all_summary(desc_maxlen=5)
+        return listed
+
+    def test_description_below_maxlen_is_unchanged(self, test_db):
+        assert self.listed_description("abcd") == "abcd"
+
+    def test_description_at_maxlen_is_unchanged(self, test_db):
+        assert self.listed_description("abcde") == "abcde"
+
+    def test_description_above_maxlen_is_truncated(self, test_db):
+        assert self.listed_description("abcdef") == "abcde..."
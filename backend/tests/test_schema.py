@@ -0,0 +1,49 @@
+"""Tests for schema migrations.
+
+These tests verify that:
+1. The inner product migration unit-normalizes stored embeddings
+2. The migration is recorded and does not run again
+"""
+
+import pytest
+
+
+@pytest.fixture
+def raw_summary(test_db, mock_embedding_service):
+    """Store a summary with an embedding of length 2, as written before normalization."""
+    from crabgrass.concepts.idea import IdeaActions
+    from crabgrass.database import execute
+
+    idea = IdeaActions.create(title="Old idea", author_id="user-sarah")
+    execute(
+        "INSERT INTO summaries (id, idea_id, content, embedding) VALUES (?, ?, ?, ?::FLOAT[768])",
+        ["summary-raw", idea.id, "Raw", [2.0] + [0.0] * 767],
+    )
+    return "summary-raw"
+
+
+def first_component(summary_id: str) -> float:
+    from crabgrass.database import fetchone
+
+    return fetchone("SELECT embedding[1] FROM summaries WHERE id = ?", [summary_id])[0]
+
+
+class TestInnerProductMigration:
+    """Tests for migrate_to_inner_product."""
+
+    def test_normalizes_embeddings_once(self, raw_summary):
+        from crabgrass.database import execute
+        from crabgrass.database.schema import INNER_PRODUCT_MIGRATION, migrate_to_inner_product
+
+        execute("DELETE FROM schema_migrations WHERE name = ?", [INNER_PRODUCT_MIGRATION])
+        migrate_to_inner_product()
+
+        assert first_component(raw_summary) == pytest.approx(1.0)
+
+    def test_applied_migration_is_skipped(self, raw_summary):
+        from crabgrass.database.schema import migrate_to_inner_product
+
+        # init_schema already recorded the migration for this database
+        migrate_to_inner_product()
+
+        assert first_component(raw_summary) == pytest.approx(2.0)
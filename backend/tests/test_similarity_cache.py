@@ -0,0 +1,101 @@
+"""Tests for the similarity result cache.
+
+These tests verify that:
+1. Repeated queries are served from the cache
+2. Near-identical embeddings reuse cached results
+3. Query arguments and TTL expiry produce cache misses
+4. Content searches embed each distinct content once and reuse cached results
+"""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from crabgrass.services.similarity import get_similarity_service
+from crabgrass.services.similarity_cache import (
+    CachedSimilarityService,
+    SimilarityCache,
+    get_cached_similarity_service,
+)
+
+
+def make_service():
+    service = MagicMock()
+    service.find_similar_summaries.return_value = ["match"]
+    return service
+
+
+class TestCachedSimilarityService:
+    """Tests for CachedSimilarityService."""
+
+    def test_repeated_query_hits_cache(self):
+        """Identical queries should only reach the backend once."""
+        service = make_service()
+        cached = CachedSimilarityService(service)
+
+        first = cached.find_similar_summaries([0.1] * 768, limit=5, exclude_idea_id="idea-1")
+        second = cached.find_similar_summaries([0.1] * 768, limit=5, exclude_idea_id="idea-1")
+
+        assert first == second == ["match"]
+        service.find_similar_summaries.assert_called_once()
+
+    def test_near_identical_embedding_hits_cache(self):
+        """Embeddings above the approximate threshold reuse results."""
+        service = make_service()
+        cached = CachedSimilarityService(service)
+
+        cached.find_similar_summaries([0.1] * 768)
+        cached.find_similar_summaries([0.1] * 767 + [0.1001])
+
+        service.find_similar_summaries.assert_called_once()
+
+    def test_different_arguments_miss_cache(self):
+        """Changing limit or exclusion should run a new query."""
+        service = make_service()
+        cached = CachedSimilarityService(service)
+
+        cached.find_similar_summaries([0.1] * 768, exclude_idea_id="idea-1")
+        cached.find_similar_summaries([0.1] * 768, exclude_idea_id="idea-2")
+        cached.find_similar_summaries([0.1] * 768, limit=10, exclude_idea_id="idea-1")
+
+        assert service.find_similar_summaries.call_count == 3
+
+    def test_expired_entries_miss_cache(self):
+        """Entries older than the TTL should not be served."""
+        service = make_service()
+        cached = CachedSimilarityService(service, SimilarityCache(ttl_seconds=0))
+
+        cached.find_similar_summaries([0.1] * 768)
+        cached.find_similar_summaries([0.1] * 768)
+
+        assert service.find_similar_summaries.call_count == 2
+
+    def test_uncached_methods_are_delegated(self):
+        """Methods without a cache wrapper should pass through."""
+        service = make_service()
+        service.find_similar_for_idea.return_value = ["delegated"]
+        cached = CachedSimilarityService(service)
+
+        assert cached.find_similar_for_idea("idea-1") == ["delegated"]
+
+    def test_content_search_dedupes_and_uses_cache(self):
+        """Duplicate and blank contents are not embedded; repeats hit the cache."""
+        service = make_service()
+        service.embedding_service.embed_batch.return_value = list(np.eye(2, 768, dtype=np.float32))
+        service.find_similar_batch.return_value = [["match-a"], ["match-b"]]
+        cached = CachedSimilarityService(service)
+
+        contents = ["a", " a ", "", "b"]
+        first = cached.find_similar_for_contents(contents, limit=5)
+        second = cached.find_similar_for_contents(contents, limit=5)
+
+        assert first == second == [["match-a"], ["match-a"], [], ["match-b"]]
+        service.embedding_service.embed_batch.assert_called_with(["a", "b"])
+        service.find_similar_batch.assert_called_once()
+
+    def test_shared_service_wraps_similarity_singleton(self):
+        """Tools share one cache in front of the SimilarityService singleton."""
+        cached = get_cached_similarity_service()
+
+        assert cached is get_cached_similarity_service()
+        assert cached._service is get_similarity_service()
@@ -0,0 +1,69 @@
+"""Tests for nearest-candidate searches in SimilarityService.
+
+These tests verify that:
+1. Kernel element searches are answered from the HNSW index
+2. Duplicate kernel element rows for one idea are returned once
+
+The index test needs the DuckDB vss extension and is skipped without it.
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def vss_db(test_db):
+    """In-memory database with the vss extension loaded and indexes built."""
+    from crabgrass.database import create_indexes, fetchone
+
+    row = fetchone("SELECT loaded FROM duckdb_extensions() WHERE extension_name = 'vss'")
+    if not row or not row[0]:
+        pytest.skip("DuckDB vss extension is not available")
+
+    create_indexes()
+
+
+class TestHNSWIndexUse:
+    """EXPLAIN the query SimilarityService sends for a summary search."""
+
+    def test_summary_search_uses_hnsw_index(self, vss_db):
+        from crabgrass.database import get_connection
+        from crabgrass.services import similarity
+        from crabgrass.services.similarity import SimilarityService
+
+        embedding = np.full(768, 1 / np.sqrt(768), dtype=np.float32)
+        with patch.object(similarity, "fetchall", return_value=[]) as mock_fetchall:
+            SimilarityService().find_similar_summaries(embedding, limit=5)
+
+        query, params = mock_fetchall.call_args[0]
+        plan = get_connection().execute(f"EXPLAIN {query}", params).fetchall()
+
+        assert "HNSW_INDEX_SCAN" in "".join(row[1] for row in plan)
+
+
+class TestDuplicateKernelElements:
+    """Challenges and approaches are only kept unique per idea by the app."""
+
+    def test_duplicate_challenges_count_once(self, test_db, mock_embedding_service):
+        from crabgrass.concepts.idea import IdeaActions
+        from crabgrass.database import execute
+        from crabgrass.services.similarity import SimilarityService
+
+        query = np.eye(1, 768, dtype=np.float32)[0]
+        near = np.zeros(768, dtype=np.float32)
+        near[:2] = 1 / np.sqrt(2)
+
+        duplicated = IdeaActions.create(title="Duplicated", author_id="user-sarah")
+        other = IdeaActions.create(title="Other", author_id="user-sarah")
+        rows = [(duplicated.id, query)] * 3 + [(other.id, near)]
+        for i, (idea_id, embedding) in enumerate(rows):
+            execute(
+                "INSERT INTO challenges (id, idea_id, content, embedding) VALUES (?, ?, ?, ?::FLOAT[768])",
+                [f"challenge-{i}", idea_id, "A challenge", embedding.tolist()],
+            )
+
+        matches = SimilarityService().find_similar_challenges(query, limit=2)
+
+        assert [m.idea_id for m in matches] == [duplicated.id, other.id]